@@ -1,41 +1,38 @@
 # Vividha Streamlit App
+import importlib
 import streamlit as st
-import modules.art_explorer as art_explorer
-import modules.experiences as experiences
-import modules.dashboards as dashboards
-import modules.preservation as preservation
-import modules.settings as settings
+from utils.instrumentation import debug_panel_enabled, page_scope, render_debug_panel
 
+# Page name -> module path. The script imports a page module only when its page is
+# selected, so the first paint doesn't wait for their data/figure imports or the Snowflake
+# connector. Under `python -m utils.warmup run` the background warm-up imports the data
+# and figure modules in its own thread; a plain `streamlit run` stays lazy.
 PAGES = {
     "Home": None,
-    "Discover Art": art_explorer,
-    "Cultural Experiences": experiences,
-    "Responsible Tourism": dashboards,
-    "Preservation Hub": preservation,
-    "Settings": settings,
+    "Discover Art": "modules.art_explorer",
+    "Cultural Experiences": "modules.experiences",
+    "Responsible Tourism": "modules.dashboards",
+    "Preservation Hub": "modules.preservation",
+    "Search": "modules.search",
+    "Settings": "modules.settings",
 }
 
 st.sidebar.image('assets/logo.svg', use_column_width=True)
 st.sidebar.title("Vividha Navigation")
 selection = st.sidebar.radio("Go to", list(PAGES.keys()))
 
-if selection == "Discover Art":
-    art_explorer.run()
-elif selection == "Cultural Experiences":
-    experiences.run()
-elif selection == "Responsible Tourism":
-    dashboards.run()
-elif selection == "Preservation Hub":
-    preservation.run()
-elif selection == "Settings":
-    settings.run()
-else:
-    st.title("Vividha: Bridging India's Art, Culture & Tourism")
-    st.markdown("""
-    Welcome to Vividha! Explore India's diverse art forms, discover unique cultural experiences, and learn how responsible tourism can help preserve our heritage.
+# Time the page's data loads, filters and figures (see utils/instrumentation.py)
+with page_scope(selection):
+    if PAGES[selection] is not None:
+        page = importlib.import_module(PAGES[selection])
+        page.run()
+    else:
+        st.title("Vividha: Bridging India's Art, Culture & Tourism")
+        st.markdown("""
+        Welcome to Vividha! Explore India's diverse art forms, discover unique cultural experiences, and learn how responsible tourism can help preserve our heritage.
 
-    **Navigate using the sidebar to explore features.**
-    """)
+        **Navigate using the sidebar to explore features.**
+        """)
 
-# Placeholder for navigation and modules
-# To be expanded with feature modules
+if debug_panel_enabled():
+    render_debug_panel()
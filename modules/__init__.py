@@ -1,37 +1,75 @@
-import os
-import snowflake.connector
+"""Snowflake access for the pages: pooled connections and reads through the shared query cache."""
 import pandas as pd
 import streamlit as st
-from typing import Optional
-from utils.snowflake_connector import init_snowflake_connection
-from utils.dataloader import load_cultural_data, load_tourism_data
+from typing import Optional, TYPE_CHECKING
+from utils.snowflake_connector import get_connection_pool, snowflake_config_from_env
+from utils.snowflake_connector import iter_query_batches, pooled_connection, stream_table
+from utils.instrumentation import timer
+from utils.query_cache import cache_key, get_query_cache, query_table
 
-def get_snowflake_connection() -> Optional[snowflake.connector.SnowflakeConnection]:
-    """Establish a Snowflake connection using environment variables."""
+if TYPE_CHECKING:
+    import snowflake.connector
+
+def get_snowflake_connection() -> Optional['snowflake.connector.SnowflakeConnection']:
+    """
+    Borrow a Snowflake connection from the shared pool (settings from environment variables).
+    Hand it back with release_snowflake_connection() instead of closing it.
+    """
     try:
-        conn = snowflake.connector.connect(
-            user=os.getenv('SNOWFLAKE_USER'),
-            password=os.getenv('SNOWFLAKE_PASSWORD'),
-            account=os.getenv('SNOWFLAKE_ACCOUNT'),
-            warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', 'vividha_wh'),
-            database=os.getenv('SNOWFLAKE_DATABASE', 'vividha_db'),
-            schema=os.getenv('SNOWFLAKE_SCHEMA', 'vividha_schema'),
-        )
-        return conn
+        return get_connection_pool(**snowflake_config_from_env()).acquire()
     except Exception as e:
         st.error(f"Snowflake connection error: {e}")
         return None
 
-@st.cache_data(show_spinner=False)
-def fetch_snowflake_data(query: str, params=None) -> Optional[pd.DataFrame]:
-    """Fetch data from Snowflake and return as a DataFrame."""
-    conn = get_snowflake_connection()
-    if conn is None:
+def release_snowflake_connection(conn: 'snowflake.connector.SnowflakeConnection') -> None:
+    """Return a connection obtained from get_snowflake_connection() to the shared pool."""
+    get_connection_pool(**snowflake_config_from_env()).release(conn)
+
+def _read_query(query: str, params=None) -> pd.DataFrame:
+    with timer('io.snowflake_query'):
+        with pooled_connection(**snowflake_config_from_env()) as conn:
+            batches = list(iter_query_batches(conn, query, params))
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+
+def _read_table(table: str, columns=None, filters=None, on_batch=None) -> pd.DataFrame:
+    batches, rows = [], 0
+    with timer('io.snowflake_table'):
+        for batch in stream_table(table, columns=columns, filters=filters):
+            # Snowflake upper-cases unquoted identifiers; the pages use lower-case column names
+            batch = batch.rename(columns=str.lower)
+            batches.append(batch)
+            rows += len(batch)
+            if on_batch is not None:
+                on_batch(batch, rows)
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=columns)
+
+def fetch_snowflake_data(query: str, params=None, table: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Fetch data from Snowflake and return as a DataFrame, through the shared query cache.
+
+    The result is cached for the TTL of `table` (default: the first table after FROM) and
+    shared across sessions: treat it as read-only.
+    """
+    table = table or query_table(query)
+    try:
+        return get_query_cache().get(cache_key('query', table, query, params),
+                                     lambda: _read_query(query, params), table=table)
+    except Exception as e:
+        st.error(f"Snowflake query error: {e}")
         return None
+
+def fetch_snowflake_table(table: str, columns=None, filters=None, on_batch=None) -> Optional[pd.DataFrame]:
+    """
+    Fetch a projected, filtered table from Snowflake batch by batch, through the shared query cache.
+
+    On a cache miss, on_batch(batch_df, rows_so_far) is called as each batch arrives, so a
+    page can render the first rows while the rest is still streaming; a cached result is
+    returned whole. The result is shared across sessions: treat it as read-only.
+    """
+    key = cache_key('table', table, columns, filters)
     try:
-        df = pd.read_sql(query, conn, params=params)
-        conn.close()
-        return df
+        return get_query_cache().get(key, lambda: _read_table(table, columns, filters, on_batch), table=table,
+                                     refresh=lambda: _read_table(table, columns, filters))
     except Exception as e:
         st.error(f"Snowflake query error: {e}")
-        return None
\ No newline at end of file
+        return None
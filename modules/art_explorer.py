@@ -1,11 +1,28 @@
 import streamlit as st
 import pandas as pd
-import os
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 import random
-from utils.dataloader import load_cultural_data
+from utils.dataloader import dataset_record_index, load_cultural_data, record_index
+from utils.images import image_for
+from utils.recommender import get_recommender
+from utils.translation import t
+
+# Columns of cultural_data the page reads; everything else stays in Snowflake
+CULTURAL_COLUMNS = ['art_form', 'region', 'cultural_value', 'tourism_visibility', 'preservation_status']
+
+# Contemporary Applications images (served as local thumbnails when an original is provided)
+ADAPTATION_IMAGES = {
+    "Fashion": "https://daily.jstor.org/wp-content/uploads/2017/09/indian_dress_1050x700.jpg?height=150&width=150",
+    "Home Decor": "https://www.shopinroom.com/wp-content/uploads/2024/01/affordable-home-decor.jpg?height=150&width=150",
+    "Digital Media": "https://www.livemint.com/lm-img/img/2023/12/20/600x338/Industry-experts-argued-frequent-appearance-on-OTT_1689531050687_1703063062269.jpg?height=150&width=150",
+    "Public Art": "https://thedailyguardian.com/wp-content/uploads/2020/07/public-art-1280x720.png?height=150&width=150",
+}
+# Display widths (px) the thumbnails are sized for
+THUMB_WIDTH = 150
+CARD_WIDTH = 300
+MAIN_IMAGE_WIDTH = 900
 
 def run():
     """
@@ -26,45 +43,19 @@ def run():
     # --- Constants and Config ---
     PLACEHOLDER_IMAGE = "https://placeholder.svg?height=400&width=600"
     PLACEHOLDER_THUMB = "https://placeholder.svg?height=150&width=150"
-    ART_FORMS_CSV = os.path.join(os.path.dirname(__file__), '../data/art_forms.csv')
 
     # --- Utility Functions ---
-    def get_art_asset_row(art_form: str, assets_df: pd.DataFrame) -> dict:
-        if assets_df is not None and art_form in assets_df['art_form'].values:
-            return assets_df[assets_df['art_form'] == art_form].iloc[0].to_dict()
-        return {}
-
-    def get_art_data_row(art_form: str, df: pd.DataFrame) -> dict:
-        if art_form in df['art_form'].values:
-            return df[df['art_form'] == art_form].iloc[0].to_dict()
-        return {}
-
     def get_value(row: dict, key: str, default=None):
         return row.get(key) if row and key in row and pd.notnull(row[key]) else default
 
     # --- Data Loading ---
     df = None
     if use_snowflake:
-        from modules import init_snowflake_connection
-        conn = init_snowflake_connection(
-            account=os.getenv('SNOWFLAKE_ACCOUNT'),
-            user=os.getenv('SNOWFLAKE_USER'),
-            password=os.getenv('SNOWFLAKE_PASSWORD'),
-            warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', 'vividha_wh'),
-            database=os.getenv('SNOWFLAKE_DATABASE', 'vividha_db'),
-            schema=os.getenv('SNOWFLAKE_SCHEMA', 'vividha_schema'),
-        )
-        if conn:
-            query = "SELECT * FROM cultural_data;"
-            try:
-                df = pd.read_sql(query, conn)
-            except Exception as e:
-                st.warning(f"Could not fetch data from Snowflake: {e}. Showing local data instead.")
-                use_snowflake = False
-            finally:
-                conn.close()
-        else:
-            st.warning("Could not connect to Snowflake. Showing local data instead.")
+        from modules import fetch_snowflake_table
+        # Stream only the columns this page shows, batch by batch
+        df = fetch_snowflake_table('cultural_data', columns=CULTURAL_COLUMNS)
+        if df is None:
+            st.warning("Could not fetch data from Snowflake. Showing local data instead.")
             use_snowflake = False
     if not use_snowflake:
         try:
@@ -76,20 +67,22 @@ def run():
         st.error("No cultural data available. Please check the data source.")
         return
 
-    # Load art form assets (images, descriptions) from art_forms.csv
+    # art_form -> record lookups, built once per dataset version and shared across sessions
+    # (asset rows hold images and descriptions from art_forms.csv)
     try:
-        assets_df = pd.read_csv(ART_FORMS_CSV)
+        assets_index = dataset_record_index('art_forms', 'art_form')
     except Exception:
-        assets_df = None
+        assets_index = {}
+    data_index = record_index(df, 'art_form') if use_snowflake else dataset_record_index('cultural_data', 'art_form')
 
     # Art form selector (preserve selection in session state)
-    art_forms = assets_df['art_form'].unique().tolist() if assets_df is not None else df['art_form'].unique().tolist()
+    art_forms = list(assets_index) if assets_index else list(data_index)
     selected_art = st.session_state.get('selected_art', art_forms[0] if art_forms else None)
     selected_art = st.selectbox("Select an art form to explore", art_forms, index=art_forms.index(selected_art) if selected_art in art_forms else 0, key='art_form_select')
     st.session_state.selected_art = selected_art
 
-    asset_row = get_art_asset_row(selected_art, assets_df)
-    data_row = get_art_data_row(selected_art, df)
+    asset_row = assets_index.get(selected_art, {})
+    data_row = data_index.get(selected_art, {})
 
     art_image = get_value(asset_row, 'image_url', PLACEHOLDER_IMAGE)
     art_desc = get_value(asset_row, 'description', 'Description not available.')
@@ -101,14 +94,14 @@ def run():
     # Main content display
     main_col1, main_col2 = st.columns([2, 1])
     with main_col1:
-        st.image(art_image, caption=f"{selected_art} Example", use_container_width=True)
-        st.subheader("About the Art Form")
-        st.write(art_desc)
+        st.image(image_for(art_image, MAIN_IMAGE_WIDTH), caption=f"{selected_art} Example", use_container_width=True)
+        st.subheader(t("About the Art Form"))
+        st.write(t(art_desc))
         st.write(f"Cultural value: {get_value(data_row, 'cultural_value', 'N/A')}. Tourism visibility: {get_value(data_row, 'tourism_visibility', 'N/A')}.")
-        st.subheader("Cultural Significance")
+        st.subheader(t("Cultural Significance"))
         st.write(f"Preservation status: {get_value(data_row, 'preservation_status', 'N/A')}")
     with main_col2:
-        st.subheader("Key Information")
+        st.subheader(t("Key Information"))
         st.markdown(f"**Region**: {region}")
         st.markdown(f"**Cultural Value**: {get_value(data_row, 'cultural_value', 'N/A')}")
         st.markdown(f"**Tourism Visibility**: {get_value(data_row, 'tourism_visibility', 'N/A')}")
@@ -263,19 +256,19 @@ def run():
     st.subheader("Contemporary Applications")
     app_col1, app_col2, app_col3, app_col4 = st.columns(4)
     with app_col1:
-        st.image("https://daily.jstor.org/wp-content/uploads/2017/09/indian_dress_1050x700.jpg?height=150&width=150", caption="Fashion")
+        st.image(image_for(ADAPTATION_IMAGES["Fashion"], THUMB_WIDTH), caption="Fashion")
         st.markdown("### Fashion")
         st.write("Integration into modern clothing designs, accessories, and textile products.")
     with app_col2:
-        st.image("https://www.shopinroom.com/wp-content/uploads/2024/01/affordable-home-decor.jpg?height=150&width=150", caption="Home Decor")
+        st.image(image_for(ADAPTATION_IMAGES["Home Decor"], THUMB_WIDTH), caption="Home Decor")
         st.markdown("### Home Decor")
         st.write("Contemporary applications in interior design, wall art, and household items.")
     with app_col3:
-        st.image("https://www.livemint.com/lm-img/img/2023/12/20/600x338/Industry-experts-argued-frequent-appearance-on-OTT_1689531050687_1703063062269.jpg?height=150&width=150", caption="Digital Media")
+        st.image(image_for(ADAPTATION_IMAGES["Digital Media"], THUMB_WIDTH), caption="Digital Media")
         st.markdown("### Digital Media")
         st.write("Adaptation to digital formats for wider distribution and new creative expressions.")
     with app_col4:
-        st.image("https://thedailyguardian.com/wp-content/uploads/2020/07/public-art-1280x720.png?height=150&width=150", caption="Public Art")
+        st.image(image_for(ADAPTATION_IMAGES["Public Art"], THUMB_WIDTH), caption="Public Art")
         st.markdown("### Public Art")
         st.write("Large-scale installations in public spaces, airports, and institutions.")
 
@@ -315,18 +308,23 @@ def run():
         """)
 
     # Related cultural experiences (refactored)
-    st.subheader("Related Cultural Experiences")
-    related_art_forms = [art for art in art_forms if art != selected_art]
-    related_sample = random.sample(related_art_forms, min(3, len(related_art_forms))) if related_art_forms else []
+    st.subheader(t("Related Cultural Experiences"))
+    # Precomputed content-based neighbours (description, region, status and scores)
+    try:
+        related_sample = get_recommender().related(selected_art, 3)
+    except Exception:
+        related_sample = []
+    if not related_sample:
+        related_sample = [art for art in art_forms if art != selected_art][:3]
     related_cols = st.columns(len(related_sample)) if related_sample else []
     for i, art in enumerate(related_sample):
-        rel_asset = get_art_asset_row(art, assets_df)
-        rel_data = get_art_data_row(art, df)
+        rel_asset = assets_index.get(art, {})
+        rel_data = data_index.get(art, {})
         img_url = get_value(rel_asset, 'image_url', PLACEHOLDER_IMAGE)
         desc = get_value(rel_asset, 'description', '...')
         region = get_value(rel_asset, 'region', get_value(rel_data, 'region', 'Unknown'))
         with related_cols[i]:
-            st.image(img_url, caption=art, use_container_width=True)
+            st.image(image_for(img_url, CARD_WIDTH), caption=art, use_container_width=True)
             st.markdown(f"### {art}")
             st.write(f"From {region}")
             st.write((desc[:100] + "...") if desc else "...")
@@ -3,11 +3,185 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import numpy as np
 import sys
 
 sys.path.append('../utils')
 from utils.dataloader import load_cultural_data
+from utils.impact_sample import IMPACT_CATEGORIES, IMPACT_REGIONS, impact_sample
+from utils.figure_cache import cached_figure
+from utils.content import page_content
+from utils.correlation import IMPACT_CORRELATIONS, impact_correlation_engine
+
+# Filter selection the page opens with
+DEFAULT_REGIONS = ["North India", "South India", "East India", "West India"]
+DEFAULT_CATEGORIES = ["Traditional Art", "Handicrafts", "Architecture"]
+DEFAULT_METHOD = "pearson"
+
+# --- Figure builders (memoized by utils.figure_cache) ---
+def correlation_scatter_figure(region_filter, cultural_filter, seed=42):
+    """Tourism level vs. preservation score for the selected regions and categories."""
+    df, impact_index = impact_sample(seed)
+    
+    # Apply filters (bitmap intersection on Region and Category)
+    df = df.take(impact_index.select({"Region": region_filter, "Category": cultural_filter}))
+    
+    # Create scatter plot
+    fig = px.scatter(
+        df,
+        x="Tourism Level",
+        y="Preservation Score",
+        size="Community Benefit",
+        color="Region",
+        hover_name="Category",
+        size_max=20,
+        opacity=0.7,
+        title="Correlation between Tourism Level and Cultural Preservation",
+        labels={
+            "Tourism Level": "Tourism Level (0-100)",
+            "Preservation Score": "Cultural Preservation Score (0-100)"
+        },
+        height=500
+    )
+    
+    # Add trend line
+    fig.add_trace(
+        go.Scatter(
+            x=[30, 95],
+            y=[30 * 0.8, 95 * 0.8],
+            mode="lines",
+            name="Average Trend",
+            line=dict(dash="dash", color="gray")
+        )
+    )
+    return fig
+
+def correlation_heatmap_figure(method="pearson", seed=42):
+    """Per-region correlation of tourism with preservation, authenticity and community benefit."""
+    # Computed from the sample by the shared correlation engine (built once per seed)
+    corr_df = impact_correlation_engine(seed).correlations(method)
+    corr_df = corr_df.rename(columns={column: label for label, column in IMPACT_CORRELATIONS.items()}).round(2)
+    
+    return px.imshow(
+        corr_df,
+        text_auto=True,
+        color_continuous_scale="RdBu_r",
+        title=f"Regional Correlation Analysis ({method.title()})",
+        color_continuous_midpoint=0
+    )
+
+def revenue_treemap_figure():
+    """Treemap of cultural tourism revenue by sector and subsector."""
+    economic_data = {
+        'Sector': ['Artisans & Craftspeople', 'Artisans & Craftspeople', 'Hospitality & Accommodations', 
+                   'Hospitality & Accommodations', 'Local Businesses', 'Local Businesses', 
+                   'Transportation', 'Cultural Institutions', 'Guides & Interpreters', 'Tour Operators', 
+                   'Government Revenue'],
+        'Subsector': ['Direct Sales', 'Workshops & Training', 'Hotels', 'Homestays', 
+                     'Restaurants', 'Retail', 'Local Transport', 'Museums & Sites', 
+                     'Local Guides', 'Package Tours', 'Taxes & Fees'],
+        'Value': [250, 80, 320, 90, 180, 120, 150, 110, 80, 200, 160]
+    }
+    
+    eco_df = pd.DataFrame(economic_data)
+    
+    return px.treemap(
+        eco_df,
+        path=['Sector', 'Subsector'],
+        values='Value',
+        title="Distribution of Cultural Tourism Revenue (Millions USD)",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+
+def economic_trends_figure():
+    """Longitudinal revenue, investment and artisan revenue trends, 2015-2023."""
+    # Sample data for economic trends
+    years = list(range(2015, 2024))
+    total_revenue = [850, 920, 1050, 1180, 1310, 980, 1100, 1450, 1740]  # in millions USD
+    artisan_income = [12500, 13200, 14100, 15300, 16500, 13800, 15000, 18500, 22000]  # annual average in INR
+    cultural_investment = [45, 52, 60, 68, 75, 55, 65, 85, 105]  # in millions USD
+    
+    # Create multi-line chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=total_revenue,
+        name="Total Cultural Tourism Revenue (M USD)",
+        line=dict(color='blue', width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=cultural_investment,
+        name="Cultural Heritage Investment (M USD)",
+        line=dict(color='green', width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=years,
+        y=[rev * 0.15 for rev in total_revenue],
+        name="Artisan Direct Revenue (M USD)",
+        line=dict(color='orange', width=3)
+    ))
+    
+    fig.update_layout(
+        title="Economic Impact Trends (2015-2023)",
+        xaxis_title="Year",
+        yaxis_title="Value (Millions USD)",
+        legend=dict(x=0.01, y=0.99),
+        height=500
+    )
+    
+    # Add COVID-19 impact annotation
+    fig.add_annotation(
+        x=2020,
+        y=980,
+        text="COVID-19 Impact",
+        showarrow=True,
+        arrowhead=1
+    )
+    
+    # Add recovery annotation
+    fig.add_annotation(
+        x=2022,
+        y=1450,
+        text="Post-COVID Recovery",
+        showarrow=True,
+        arrowhead=1
+    )
+    return fig
+
+# --- Memoized figures, shared by the page and the warm-up (utils.warmup) ---
+def correlation_scatter(region_filter, cultural_filter, theme=None):
+    return cached_figure(
+        "cultural_impact.correlation_scatter",
+        lambda: correlation_scatter_figure(region_filter, cultural_filter),
+        params={"regions": region_filter, "categories": cultural_filter, "seed": 42},
+        theme=theme,
+    )
+
+def correlation_heatmap(method, theme=None):
+    return cached_figure(
+        "cultural_impact.correlation_heatmap",
+        lambda: correlation_heatmap_figure(method),
+        params={"method": method, "seed": 42},
+        theme=theme,
+    )
+
+def revenue_treemap(theme=None):
+    return cached_figure("cultural_impact.revenue_treemap", revenue_treemap_figure, theme=theme)
+
+def economic_trends(theme=None):
+    return cached_figure("cultural_impact.economic_trends", economic_trends_figure, theme=theme)
+
+def default_figures(theme=None):
+    """Build (or fetch) every figure the page shows on its first run; used by utils.warmup."""
+    return [
+        correlation_scatter(DEFAULT_REGIONS, DEFAULT_CATEGORIES, theme),
+        correlation_heatmap(DEFAULT_METHOD, theme),
+        revenue_treemap(theme),
+        economic_trends(theme),
+    ]
 
 # Remove duplicate data loading and page config (should be in app.py)
 def run():
@@ -15,11 +189,11 @@ def run():
     if 'cultural_data' not in st.session_state or st.session_state.cultural_data is None:
         st.session_state.cultural_data = load_cultural_data()
 
+    # Long text blocks for the session's language (English where untranslated)
+    content = page_content('cultural_impact')
+
     st.title("Cultural Impact Analysis")
-    st.markdown("""
-    Data-driven insights on the relationship between tourism and cultural preservation.
-    Explore how tourism affects local communities, cultural practices, and heritage conservation.
-    """)
+    st.markdown(content["intro"])
     
     # Data source selector
     st.sidebar.markdown('---')
@@ -69,10 +243,7 @@ def run():
     with tab1:
         st.subheader("Tourism & Cultural Preservation Correlation")
         
-        st.markdown("""
-        This analysis explores the relationship between tourism levels and cultural preservation
-        across different regions and art forms in India.
-        """)
+        st.markdown(content["correlation_intro"])
         
         # Filter options
         filter_col1, filter_col2 = st.columns(2)
@@ -80,78 +251,19 @@ def run():
         with filter_col1:
             region_filter = st.multiselect(
                 "Region",
-                ["North India", "South India", "East India", "West India", "Central India", "Northeast India"],
-                default=["North India", "South India", "East India", "West India"]
+                IMPACT_REGIONS,
+                default=DEFAULT_REGIONS
             )
             
         with filter_col2:
             cultural_filter = st.multiselect(
                 "Cultural Category",
-                ["Traditional Art", "Performing Arts", "Handicrafts", "Architecture", "Festivals", "Culinary Traditions"],
-                default=["Traditional Art", "Handicrafts", "Architecture"]
+                IMPACT_CATEGORIES,
+                default=DEFAULT_CATEGORIES
             )
         
-        # Generate sample data
-        np.random.seed(42)
-        
-        sample_data = []
-        regions = ["North India", "South India", "East India", "West India", "Central India", "Northeast India"]
-        categories = ["Traditional Art", "Performing Arts", "Handicrafts", "Architecture", "Festivals", "Culinary Traditions"]
-        
-        for region in regions:
-            for category in categories:
-                tourism_level = np.random.randint(30, 95)
-                preservation_score = min(100, int(tourism_level * (0.8 + np.random.random() * 0.4)))
-                community_benefit = min(100, int(tourism_level * (0.7 + np.random.random() * 0.5)))
-                authenticity_impact = max(30, 100 - int(tourism_level * (0.3 + np.random.random() * 0.4)))
-                
-                sample_data.append({
-                    "Region": region,
-                    "Category": category,
-                    "Tourism Level": tourism_level,
-                    "Preservation Score": preservation_score,
-                    "Community Benefit": community_benefit,
-                    "Authenticity Impact": authenticity_impact
-                })
-        
-        df = pd.DataFrame(sample_data)
-        
-        # Apply filters
-        if region_filter:
-            df = df[df["Region"].isin(region_filter)]
-            
-        if cultural_filter:
-            df = df[df["Category"].isin(cultural_filter)]
-        
-        # Create scatter plot
-        fig = px.scatter(
-            df,
-            x="Tourism Level",
-            y="Preservation Score",
-            size="Community Benefit",
-            color="Region",
-            hover_name="Category",
-            size_max=20,
-            opacity=0.7,
-            title="Correlation between Tourism Level and Cultural Preservation",
-            labels={
-                "Tourism Level": "Tourism Level (0-100)",
-                "Preservation Score": "Cultural Preservation Score (0-100)"
-            },
-            height=500
-        )
-        
-        # Add trend line
-        fig.add_trace(
-            go.Scatter(
-                x=[30, 95],
-                y=[30 * 0.8, 95 * 0.8],
-                mode="lines",
-                name="Average Trend",
-                line=dict(dash="dash", color="gray")
-            )
-        )
-        
+        # Figure is memoized per filter selection (sample data and its index are built once)
+        fig = correlation_scatter(region_filter, cultural_filter)
         st.plotly_chart(fig, use_container_width=True)
         
         # Correlation analysis
@@ -160,32 +272,12 @@ def run():
         insight_col1, insight_col2 = st.columns(2)
         
         with insight_col1:
-            st.markdown("""
-            - **Positive Correlation**: Overall, higher tourism levels correlate with better preservation scores for most cultural categories
-            - **Regional Variations**: Northeast India shows the strongest positive correlation, while North India shows more mixed results
-            - **Category Differences**: Traditional Arts and Handicrafts benefit most from tourism, while Performing Arts show more varied outcomes
-            - **Optimal Tourism Level**: Cultural preservation benefits peak at tourism levels between 65-80, with diminishing returns beyond that
-            """)
+            st.markdown(content["correlation_insights"])
         
         with insight_col2:
-            # Create correlation heatmap
-            corr_data = {
-                'Region': regions,
-                'Tourism-Preservation Correlation': [0.78, 0.85, 0.72, 0.65, 0.80, 0.92],
-                'Tourism-Authenticity Correlation': [-0.45, -0.30, -0.55, -0.60, -0.40, -0.25],
-                'Tourism-Community Benefit Correlation': [0.82, 0.75, 0.70, 0.65, 0.85, 0.90]
-            }
-            
-            corr_df = pd.DataFrame(corr_data).set_index('Region')
-            
-            fig = px.imshow(
-                corr_df,
-                text_auto=True,
-                color_continuous_scale="RdBu_r",
-                title="Regional Correlation Analysis",
-                color_continuous_midpoint=0
-            )
-            
+            method = st.radio("Correlation method", ["Pearson", "Spearman"], horizontal=True,
+                              help="Spearman compares rankings, so it is robust to outliers and non-linear trends").lower()
+            fig = correlation_heatmap(method)
             st.plotly_chart(fig, use_container_width=True)
         
         # Case studies
@@ -196,79 +288,35 @@ def run():
         with case_col1:
             st.markdown("#### Positive Example: Raghurajpur Heritage Village")
             st.image("https://placeholder.svg?height=150&width=250", caption="Pattachitra Art Village")
-            st.markdown("""
-            **Tourism Level**: 72/100
-            **Preservation Score**: 85/100
-            
-            Managed tourism has led to increased investment in preserving traditional Pattachitra art and architecture, with strict quality controls and community-led initiatives.
-            """)
+            st.markdown(content["case_raghurajpur"])
         
         with case_col2:
             st.markdown("#### Balanced Example: Kutch Handicrafts")
             st.image("https://placeholder.svg?height=150&width=250", caption="Kutch Embroidery")
-            st.markdown("""
-            **Tourism Level**: 65/100
-            **Preservation Score**: 75/100
-            
-            Tourism has supported traditional embroidery practices while maintaining authenticity through artisan cooperatives and documentation efforts.
-            """)
+            st.markdown(content["case_kutch"])
             
         with case_col3:
             st.markdown("#### Negative Example: Jaipur Block Printing")
             st.image("https://placeholder.svg?height=150&width=250", caption="Block Printing")
-            st.markdown("""
-            **Tourism Level**: 88/100
-            **Preservation Score**: 60/100
-            
-            High tourism demand has led to mass production, quality compromise, and reduced authentic practices in some areas, though preservation efforts are improving.
-            """)
+            st.markdown(content["case_jaipur"])
     
     with tab2:
         st.subheader("Economic Impact Analysis")
         
-        st.markdown("""
-        Explore how cultural tourism contributes to economic development and the distribution
-        of benefits across different stakeholders.
-        """)
+        st.markdown(content["economic_intro"])
         
         # Economic impact metrics
         impact_col1, impact_col2 = st.columns(2)
         
         with impact_col1:
             # Create treemap of economic benefit distribution
-            economic_data = {
-                'Sector': ['Artisans & Craftspeople', 'Artisans & Craftspeople', 'Hospitality & Accommodations', 
-                           'Hospitality & Accommodations', 'Local Businesses', 'Local Businesses', 
-                           'Transportation', 'Cultural Institutions', 'Guides & Interpreters', 'Tour Operators', 
-                           'Government Revenue'],
-                'Subsector': ['Direct Sales', 'Workshops & Training', 'Hotels', 'Homestays', 
-                             'Restaurants', 'Retail', 'Local Transport', 'Museums & Sites', 
-                             'Local Guides', 'Package Tours', 'Taxes & Fees'],
-                'Value': [250, 80, 320, 90, 180, 120, 150, 110, 80, 200, 160]
-            }
-            
-            eco_df = pd.DataFrame(economic_data)
-            
-            fig = px.treemap(
-                eco_df,
-                path=['Sector', 'Subsector'],
-                values='Value',
-                title="Distribution of Cultural Tourism Revenue (Millions USD)",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            
+            fig = revenue_treemap()
             st.plotly_chart(fig, use_container_width=True)
         
         with impact_col2:
             st.markdown("### Key Economic Findings")
             
-            st.markdown("""
-            - **Revenue Distribution**: Artisans and local businesses receive approximately 35% of total cultural tourism revenue
-            - **Job Creation**: Cultural tourism supports approximately 1.2 million direct and 3.5 million indirect jobs
-            - **Multiplier Effect**: Each $1 spent on cultural tourism generates an additional $2.3 in the local economy
-            - **Seasonal Variations**: Revenue fluctuates by 40-65% between peak and off-peak seasons
-            - **Regional Disparities**: Economic benefits vary significantly by region, with established tourism circuits capturing 70% of revenue
-            """)
+            st.markdown(content["economic_findings"])
             
             # Create chart of economic impact by stakeholder
             stakeholder_impact = {
@@ -307,62 +355,7 @@ def run():
         # Longitudinal economic analysis
         st.subheader("Longitudinal Economic Impact")
         
-        # Generate sample data for economic trends
-        years = list(range(2015, 2024))
-        total_revenue = [850, 920, 1050, 1180, 1310, 980, 1100, 1450, 1740]  # in millions USD
-        artisan_income = [12500, 13200, 14100, 15300, 16500, 13800, 15000, 18500, 22000]  # annual average in INR
-        cultural_investment = [45, 52, 60, 68, 75, 55, 65, 85, 105]  # in millions USD
-        
-        # Create multi-line chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=total_revenue,
-            name="Total Cultural Tourism Revenue (M USD)",
-            line=dict(color='blue', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=cultural_investment,
-            name="Cultural Heritage Investment (M USD)",
-            line=dict(color='green', width=3)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=years,
-            y=[rev * 0.15 for rev in total_revenue],
-            name="Artisan Direct Revenue (M USD)",
-            line=dict(color='orange', width=3)
-        ))
-        
-        fig.update_layout(
-            title="Economic Impact Trends (2015-2023)",
-            xaxis_title="Year",
-            yaxis_title="Value (Millions USD)",
-            legend=dict(x=0.01, y=0.99),
-            height=500
-        )
-        
-        # Add COVID-19 impact annotation
-        fig.add_annotation(
-            x=2020,
-            y=980,
-            text="COVID-19 Impact",
-            showarrow=True,
-            arrowhead=1
-        )
-        
-        # Add recovery annotation
-        fig.add_annotation(
-            x=2022,
-            y=1450,
-            text="Post-COVID Recovery",
-            showarrow=True,
-            arrowhead=1
-        )
-        
+        fig = economic_trends()
         st.plotly_chart(fig, use_container_width=True)
         
         # Sustainable economic development
@@ -373,43 +366,22 @@ def run():
         with sus_col1:
             st.markdown("### Artisan Cooperatives")
             st.image("https://placeholder.svg?height=150&width=250", caption="Artisan Cooperative")
-            st.markdown("""
-            **Economic Impact**: Artisan cooperatives have increased average income by 35% through direct sales and eliminating middlemen.
-            
-            **Sustainability Factor**: 85/100
-            
-            Over 300 cooperatives now support more than 25,000 artisan families across India.
-            """)
+            st.markdown(content["model_artisan_cooperatives"])
         
         with sus_col2:
             st.markdown("### Cultural Tourism Corridors")
             st.image("https://placeholder.svg?height=150&width=250", caption="Tourism Corridor")
-            st.markdown("""
-            **Economic Impact**: Integrated tourism corridors connecting multiple cultural sites have increased visitor stay duration by 45%.
-            
-            **Sustainability Factor**: 75/100
-            
-            12 major cultural corridors have been developed, distributing tourism benefits across 85+ communities.
-            """)
+            st.markdown(content["model_tourism_corridors"])
             
         with sus_col3:
             st.markdown("### Digital Marketplaces")
             st.image("https://placeholder.svg?height=150&width=250", caption="Online Marketplace")
-            st.markdown("""
-            **Economic Impact**: Online platforms have created year-round revenue streams, reducing seasonal fluctuations by 30%.
-            
-            **Sustainability Factor**: 80/100
-            
-            Digital sales now account for 25% of total artisan revenue, with 55% coming from international customers.
-            """)
+            st.markdown(content["model_digital_marketplaces"])
     
     with tab3:
         st.subheader("Cultural Evolution Analysis")
         
-        st.markdown("""
-        This analysis examines how traditional cultural practices are evolving in response to
-        tourism, globalization, and changing social contexts.
-        """)
+        st.markdown(content["evolution_intro"])
         
         # Evolution metrics
         evolution_col1, evolution_col2 = st.columns(2)
@@ -448,17 +420,7 @@ def run():
         with evolution_col2:
             st.markdown("### Key Evolution Patterns")
             
-            st.markdown("""
-            1. **Generational Adaptation**: Younger generations are more likely to practice modified versions of traditional arts
-            
-            2. **Material Evolution**: 65% of traditional art forms now incorporate some modern materials while maintaining traditional techniques
-            
-            3. **Thematic Changes**: Contemporary social themes now appear in 40% of traditional art forms
-            
-            4. **Technical Modifications**: Production processes have been modified in 55% of cases to meet tourism demand while maintaining quality
-            
-            5. **Digital Integration**: 35% of traditional cultural practices now have significant digital components for documentation or creation
-            """)
+            st.markdown(content["evolution_patterns"])
             
             # Create gauge chart for innovation vs tradition balance
             fig = go.Figure(go.Indicator(
@@ -506,19 +468,7 @@ def run():
             with art_col1:
                 st.image("https://placeholder.svg?height=300&width=400", caption="Traditional vs Contemporary Madhubani")
                 
-                st.markdown("""
-                #### Madhubani Painting Evolution
-                
-                **Traditional Practice**: Natural pigments, religious themes, ritual purposes
-                
-                **Contemporary Adaptations**:
-                - Use of acrylic colors alongside natural pigments
-                - Expansion to social and environmental themes
-                - Adaptation to canvas, paper, and commercial products
-                - Digital documentation and online teaching
-                
-                **Preservation Status**: Strong core traditions with conscious innovation
-                """)
+                st.markdown(content["madhubani_evolution"])
             
             with art_col2:
                 # Create evolution timeline
@@ -564,11 +514,7 @@ def run():
                 
                 st.plotly_chart(fig, use_container_width=True)
                 
-                st.markdown("""
-                #### Key Insight
-                
-                After a period of commercialization that threatened authenticity, there has been a conscious revival movement focusing on balancing tradition with innovation, resulting in both improved economic viability and authenticity.
-                """)
+                st.markdown(content["art_forms_insight"])
         
         with tabs[1]:
             st.markdown("### Evolution of Performing Arts")
@@ -578,20 +524,7 @@ def run():
             with dance_col1:
                 st.image("https://placeholder.svg?height=300&width=400", caption="Bharatanatyam Evolution")
                 
-                st.markdown("""
-                #### Bharatanatyam Evolution
-                
-                **Traditional Practice**: Temple performances, religious themes, lengthy presentations
-                
-                **Contemporary Adaptations**:
-                - Shorter, tourism-friendly performances
-                - Incorporation of contemporary themes
-                - Fusion with other dance forms
-                - Adaptations for international audiences
-                - Digital performances and teaching
-                
-                **Preservation Status**: Core techniques preserved with presentation adaptations
-                """)
+                st.markdown(content["bharatanatyam_evolution"])
             
             with dance_col2:
                 # Create adaptation heatmap
@@ -622,11 +555,7 @@ def run():
                 
                 st.plotly_chart(fig, use_container_width=True)
                 
-                st.markdown("""
-                #### Key Insight
-                
-                Elements like performance duration and venue have been significantly adapted for tourism, while core elements like costumes and musical structure remain more closely tied to tradition. This strategic adaptation has allowed the art form to remain economically viable while preserving its cultural essence.
-                """)
+                st.markdown(content["performing_arts_insight"])
         
         with tabs[2]:
             st.markdown("### Evolution of Crafts & Textiles")
@@ -636,20 +565,7 @@ def run():
             with craft_col1:
                 st.image("https://placeholder.svg?height=300&width=400", caption="Textile Evolution")
                 
-                st.markdown("""
-                #### Textile Craft Evolution
-                
-                **Traditional Practice**: Hand-spun materials, natural dyes, traditional motifs, local use
-                
-                **Contemporary Adaptations**:
-                - Incorporation of commercial materials
-                - Mix of natural and chemical dyes
-                - Simplified motifs for mass production
-                - New product applications (fashion, home decor)
-                - Global market adaptation
-                
-                **Preservation Status**: Variable, with some regions maintaining stronger traditions
-                """)
+                st.markdown(content["textile_evolution"])
             
             with craft_col2:
                 # Create evolution quadrant chart
@@ -701,11 +617,7 @@ def run():
                 
                 st.plotly_chart(fig, use_container_width=True)
                 
-                st.markdown("""
-                #### Key Insight
-                
-                Crafts that have achieved the best balance between commercial adaptation and traditional preservation (upper right quadrant) tend to be the most successful in the market. This demonstrates that cultural preservation and economic success can be complementary with the right approach.
-                """)
+                st.markdown(content["crafts_insight"])
         
         # Future trends and recommendations
         st.subheader("Future Trends & Recommendations")
@@ -715,79 +627,34 @@ def run():
         with future_col1:
             st.markdown("### Projected Cultural Evolution Trends")
             
-            st.markdown("""
-            1. **Digital Documentation**: Increased use of technology to document and preserve traditional knowledge
-            
-            2. **Sustainable Adaptation**: Growing focus on environmentally sustainable materials and practices
-            
-            3. **Cross-Cultural Fusion**: More deliberate fusion of traditional techniques with global influences
-            
-            4. **Community Ownership**: Strengthened intellectual property protections for traditional cultural expressions
-            
-            5. **Educational Integration**: Formal inclusion of traditional arts in educational curricula
-            
-            6. **Experience Economy**: Shift from product-focused to experience-focused cultural tourism
-            """)
+            st.markdown(content["evolution_trends"])
         
         with future_col2:
             st.markdown("### Recommendations for Balanced Evolution")
             
-            st.markdown("""
-            1. **Cultural Documentation**: Invest in comprehensive documentation of traditional practices
-            
-            2. **Apprenticeship Programs**: Support master-apprentice relationships with stipends and recognition
-            
-            3. **Adaptive Authenticity**: Develop frameworks for evaluating appropriate innovation vs. harmful modification
-            
-            4. **Community Control**: Ensure communities maintain decision-making authority over cultural adaptations
-            
-            5. **Market Education**: Educate consumers about the value of authentic cultural products
-            
-            6. **Sustainable Tourism**: Implement carrying capacity limits at cultural sites to prevent over-commercialization
-            """)
+            st.markdown(content["evolution_recommendations"])
     
     # Call to action
     st.header("Get Involved in Cultural Preservation")
     
-    st.markdown("""
-    Your involvement in responsible cultural tourism can make a significant difference in preserving India's rich heritage.
-    Here are ways you can contribute:
-    """)
+    st.markdown(content["get_involved_intro"])
     
     action_col1, action_col2, action_col3 = st.columns(3)
     
     with action_col1:
         st.markdown("### As a Tourist")
         
-        st.markdown("""
-        - Choose community-based cultural experiences
-        - Purchase directly from artisans
-        - Learn about the cultural context before visiting
-        - Respect photography guidelines and privacy
-        - Share authentic stories that honor traditions
-        """)
+        st.markdown(content["involved_tourist"])
     
     with action_col2:
         st.markdown("### As a Professional")
         
-        st.markdown("""
-        - Partner with cultural preservation organizations
-        - Implement sustainable tourism practices
-        - Invest in artisan communities
-        - Document and promote authentic cultural experiences
-        - Provide training opportunities for local guides
-        """)
+        st.markdown(content["involved_professional"])
             
     with action_col3:
         st.markdown("### As a Policymaker")
         
-        st.markdown("""
-        - Create incentives for cultural preservation
-        - Develop sustainable tourism frameworks
-        - Support documentation and education initiatives
-        - Protect intellectual property of traditional knowledge
-        - Invest in community-based tourism infrastructure
-        """)
+        st.markdown(content["involved_policymaker"])
     
 
     # Footer
@@ -1,9 +1,14 @@
 import streamlit as st
-import pandas as pd
-import os
 import plotly.express as px
-import numpy as np
 from utils.dataloader import load_cultural_data
+from utils.cultural_query import cultural_filters, filter_values, query_cultural_data, snowflake_filter_values
+from utils.geocoding import add_coordinates
+from utils.map_aggregation import MAX_RAW_POINTS, aggregate_points
+from utils.paginated_table import DataFrameSource, paginated_table
+from utils.instrumentation import timer
+
+# Map detail level -> zoom level the cluster grid is sized for
+MAP_DETAIL_ZOOM = {"Country": 4, "State": 6, "District": 8}
 
 def run():
     # Data source selection: CSV (offline) or Snowflake (cloud)
@@ -49,28 +54,13 @@ def run():
     )
     st.markdown("---")
 
-    # Load main cultural data (from CSV or Snowflake)
-    df = None
+    # Filter options: distinct values only, the full table is never loaded for this
+    category_options = region_options = None
     if use_snowflake:
-        from modules import init_snowflake_connection
-        conn = init_snowflake_connection(
-            account=os.getenv('SNOWFLAKE_ACCOUNT'),
-            user=os.getenv('SNOWFLAKE_USER'),
-            password=os.getenv('SNOWFLAKE_PASSWORD'),
-            warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', 'vividha_wh'),
-            database=os.getenv('SNOWFLAKE_DATABASE', 'vividha_db'),
-            schema=os.getenv('SNOWFLAKE_SCHEMA', 'vividha_schema'),
-        )
-        if conn:
-            try:
-                df = pd.read_sql("SELECT * FROM cultural_data;", conn)
-            except Exception as e:
-                st.warning(f"Could not fetch data from Snowflake: {e}. Showing local data instead.")
-                use_snowflake = False
-            finally:
-                conn.close()
-        else:
-            st.warning("Could not connect to Snowflake. Showing local data instead.")
+        category_options = snowflake_filter_values('cultural_data', 'cultural_value')
+        region_options = snowflake_filter_values('cultural_data', 'region')
+        if category_options is None or region_options is None:
+            st.warning("Could not fetch data from Snowflake. Showing local data instead.")
             use_snowflake = False
     if not use_snowflake:
         try:
@@ -78,9 +68,11 @@ def run():
         except Exception as e:
             st.error(f"Failed to load cultural data: {e}")
             return
-    if df is None or df.empty:
-        st.error("No cultural data available. Please check the data source.")
-        return
+        if df is None or df.empty:
+            st.error("No cultural data available. Please check the data source.")
+            return
+        category_options = filter_values('cultural_data', 'cultural_value')
+        region_options = filter_values('cultural_data', 'region')
 
     # Filter options
     st.subheader("🎨 Explore Cultural Heritage")
@@ -89,13 +81,13 @@ def run():
         with filter_col1:
             category = st.selectbox(
                 "Category",
-                ["All"] + sorted(df['cultural_value'].unique().tolist() if 'cultural_value' in df.columns else []),
+                ["All"] + category_options,
                 help="Filter by type of cultural value (e.g., Art, Festival, Landmark)"
             )
         with filter_col2:
             region = st.multiselect(
                 "Region",
-                sorted(df['region'].unique().tolist()),
+                region_options,
                 help="Select one or more regions to focus on"
             )
         with filter_col3:
@@ -105,58 +97,86 @@ def run():
                 help="Filter by tourism visibility/popularity index"
             )
 
-    # Apply filters
-    filtered_df = df.copy()
-    if category != "All" and 'cultural_value' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['cultural_value'] == category]
-    if region:
-        filtered_df = filtered_df[filtered_df['region'].isin(region)]
-    if 'tourism_visibility' in filtered_df.columns:
-        filtered_df = filtered_df[(filtered_df['tourism_visibility'] >= popularity[0]) & (filtered_df['tourism_visibility'] <= popularity[1])]
+    # Apply filters: pushed down to Snowflake, or resolved from the local lookups.
+    # Only the matching rows are materialized, as a new frame we are free to modify.
+    filtered_df = query_cultural_data(cultural_filters(category, region, popularity), use_snowflake)
+    if filtered_df is None:
+        st.error("No cultural data available. Please check the data source.")
+        return
 
     # Interactive Map
     st.subheader("🗺️ Cultural Heritage Map")
     st.markdown("<span style='color:#64748b;'>Zoom and hover to explore cultural sites. Bubble size = popularity, color = preservation status.</span>", unsafe_allow_html=True)
 
-    region_coords = {
-        'Bihar': (25.6, 85.1), 'Maharashtra': (19.7, 75.7), 'Odisha': (20.9, 85.1),
-        'Madhya Pradesh': (23.5, 78.5), 'Andhra Pradesh': (15.9, 79.7), 'Kerala': (10.8, 76.3),
-        'Tamil Nadu': (11.1, 78.7), 'Rajasthan': (27.0, 74.2), 'Telangana': (17.9, 79.6),
-        'West Bengal': (22.9, 87.8), 'Karnataka': (15.3, 75.7), 'Manipur': (24.8, 93.9),
-        'Assam': (26.2, 92.9), 'Himachal Pradesh': (31.1, 77.2), 'Gujarat': (22.3, 71.7)
-    }
-    filtered_df = filtered_df.copy()
-    filtered_df['Latitude'] = filtered_df['region'].map(lambda r: region_coords.get(r, (20.6, 78.9))[0] + np.random.uniform(-0.5, 0.5))
-    filtered_df['Longitude'] = filtered_df['region'].map(lambda r: region_coords.get(r, (20.6, 78.9))[1] + np.random.uniform(-0.5, 0.5))
+    # Deterministic, vectorized coordinates (cached per dataset version for local data)
+    add_coordinates(filtered_df, dataset=None if use_snowflake else 'cultural_data')
 
-    fig = px.scatter_mapbox(
-        filtered_df,
-        lat='Latitude',
-        lon='Longitude',
-        color='preservation_status' if 'preservation_status' in filtered_df.columns else None,
-        size='tourism_visibility' if 'tourism_visibility' in filtered_df.columns else None,
-        hover_name='art_form',
-        hover_data={
-            'region': True,
-            'cultural_value': True,
-            'tourism_visibility': True,
-            'preservation_status': True,
-            'Latitude': False,
-            'Longitude': False
-        },
-        zoom=4,
-        center={"lat": 20.5937, "lon": 78.9629},
-        mapbox_style="carto-positron",
-        height=550
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    # Large selections are clustered on a grid sized for the chosen detail level, and the
+    # map opens at that level's zoom; smaller ones are drawn site by site at country zoom
+    zoom = MAP_DETAIL_ZOOM["Country"]
+    if len(filtered_df) > MAX_RAW_POINTS:
+        detail = st.select_slider(
+            "Map detail",
+            options=list(MAP_DETAIL_ZOOM.keys()),
+            value="Country",
+            help=f"Above {MAX_RAW_POINTS:,} sites, nearby sites are grouped into one bubble per grid cell; finer detail means smaller cells and a closer zoom."
+        )
+        zoom = MAP_DETAIL_ZOOM[detail]
+    map_df, aggregated = aggregate_points(filtered_df, zoom)
+
+    if aggregated:
+        st.caption(f"Showing {len(map_df):,} clusters for {len(filtered_df):,} sites. Bubble size = number of sites.")
+    with timer('figure.experiences.map'):
+        if aggregated:
+            fig = px.scatter_mapbox(
+                map_df,
+                lat='Latitude',
+                lon='Longitude',
+                color='preservation_status' if 'preservation_status' in map_df.columns else None,
+                size='count',
+                hover_name='region' if 'region' in map_df.columns else None,
+                hover_data={
+                    'count': True,
+                    'tourism_visibility': ':.0f',
+                    'Latitude': False,
+                    'Longitude': False
+                },
+                labels={'count': 'Sites', 'tourism_visibility': 'Avg. popularity', 'preservation_status': 'Most common status'},
+                zoom=zoom,
+                center={"lat": 20.5937, "lon": 78.9629},
+                mapbox_style="carto-positron",
+                height=550
+            )
+        else:
+            fig = px.scatter_mapbox(
+                map_df,
+                lat='Latitude',
+                lon='Longitude',
+                color='preservation_status' if 'preservation_status' in map_df.columns else None,
+                size='tourism_visibility' if 'tourism_visibility' in map_df.columns else None,
+                hover_name='art_form',
+                hover_data={
+                    'region': True,
+                    'cultural_value': True,
+                    'tourism_visibility': True,
+                    'preservation_status': True,
+                    'Latitude': False,
+                    'Longitude': False
+                },
+                zoom=zoom,
+                center={"lat": 20.5937, "lon": 78.9629},
+                mapbox_style="carto-positron",
+                height=550
+            )
+    # Serializing the figure for the browser is the other half of the Plotly cost
+    with timer('render.experiences.map'):
+        st.plotly_chart(fig, use_container_width=True)
 
     # Cultural site details
     st.subheader("📋 Cultural Heritage Details")
-    st.dataframe(
-        filtered_df[['art_form', 'region', 'cultural_value', 'tourism_visibility', 'preservation_status']],
-        use_container_width=True,
-        hide_index=True
+    paginated_table(
+        DataFrameSource(filtered_df[['art_form', 'region', 'cultural_value', 'tourism_visibility', 'preservation_status']]),
+        key='experience_details'
     )
 
     # Footer
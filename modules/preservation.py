@@ -1,6 +1,9 @@
 import streamlit as st
-import pandas as pd
 import os
+from utils.dataloader import dataset_path, load_dataset
+from utils.artifact_registry import get_artifact_registry
+from utils.paginated_table import DataFrameSource, RegistrySource, dataset_source, paginated_table
+from utils.translation import t
 
 # Preservation Hub module
 def run():
@@ -15,13 +18,13 @@ def run():
                                    help='Snowflake is not implemented in this demo. Only Local CSV is available.')
     use_snowflake = False  # Always use CSV, Snowflake not implemented
 
-    st.header("Cultural Preservation Hub")
+    st.header(t("Cultural Preservation Hub"))
     lang = st.session_state.get('language', 'English')
     font_size = st.session_state.get('font_size', 16)
     st.markdown(f"<div style='font-size:{font_size}px;'>", unsafe_allow_html=True)
     st.markdown("Contribute to preserving India's heritage. Document artifacts, monitor sites, and share knowledge.")
     # Artifact documentation
-    st.subheader("Artifact Documentation")
+    st.subheader(t("Artifact Documentation"))
     if 'artifact_log' not in st.session_state:
         st.session_state['artifact_log'] = []
     with st.form("artifact_form"):
@@ -40,27 +43,28 @@ def run():
             st.markdown(f"**{art['name']}** ({art['location']})")
             st.write(art['description'])
             st.markdown("---")
-    # Artifact registry (persistent, simulated with CSV for demo)
-    registry_path = os.path.join(os.path.dirname(__file__), '../data/artifact_registry.csv')
-    st.subheader("Artifact Registry (All Submissions)")
-    if os.path.exists(registry_path):
-        reg_df = pd.read_csv(registry_path)
-        st.dataframe(reg_df)
-    else:
-        st.info("No artifact registry found yet. Submit an artifact to create the registry.")
-    # Save new artifact to registry CSV (append mode)
+    # Artifact registry (persistent SQLite store shared by all sessions)
+    registry = get_artifact_registry()
+    st.subheader(t("Artifact Registry (All Submissions)"))
+    # Submissions from other sessions since this session last rendered the registry
+    last_seen = st.session_state.get('registry_last_id')
+    if last_seen is not None:
+        new_rows = registry.tail(last_seen)
+        if not new_rows.empty:
+            st.info(f"{len(new_rows)} new submission(s) since your last visit: " + ", ".join(new_rows['name']))
     if submitted and name and location and description:
-        import csv
-        file_exists = os.path.exists(registry_path)
-        with open(registry_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['name', 'location', 'description', 'submitted_on'])
-            if not file_exists:
-                writer.writeheader()
-            from datetime import datetime
-            writer.writerow({'name': name, 'location': location, 'description': description, 'submitted_on': datetime.now().isoformat()})
+        registry.append(name, location, description)
+    st.session_state['registry_last_id'] = registry.latest_id()
+    if registry.count() == 0:
+        st.info("No artifact registry found yet. Submit an artifact to create the registry.")
+    else:
+        location_filter = st.selectbox("Filter by location", ["All"] + registry.locations(), key='registry_location')
+        location_filter = None if location_filter == "All" else location_filter
+        # Only the visible page is read from the registry and sent to the browser
+        paginated_table(RegistrySource(registry, location_filter), key='registry')
 
     # Community contributions (simple feedback form)
-    st.subheader("Community Contributions & Feedback")
+    st.subheader(t("Community Contributions & Feedback"))
     with st.form("community_feedback"):
         contributor = st.text_input("Your Name (optional)")
         feedback = st.text_area("Share your knowledge, corrections, or suggestions:")
@@ -69,39 +73,35 @@ def run():
             st.success("Thank you for your contribution! (For demo, feedback is not stored persistently.)")
 
     # Heritage site monitoring (load from CSV or Snowflake)
-    st.subheader("Heritage Site Monitoring")
+    st.subheader(t("Heritage Site Monitoring"))
+    heritage_slot = st.empty()
     df = None
     if use_snowflake:
-        from modules import init_snowflake_connection
-        conn = init_snowflake_connection(
-            account=os.getenv('SNOWFLAKE_ACCOUNT'),
-            user=os.getenv('SNOWFLAKE_USER'),
-            password=os.getenv('SNOWFLAKE_PASSWORD'),
-            warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', 'vividha_wh'),
-            database=os.getenv('SNOWFLAKE_DATABASE', 'vividha_db'),
-            schema=os.getenv('SNOWFLAKE_SCHEMA', 'vividha_schema'),
+        from modules import fetch_snowflake_table
+        # Show the first batch while the rest of the table streams in
+        df = fetch_snowflake_table(
+            'heritage_sites',
+            columns=['site', 'region', 'status', 'threat_level', 'notes'],
+            on_batch=lambda batch, rows: heritage_slot.dataframe(batch) if rows == len(batch) else None,
         )
-        if conn:
-            query = "SELECT site, region, status, threat_level, notes FROM heritage_sites;"
-            df = pd.read_sql(query, conn)
-            conn.close()
-        else:
+        if df is None:
             st.warning("Could not fetch data from Snowflake. Showing local data instead.")
             use_snowflake = False
     if not use_snowflake:
-        data_path = os.path.join(os.path.dirname(__file__), '../data/heritage_sites.csv')
-        if not os.path.exists(data_path):
+        if not os.path.exists(dataset_path('heritage_sites')):
             st.warning("Heritage sites data not found. Please add 'heritage_sites.csv' to the data folder.")
             st.markdown("</div>", unsafe_allow_html=True)
             return
         try:
-            df = pd.read_csv(data_path)
+            df = load_dataset('heritage_sites')
         except Exception as e:
             st.error(f"Failed to load heritage sites data: {e}")
             st.markdown("</div>", unsafe_allow_html=True)
             return
     if df is not None:
-        st.dataframe(df)
+        source = DataFrameSource(df) if use_snowflake else dataset_source('heritage_sites')
+        with heritage_slot.container():
+            paginated_table(source, key='heritage_sites')
         st.caption("Data source: " + ("Snowflake" if use_snowflake else "data.gov.in (mocked for demo)"))
         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -0,0 +1,41 @@
+import streamlit as st
+from utils.search import ARTIFACT_KIND, SEARCH_SOURCES, get_search_index
+
+# Search module: ranked full-text search across all datasets
+KINDS = [kind for kind, *_ in SEARCH_SOURCES.values()] + [ARTIFACT_KIND]
+SNIPPET_LENGTH = 180
+
+def run():
+    st.header("Search")
+    st.markdown("Find art forms, cultural experiences, heritage sites and community-documented artifacts. "
+                "Spelling variants of place names (e.g. *Orissa* / *Odisha*) are matched too.")
+
+    index = get_search_index()
+    query_col, kind_col = st.columns([3, 2])
+    with query_col:
+        query = st.text_input("Search", key='search_query', placeholder="e.g. Madhubani, Kerala dance, temple")
+    with kind_col:
+        kinds = st.multiselect("Show", KINDS, default=KINDS, key='search_kinds')
+
+    if not query.strip():
+        st.caption(f"{len(index):,} documents indexed.")
+        return
+    if not kinds:
+        st.info("Select at least one kind of result to show.")
+        return
+
+    # Typeahead: titles matching the words typed so far, the last one as a prefix
+    suggestions = index.suggest(query)
+    if suggestions:
+        st.caption("Suggestions: " + " · ".join(suggestions))
+
+    results = index.search(query, limit=20, kinds=kinds)
+    if not results:
+        st.info("No results. Try fewer or shorter words.")
+        return
+    st.caption(f"Top {len(results)} result(s)")
+    for doc in results:
+        st.markdown(f"**{doc['title']}** · {doc['kind']}" + (f" · {doc['region']}" if doc['region'] else ""))
+        text = doc['text']
+        if text:
+            st.write(text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + "...")
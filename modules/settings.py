@@ -1,24 +1,21 @@
 import streamlit as st
+from utils.translation import LANGUAGES, t
 
 # Settings module placeholder
 
 def run():
-    st.header("Settings & Accessibility")
+    # The selectbox state is already updated when this rerun starts, so headings above it follow the new choice
+    lang = st.session_state.get('language_select', st.session_state.get('language', 'English'))
+    st.header(t("Settings & Accessibility", lang))
     
     # Language Selection
-    st.subheader("Language Selection")
-    lang = st.selectbox("Choose your language:", [
-        "English", "Hindi", "Bengali", "Tamil", "Telugu", "Marathi", "Gujarati", "Kannada", "Malayalam", "Punjabi", "Odia", "Assamese", "Urdu"
-    ], key="language_select")
-    if lang == "Hindi":
-        st.info("डेमो: कुछ UI तत्व हिंदी में दिखाए गए हैं। (Demo: Some UI elements are shown in Hindi.)")
-        st.write("वर्तमान भाषा: हिंदी")
-    else:
-        st.write(f"Current language: {lang}")
-    st.caption("(Multilingual support is in progress. Content will be translated in future releases.)")
+    st.subheader(t("Language Selection", lang))
+    lang = st.selectbox("Choose your language:", list(LANGUAGES), key="language_select")
+    st.write(f"{t('Current language', lang)}: {lang}")
+    st.caption("(Translations are served from the offline translation cache; text without a translation is shown in English.)")
 
     # Accessibility Options
-    st.subheader("Accessibility Options")
+    st.subheader(t("Accessibility Options", lang))
     high_contrast = st.checkbox("Enable high contrast mode", key="high_contrast")
     font_size = st.slider("Font size", 12, 32, 16, key="font_size")
     st.write(f"Font size set to: {font_size}px")
@@ -27,7 +24,7 @@ def run():
     st.caption("(Accessibility features are being developed. Your feedback is welcome!)")
 
     # Offline Mode
-    st.subheader("Offline Mode")
+    st.subheader(t("Offline Mode", lang))
     offline_enabled = st.checkbox("Enable offline mode (cache data for offline use)", key="offline_mode")
     if offline_enabled:
         st.info("Offline mode is enabled. The app will attempt to cache data for use when internet is unavailable. (Demo: Data will be loaded from local CSVs if available.)")
@@ -36,7 +33,7 @@ def run():
 
     # MVP: Show current settings summary
     st.markdown("---")
-    st.subheader("Current Settings Summary")
+    st.subheader(t("Current Settings Summary", lang))
     st.markdown(f"""
     - **Language:** {lang}
     - **High Contrast Mode:** {'Enabled' if high_contrast else 'Disabled'}
@@ -0,0 +1,164 @@
+"""
+Persistent artifact registry for the Preservation Hub.
+
+Submissions are stored in SQLite in WAL mode, so any number of sessions can append while
+others read, and pages are read with indexed LIMIT queries instead of loading every
+submission. Rows have an increasing id, which readers use to tail new submissions.
+The legacy `artifact_registry.csv` is imported the first time the database is created.
+"""
+import csv
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+from utils.dataloader import DATASET_DIR
+
+REGISTRY_PATH = os.path.join(DATASET_DIR, 'artifact_registry.db')
+LEGACY_CSV_PATH = os.path.join(DATASET_DIR, 'artifact_registry.csv')
+FIELDS = ['name', 'location', 'description', 'submitted_on']
+# Seconds a writer waits for another session's write to finish
+BUSY_TIMEOUT = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    description TEXT NOT NULL,
+    submitted_on TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_location ON artifacts (location);
+CREATE INDEX IF NOT EXISTS idx_artifacts_submitted_on ON artifacts (submitted_on);
+"""
+
+class ArtifactRegistry:
+    """
+    Append-only SQLite store of artifact submissions.
+
+    Parameters:
+        path (str): Database file; created (and seeded from legacy_csv) if missing
+        legacy_csv (str): CSV registry imported once when the database is new
+
+    The registry holds one connection, shared by every thread behind a lock: Streamlit runs
+    each rerun on a new script thread, so per-thread connections would pile up unclosed.
+    Queries are indexed and short, and WAL still lets other processes read during a write.
+    All methods are safe to call from any session.
+    """
+
+    def __init__(self, path=REGISTRY_PATH, legacy_csv=LEGACY_CSV_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            empty = conn.execute("SELECT NOT EXISTS (SELECT 1 FROM artifacts)").fetchone()[0]
+        if empty and legacy_csv and os.path.exists(legacy_csv):
+            self.import_csv(legacy_csv)
+
+    @contextmanager
+    def _connection(self):
+        # Hold the lock for the whole statement (and its fetch); commits on success, rolls back on error
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def append(self, name, location, description, submitted_on=None):
+        """Store one submission and return its id."""
+        submitted_on = submitted_on or datetime.now().isoformat()
+        with self._connection() as conn:
+            return conn.execute(
+                "INSERT INTO artifacts (name, location, description, submitted_on) VALUES (?, ?, ?, ?)",
+                (name, location, description, submitted_on),
+            ).lastrowid
+
+    def import_csv(self, path):
+        """Append every row of a CSV registry (name, location, description, submitted_on) in one transaction."""
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = [(r.get('name') or '', r.get('location') or '', r.get('description') or '',
+                     r.get('submitted_on') or datetime.now().isoformat()) for r in csv.DictReader(f)]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO artifacts (name, location, description, submitted_on) VALUES (?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def count(self, location=None, search=None):
+        """Return the number of submissions, optionally for one location and/or matching a search term."""
+        where, params = self._where(location, search=search)
+        with self._connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM artifacts{where}", params).fetchone()[0]
+
+    def latest_id(self):
+        """Return the id of the newest submission (0 if there are none)."""
+        with self._connection() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM artifacts").fetchone()[0]
+
+    def locations(self):
+        """Return the distinct locations, read from the location index."""
+        with self._connection() as conn:
+            return [r[0] for r in conn.execute("SELECT DISTINCT location FROM artifacts ORDER BY location")]
+
+    def page(self, limit=50, offset=0, location=None, before_id=None, order_by='id', ascending=False, search=None):
+        """
+        Return one page of submissions, newest first by default.
+
+        Parameters:
+            limit (int): Rows per page
+            offset (int): Rows to skip
+            location (str): Only submissions for this location
+            before_id (int): Keyset pagination: only rows older than this id (cost independent of depth)
+            order_by (str): Sort column: 'id' or one of FIELDS (location and submitted_on are indexed)
+            ascending (bool): Sort direction
+            search (str): Only submissions whose name, location or description contain this text
+
+        Returns:
+            pandas.DataFrame: id, name, location, description, submitted_on
+        """
+        if order_by not in ['id'] + FIELDS:
+            raise ValueError(f"Cannot sort artifacts by {order_by!r}")
+        where, params = self._where(location, before_id=before_id, search=search)
+        direction = "ASC" if ascending else "DESC"
+        # id breaks ties so pages never overlap
+        return self._query(
+            f"SELECT id, {', '.join(FIELDS)} FROM artifacts{where} "
+            f"ORDER BY {order_by} {direction}, id {direction} LIMIT ? OFFSET ?",
+            params + [int(limit), int(offset)],
+        )
+
+    def tail(self, after_id, limit=100):
+        """Return up to `limit` submissions with an id greater than after_id, oldest first."""
+        return self._query(f"SELECT id, {', '.join(FIELDS)} FROM artifacts WHERE id > ? ORDER BY id LIMIT ?",
+                           [int(after_id), int(limit)])
+
+    def _where(self, location=None, before_id=None, search=None):
+        clauses, params = [], []
+        if location:
+            clauses.append("location = ?")
+            params.append(location)
+        if before_id is not None:
+            clauses.append("id < ?")
+            params.append(int(before_id))
+        if search:
+            pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            clauses.append("(name LIKE ? ESCAPE '\\' OR location LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            params.extend([pattern] * 3)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _query(self, sql, params):
+        with self._connection() as conn:
+            cursor = conn.execute(sql, params)
+            rows, columns = cursor.fetchall(), [d[0] for d in cursor.description]
+        return pd.DataFrame(rows, columns=columns)
+
+@st.cache_resource(show_spinner=False)
+def get_artifact_registry():
+    """Return the artifact registry shared by every session in this process."""
+    return ArtifactRegistry()
@@ -0,0 +1,315 @@
+"""
+Render-path benchmarks for the Vividha pages.
+
+Each page is driven through a scripted scenario (filter changes, art-form switches, form
+submissions, table paging) with Streamlit's AppTest, against a synthetic copy of the
+datasets generated at a given number of rows. Every rerun records its wall time, the peak
+Python memory it allocates on top of what was already held (tracemalloc, so times include
+tracing overhead), and the bytes of the Plotly figures and tables sent to the browser.
+Results are compared with a stored baseline per row count; a step is a regression when it
+exceeds the baseline by more than the tolerance and by more than a noise floor. Run from
+the repository root:
+
+    python -m utils.benchmark --rows 1000 10000          # table; exit code 1 on regression
+    python -m utils.benchmark --rows 10000 --json
+    python -m utils.benchmark --rows 1000 --save-baseline
+
+Wall times are not compared as absolute numbers. Every measured pass also times a fixed
+calibration workload (pandas grouping, JSON encoding and plain Python loops, the mix a
+rerun spends its time in), and the baseline stores its median next to the step times;
+a run on another machine, or on a busier one, scales the baseline's times by the ratio
+of the two calibrations before comparing. The scaling absorbs overall machine speed, not
+differences in how a machine favours one kind of work over another, so when the check
+moves to a different kind of machine (e.g. CI runners), record a baseline there with
+--save-baseline and keep it out of the committed one.
+"""
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+BASELINE_PATH = os.path.join(REPO_ROOT, 'benchmarks', 'baseline.json')
+DEFAULT_ROWS = (1000,)
+DEFAULT_REPEAT = 5
+
+# Allowed growth over the baseline (fraction) and the absolute change below which a
+# difference is treated as noise
+TOLERANCES = {'seconds': 0.25, 'peak_kb': 0.20, 'figure_bytes': 0.10, 'table_bytes': 0.10}
+NOISE_FLOORS = {'seconds': 0.05, 'peak_kb': 512, 'figure_bytes': 1024, 'table_bytes': 1024}
+
+# Datasets generated at the benchmarked row count; the dashboard metric tables are charted
+# row by row, so they keep their shipped contents
+SCALED_DATASETS = ['art_forms', 'cultural_data', 'cultural_experiences', 'heritage_sites', 'tourism_stats']
+
+def synthetic_dataset_dir(rows, directory):
+    """
+    Fill directory with synthetic SCALED_DATASETS of `rows` rows (see utils.synthetic_data)
+    and copies of the other registered datasets.
+
+    Returns:
+        str: directory
+    """
+    from utils.dataloader import DATASETS, dataset_path
+    from utils.synthetic_data import generate
+
+    generate(directory, rows, SCALED_DATASETS)
+    for name, file_name in DATASETS.items():
+        if name not in SCALED_DATASETS:
+            shutil.copyfile(dataset_path(name), os.path.join(directory, file_name))
+    return directory
+
+# Scenario steps: (step name, action on the AppTest before the rerun). The first step of
+# every scenario is the initial run.
+def _widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+def _map_detail(at, value):
+    # The control is only shown when the map clusters (more than MAX_RAW_POINTS sites)
+    sliders = [w for w in at.select_slider if w.label == 'Map detail']
+    return sliders[0].set_value(value) if sliders else at
+
+def _select_option(at, key, position):
+    widget = at.selectbox(key=key)
+    return widget.set_value(widget.options[position % len(widget.options)])
+
+SCENARIOS = {
+    'art_explorer': [
+        ('switch_art_form', lambda at: _select_option(at, 'art_form_select', 1)),
+        ('switch_art_form_again', lambda at: _select_option(at, 'art_form_select', 2)),
+    ],
+    'experiences': [
+        ('filter_category', lambda at: _widget(at, 'selectbox', 'Category').set_value(_widget(at, 'selectbox', 'Category').options[1])),
+        ('filter_region', lambda at: _widget(at, 'multiselect', 'Region').set_value(_widget(at, 'multiselect', 'Region').options[:3])),
+        ('filter_popularity', lambda at: _widget(at, 'slider', 'Tourism Popularity').set_value((40, 90))),
+        ('map_detail', lambda at: _map_detail(at, 'District')),
+        ('sort_details', lambda at: at.selectbox(key='experience_details_sort').set_value('tourism_visibility')),
+    ],
+    'dashboards': [
+        ('rerun', lambda at: at),
+    ],
+    'cultural_impact': [
+        ('filter_region', lambda at: _widget(at, 'multiselect', 'Region').set_value(['North India', 'South India'])),
+        ('spearman', lambda at: _widget(at, 'radio', 'Correlation method').set_value('Spearman')),
+    ],
+    'preservation': [
+        ('submit_artifact', lambda at: (_widget(at, 'text_input', 'Artifact Name').set_value('Benchmark Artifact'),
+                                        _widget(at, 'text_input', 'Location/Region').set_value('Bihar'),
+                                        _widget(at, 'text_area', 'Description').set_value('Synthetic submission'),
+                                        _widget(at, 'button', 'Submit Artifact').click())),
+        ('search_registry', lambda at: at.text_input(key='registry_search').set_value('Benchmark')),
+        ('sort_heritage_sites', lambda at: at.selectbox(key='heritage_sites_sort').set_value('site')),
+    ],
+    'search': [
+        ('query', lambda at: at.text_input(key='search_query').set_value('madhubani')),
+        ('prefix_query', lambda at: at.text_input(key='search_query').set_value('kerala da')),
+    ],
+}
+
+_PAGE_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+from modules import {module}
+{module}.run()
+"""
+
+def _payload_bytes(at):
+    figures = sum(chart.proto.ByteSize() for chart in at.get('plotly_chart'))
+    tables = sum(table.proto.ByteSize() for table in at.dataframe)
+    return figures, tables
+
+def calibration_workload():
+    """A fixed, deterministic workload timed next to the scenarios to normalise wall times."""
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'group': rng.integers(0, 50, 400_000), 'value': rng.random(400_000)})
+    df.groupby('group')['value'].agg(['mean', 'std', 'count']).sort_values('mean')
+    json.dumps([{'id': i, 'label': f"row {i}", 'value': i * 0.5} for i in range(100_000)])
+    total = 0
+    for i in range(1_000_000):
+        total += i % 7
+    return total
+
+def _timed_calibration():
+    t0 = time.perf_counter()
+    calibration_workload()
+    return time.perf_counter() - t0
+
+def _timed_run(at):
+    tracemalloc.reset_peak()
+    held = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    at.run()
+    seconds = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1] - held
+    figures, tables = _payload_bytes(at)
+    return {
+        'seconds': seconds,
+        'peak_kb': peak / 1024,
+        'figure_bytes': figures,
+        'table_bytes': tables,
+        'exceptions': [e.value for e in at.exception],
+    }
+
+def run_scenario(module, steps):
+    """Run one page's scenario in a fresh AppTest; return {step name: measurement}."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(_PAGE_SCRIPT.format(root=REPO_ROOT, module=module), default_timeout=300)
+    results = {'load': _timed_run(at)}
+    for name, action in steps:
+        action(at)
+        results[name] = _timed_run(at)
+    return results
+
+def run_worker(repeat=DEFAULT_REPEAT):
+    """
+    Measure every scenario in this process (VIVIDHA_DATA_DIR pointing at the synthetic data).
+
+    One unmeasured pass builds the on-disk caches and imports everything; each measured
+    pass then starts from empty Streamlit caches, like a freshly started server, and times
+    the calibration workload (untraced) first. Wall times (and the calibration) are the
+    fastest pass, the one least disturbed by other processes; the other numbers are medians.
+
+    Returns:
+        dict: 'calibration_seconds' and 'steps' ('<page>/<step>' -> measurement)
+    """
+    import streamlit as st
+
+    logging.disable(logging.CRITICAL)
+    for module, steps in SCENARIOS.items():
+        run_scenario(module, steps)
+    calibration_workload()
+    passes, calibrations = [], []
+    for _ in range(repeat):
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        # Untraced: tracing overhead would swamp the allocation-heavy calibration
+        calibrations.append(_timed_calibration())
+        tracemalloc.start()
+        passes.append({module: run_scenario(module, steps) for module, steps in SCENARIOS.items()})
+        tracemalloc.stop()
+
+    results = {}
+    for module in SCENARIOS:
+        for step, first in passes[0][module].items():
+            runs = [p[module][step] for p in passes]
+            results[f"{module}/{step}"] = {
+                **{metric: round((min if metric == 'seconds' else statistics.median)(r[metric] for r in runs), 4)
+                   for metric in TOLERANCES},
+                'exceptions': first['exceptions'],
+            }
+    return {'calibration_seconds': round(min(calibrations), 4), 'steps': results}
+
+def measure(rows, repeat=DEFAULT_REPEAT):
+    """Build a synthetic dataset of `rows` rows and run every scenario against it in a fresh interpreter."""
+    with tempfile.TemporaryDirectory(prefix='vividha-bench-') as directory:
+        synthetic_dataset_dir(rows, directory)
+        result = subprocess.run(
+            [sys.executable, '-m', 'utils.benchmark', '--worker', '--repeat', str(repeat)],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+            env={**os.environ, 'VIVIDHA_DATA_DIR': directory},
+        )
+    # Streamlit may log to stdout in bare mode; the measurement is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Store results ({rows: run_worker() result}) as the baseline, keeping other row counts."""
+    baseline = load_baseline(path)
+    for rows, measured in results.items():
+        baseline[str(rows)] = {
+            'calibration_seconds': measured['calibration_seconds'],
+            'steps': {step: {metric: m[metric] for metric in TOLERANCES} for step, m in measured['steps'].items()},
+        }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+def compare(measured, baseline):
+    """
+    Compare one row count's run_worker() result with its baseline.
+
+    The baseline's times (and the seconds noise floor) are scaled by this run's calibration
+    over the baseline's, so a uniformly slower or faster machine compares equal.
+
+    Returns:
+        list[dict]: One row per step with its metrics, ok and notes
+    """
+    scale = {metric: 1.0 for metric in TOLERANCES}
+    if baseline.get('calibration_seconds'):
+        scale['seconds'] = measured['calibration_seconds'] / baseline['calibration_seconds']
+    rows = []
+    for step, measurement in measured['steps'].items():
+        base = baseline.get('steps', {}).get(step)
+        notes = []
+        if measurement['exceptions']:
+            notes.append(f"raised {measurement['exceptions'][0]}")
+        if base is None:
+            notes.append('no baseline')
+        else:
+            for metric, tolerance in TOLERANCES.items():
+                value, reference = measurement[metric], base[metric] * scale[metric]
+                if value > reference * (1 + tolerance) and value - reference > NOISE_FLOORS[metric] * scale[metric]:
+                    notes.append(f"{metric} {reference:g} -> {value:g}")
+        rows.append({
+            'step': step,
+            **{metric: measurement[metric] for metric in TOLERANCES},
+            'ok': not measurement['exceptions'] and (base is None or len(notes) == 0),
+            'notes': ', '.join(notes),
+        })
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Vividha page render paths against a baseline.")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_ROWS),
+                        help="Synthetic dataset sizes to run (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Measured passes per scenario")
+    parser.add_argument('--save-baseline', action='store_true', help="Store the results as the new baseline")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.repeat)))
+        return 0
+
+    results = {rows: measure(rows, args.repeat) for rows in args.rows}
+    baseline = load_baseline()
+    report = {rows: compare(measured, baseline.get(str(rows), {})) for rows, measured in results.items()}
+    if args.save_baseline:
+        save_baseline(results)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for rows, steps in report.items():
+            reference = baseline.get(str(rows), {}).get('calibration_seconds')
+            print(f"{rows:,} rows (calibration {results[rows]['calibration_seconds']:.3f}s"
+                  + (f", baseline {reference:.3f}s)" if reference else ", no baseline)"))
+            for row in steps:
+                status = 'ok  ' if row['ok'] else 'FAIL'
+                print(f"  {status} {row['step']:<36} {row['seconds']:>7.3f}s {row['peak_kb']:>9.0f} KiB "
+                      f"{row['figure_bytes']:>9,.0f} B fig {row['table_bytes']:>9,.0f} B table  {row['notes']}")
+    ok = all(row['ok'] for steps in report.values() for row in steps)
+    return 0 if ok or args.save_baseline else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Per-language content bundles for long page text.
+
+Each page's prose lives in data/content/<page>/<language code>.json ({block key: markdown}).
+A page loads only its own bundle for the session's language, merged over the English
+bundle so untranslated blocks fall back to English. Bundles are memoized across sessions
+per file version, so switching languages reads each bundle at most once.
+
+Missing bundles can be precomputed from the English ones with the translation backends:
+
+    python -m utils.content --languages hi ta [--backend catalog|googletrans]
+"""
+import argparse
+import json
+import os
+from types import MappingProxyType
+import streamlit as st
+from utils.dataloader import DATA_DIR
+from utils.translation import BACKENDS, DEFAULT_BACKEND, SOURCE_LANGUAGE, current_language, get_backend, language_code
+
+CONTENT_DIR = os.path.join(DATA_DIR, 'content')
+
+def bundle_path(page, code):
+    """Return the path of a page's bundle for a language code."""
+    return os.path.join(CONTENT_DIR, page, f"{code}.json")
+
+def _fingerprint(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _read_bundle(path, fingerprint):
+    if fingerprint is None:
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _merged_bundle(page, code, source_fingerprint, fingerprint):
+    merged = dict(_read_bundle(bundle_path(page, SOURCE_LANGUAGE), source_fingerprint))
+    if code != SOURCE_LANGUAGE:
+        merged.update(_read_bundle(bundle_path(page, code), fingerprint))
+    return MappingProxyType(merged)
+
+def page_content(page, language=None):
+    """
+    Return a page's text blocks in the session's language (or `language`).
+
+    Parameters:
+        page (str): Bundle directory name, e.g. 'cultural_impact'
+        language (str): Language name or code (default: the language chosen in Settings)
+
+    Returns:
+        Mapping[str, str]: Read-only {block key: markdown}; blocks without a translation are English
+    """
+    code = language_code(language) if language else current_language()
+    return _merged_bundle(page, code, _fingerprint(bundle_path(page, SOURCE_LANGUAGE)),
+                          _fingerprint(bundle_path(page, code)))
+
+def pages():
+    """Return the names of the pages that have an English bundle."""
+    if not os.path.isdir(CONTENT_DIR):
+        return []
+    return sorted(p for p in os.listdir(CONTENT_DIR) if os.path.exists(bundle_path(p, SOURCE_LANGUAGE)))
+
+def build_bundles(codes, backend):
+    """
+    Translate the blocks missing from each page's bundles and write the bundles.
+
+    Returns:
+        dict: (page, code) -> number of blocks added
+    """
+    added = {}
+    for page in pages():
+        with open(bundle_path(page, SOURCE_LANGUAGE), encoding='utf-8') as f:
+            source = json.load(f)
+        for code in codes:
+            path = bundle_path(page, code)
+            bundle = {}
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    bundle = json.load(f)
+            keys = [key for key in source if key not in bundle]
+            translations = backend.translate([source[key] for key in keys], code) if keys else []
+            new = {key: text for key, text in zip(keys, translations) if text}
+            if new:
+                bundle.update(new)
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({key: bundle[key] for key in source if key in bundle}, f, ensure_ascii=False, indent=1)
+                    f.write('\n')
+                os.replace(tmp_path, path)
+            added[(page, code)] = len(new)
+    return added
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute per-language content bundles from the English ones.")
+    parser.add_argument('--languages', nargs='+', required=True, help="Language codes, e.g. hi ta")
+    parser.add_argument('--backend', default=DEFAULT_BACKEND, choices=sorted(BACKENDS))
+    args = parser.parse_args(argv)
+    for (page, code), count in build_bundles(args.languages, get_backend(args.backend)).items():
+        print(f"{page}/{code}: {count} block(s) added")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Per-group Pearson and Spearman correlations, computed in one vectorized pass.
+
+Pearson coefficients come from per-group sufficient statistics (n, sums, sums of squares
+and cross products), each accumulated with one bincount over all rows. Spearman is the
+same computation over within-group average ranks.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.impact_sample import impact_sample
+
+# Correlations shown on the Cultural Impact page: label -> column correlated with Tourism Level
+IMPACT_CORRELATIONS = {
+    'Tourism-Preservation Correlation': 'Preservation Score',
+    'Tourism-Authenticity Correlation': 'Authenticity Impact',
+    'Tourism-Community Benefit Correlation': 'Community Benefit',
+}
+
+def _pearson_from_sums(n, sx, sy, sxx, syy, sxy):
+    # r = (n*Sxy - Sx*Sy) / sqrt((n*Sxx - Sx^2) * (n*Syy - Sy^2)); NaN for < 2 rows or zero variance
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+        r = cov / np.sqrt(var)
+    return np.where((n >= 2) & (var > 0), r, np.nan)
+
+class CorrelationEngine:
+    """
+    Correlations of one column with several others, per group.
+
+    Parameters:
+        df (pandas.DataFrame): Rows to correlate
+        group_column (str): Column the correlations are computed per value of (e.g. 'Region')
+        x_column (str): Column correlated with every y column (e.g. 'Tourism Level')
+        y_columns (list[str]): Columns correlated with x_column
+
+    Both coefficient tables are computed when the engine is built; engines are immutable
+    and shared across sessions.
+    """
+
+    def __init__(self, df, group_column, x_column, y_columns):
+        self.group_column = group_column
+        self.x_column = x_column
+        self.y_columns = list(y_columns)
+        codes, self.groups = pd.factorize(df[group_column])
+        x = df[x_column].to_numpy(dtype=np.float64)
+        ys = [df[c].to_numpy(dtype=np.float64) for c in self.y_columns]
+        self._pearson = self._grouped_pearson(codes, x, ys)
+        # Spearman = Pearson of within-group average ranks
+        frame = pd.DataFrame({'x': x, **{i: y for i, y in enumerate(ys)}})
+        ranks = frame.groupby(codes).rank(method='average')
+        self._spearman = self._grouped_pearson(codes, ranks['x'].to_numpy(),
+                                               [ranks[i].to_numpy() for i in range(len(ys))])
+
+    def __len__(self):
+        return int(self._n.sum())
+
+    def _grouped_pearson(self, codes, x, ys):
+        size = len(self.groups)
+        n = np.bincount(codes, minlength=size).astype(np.float64)
+        self._n = n
+        sx = np.bincount(codes, weights=x, minlength=size)
+        sxx = np.bincount(codes, weights=x * x, minlength=size)
+        return np.array([
+            _pearson_from_sums(n, sx, np.bincount(codes, weights=y, minlength=size),
+                               sxx, np.bincount(codes, weights=y * y, minlength=size),
+                               np.bincount(codes, weights=x * y, minlength=size))
+            for y in ys
+        ])
+
+    def pearson(self):
+        """Return Pearson coefficients: one row per group, one column per y column."""
+        return self._frame(self._pearson)
+
+    def spearman(self):
+        """Return Spearman rank coefficients: one row per group, one column per y column."""
+        return self._frame(self._spearman)
+
+    def correlations(self, method='pearson'):
+        """Return pearson() or spearman() by name."""
+        if method == 'spearman':
+            return self.spearman()
+        if method == 'pearson':
+            return self.pearson()
+        raise ValueError(f"Unknown correlation method: {method!r}")
+
+    def _frame(self, values):
+        return pd.DataFrame(np.asarray(values).T, index=pd.Index(self.groups, name=self.group_column),
+                            columns=self.y_columns)
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def impact_correlation_engine(seed=42):
+    """
+    Return the shared correlation engine over the Cultural Impact sample for a seed.
+
+    No dataset under data/ has the Tourism Level / Preservation / Authenticity / Community
+    Benefit scores, so the engine is built over the synthetic sample (utils.impact_sample)
+    and built once per seed: figures derived from it depend on the seed alone.
+    """
+    df, _ = impact_sample(seed)
+    return CorrelationEngine(df, 'Region', 'Tourism Level', IMPACT_CORRELATIONS.values())
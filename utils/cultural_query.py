@@ -0,0 +1,91 @@
+"""
+Query layer for the Cultural Mapping filters.
+
+The category, region and popularity widgets are turned into a filter spec (the format
+accepted by utils.snowflake_connector.build_select) and resolved either as parameterized
+SQL against Snowflake or against the dataset's bitmap index (utils.filter_index), so only
+the matching rows are ever materialized.
+"""
+from utils.dataloader import load_dataset
+from utils.filter_index import get_filter_index
+from utils.instrumentation import timed
+
+# Columns of cultural_data the Cultural Mapping page reads
+CULTURAL_COLUMNS = ['art_form', 'region', 'cultural_value', 'tourism_visibility', 'preservation_status']
+
+def cultural_filters(category="All", regions=None, popularity=(0, 100)):
+    """
+    Translate the Cultural Mapping filter widgets into a filter spec.
+
+    Parameters:
+        category: Selected cultural_value, or "All"
+        regions (list[str]): Selected regions; empty means all
+        popularity (tuple[int, int]): Inclusive tourism_visibility range
+
+    Returns:
+        dict: column -> value (equality), list (IN) or (low, high) tuple (range)
+    """
+    filters = {}
+    if category != "All":
+        filters['cultural_value'] = category
+    if regions:
+        filters['region'] = list(regions)
+    filters['tourism_visibility'] = tuple(popularity)
+    return filters
+
+# Columns the Cultural Mapping filters run on
+CATEGORICAL_FILTER_COLUMNS = ('cultural_value', 'region')
+RANGE_FILTER_COLUMNS = ('tourism_visibility',)
+
+def _cultural_index(name):
+    return get_filter_index(name, CATEGORICAL_FILTER_COLUMNS, RANGE_FILTER_COLUMNS)
+
+def filter_values(name, column):
+    """Return the sorted distinct values of a filter column of a local dataset."""
+    index = _cultural_index(name)
+    return index.values(column) if column in index.categories else []
+
+def select_positions(name, filters):
+    """
+    Resolve a filter spec against a local dataset through its bitmap index.
+
+    Filters on columns the dataset doesn't have are ignored.
+
+    Returns:
+        numpy.ndarray: Ascending positions of the matching rows
+    """
+    return _cultural_index(name).select(filters)
+
+def query_local(name, filters, columns=None):
+    """Return only the rows (and columns) of a local dataset that match `filters`."""
+    # take() builds a new frame holding just the matching rows; the cached dataset is untouched
+    result = load_dataset(name).take(select_positions(name, filters))
+    if columns is not None:
+        result = result[[c for c in columns if c in result.columns]]
+    return result
+
+def snowflake_filter_values(table, column):
+    """Return the sorted distinct values of a Snowflake column, or None if the query fails."""
+    from modules import fetch_snowflake_data
+    from utils.snowflake_connector import check_identifier
+    df = fetch_snowflake_data(f"SELECT DISTINCT {check_identifier(column)} FROM {check_identifier(table)} ORDER BY 1", table=table)
+    if df is None:
+        return None
+    return df.iloc[:, 0].dropna().tolist()
+
+@timed('filter.query_cultural_data')
+def query_cultural_data(filters, use_snowflake=False):
+    """
+    Fetch the cultural_data rows matching `filters`, as a new frame the caller may modify.
+
+    With use_snowflake the filters are pushed down as parameterized SQL and only matching
+    rows are transferred (once per filter combination and TTL, see utils.query_cache);
+    otherwise they are resolved against the local bitmap index.
+    Returns None if the Snowflake query fails.
+    """
+    if use_snowflake:
+        from modules import fetch_snowflake_table
+        result = fetch_snowflake_table('cultural_data', columns=CULTURAL_COLUMNS, filters=filters)
+        # The cached result is shared across sessions
+        return None if result is None else result.copy()
+    return query_local('cultural_data', filters, columns=CULTURAL_COLUMNS)
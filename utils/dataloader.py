@@ -1,37 +1,201 @@
 import streamlit as st
 import pandas as pd
+import argparse
 import os
+from types import MappingProxyType
+from utils.instrumentation import timed, timer
 
+# App data shipped with the repo (content bundles, translation catalogues)
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '../data'))
+# Datasets and everything derived from them (registry, caches). Set VIVIDHA_DATA_DIR to
+# run against another copy, e.g. synthetic data for benchmarks.
+DATASET_DIR = os.path.normpath(os.getenv('VIVIDHA_DATA_DIR', DATA_DIR))
+# Columnar (Arrow IPC) copies of the CSVs, built with `python -m utils.dataloader --build-cache`,
+# and the other derived caches
+CACHE_DIR = os.path.join(DATASET_DIR, '.cache')
+# Set VIVIDHA_COLUMNAR_CACHE=0 to always parse the CSVs
+USE_COLUMNAR_CACHE = os.getenv('VIVIDHA_COLUMNAR_CACHE', '1') != '0'
+
+# Dataset registry: every CSV the pages read, keyed by a short dataset name.
+DATASETS = {
+    'cultural_data': 'cultural_data.csv',
+    'art_forms': 'art_forms.csv',
+    'cultural_experiences': 'cultural_experiences.csv',
+    'heritage_sites': 'heritage_sites.csv',
+    'tourism_stats': 'tourism_stats.csv',
+    'tourism_impact_metrics': 'tourism_impact_metrics.csv',
+    'tourism_practices_metrics': 'tourism_practices_metrics.csv',
+    'tourism_sustainability_indicators': 'tourism_sustainability_indicators.csv',
+    'tourism_community_economics': 'tourism_community_economics.csv',
+    'tourism_community_benefits': 'tourism_community_benefits.csv',
+}
+
+def dataset_path(name):
+    """
+    Return the absolute path of a registered dataset.
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    return os.path.join(DATASET_DIR, DATASETS[name])
+
+def dataset_fingerprint(name):
+    """
+    Return the (mtime_ns, size) of a dataset's file. A changed fingerprint means a new
+    dataset version, so every cache keyed on it is invalidated when the file is edited.
+    """
+    stat = os.stat(dataset_path(name))
+    return (stat.st_mtime_ns, stat.st_size)
+
+def columnar_cache_path(name):
+    """
+    Return the path of a dataset's Arrow IPC cache file.
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset: {name}")
+    return os.path.join(CACHE_DIR, os.path.splitext(DATASETS[name])[0] + '.arrow')
+
+def _fingerprint_metadata(fingerprint):
+    return {b'vividha.source_mtime_ns': str(fingerprint[0]).encode(), b'vividha.source_size': str(fingerprint[1]).encode()}
+
+def build_columnar_cache(names=None):
+    """
+    Convert registered CSV datasets into typed Arrow IPC files under data/.cache.
+
+    Column types are inferred once from the CSV and stored in the Arrow schema, together
+    with the source file's fingerprint so stale cache files are detected on read.
+
+    Returns:
+        list[str]: Paths of the cache files written
+    """
+    import pyarrow as pa
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    written = []
+    for name in names or DATASETS:
+        fingerprint = dataset_fingerprint(name)
+        table = pa.Table.from_pandas(pd.read_csv(dataset_path(name)), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_fingerprint_metadata(fingerprint)})
+        path = columnar_cache_path(name)
+        tmp_path = path + '.tmp'
+        # Uncompressed IPC so the file can be memory-mapped without a decode step
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        written.append(path)
+    return written
+
+def _read_columnar(name, fingerprint):
+    """
+    Memory-map a dataset's Arrow cache. Returns None if pyarrow is unavailable, the cache
+    was never built, or it was built from a different version of the CSV.
+    """
+    path = columnar_cache_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    expected = _fingerprint_metadata(fingerprint)
+    try:
+        with pa.memory_map(path, 'r') as source:
+            reader = pa.ipc.open_file(source)
+            metadata = reader.schema.metadata or {}
+            if any(metadata.get(key) != value for key, value in expected.items()):
+                return None
+            return reader.read_all().to_pandas()
+    except (OSError, pa.ArrowInvalid):
+        # Truncated or foreign file: fall back to the CSV
+        return None
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _read_dataset(name, path, fingerprint, columnar):
+    # path and fingerprint are part of the cache key so an edited file is reloaded
+    if columnar:
+        with timer('io.read_arrow'):
+            df = _read_columnar(name, fingerprint)
+        if df is not None:
+            return df
+    with timer('io.read_csv'):
+        return pd.read_csv(path)
+
+@timed('data.load_dataset')
+def load_dataset(name):
+    """
+    Load a registered dataset once per process and share it across sessions.
+
+    Reads the Arrow cache when it is present and matches the CSV, otherwise parses the CSV.
+    The returned DataFrame is the cached object itself, not a copy: treat it as
+    read-only and call .copy() before adding or modifying columns.
+    """
+    return _read_dataset(name, dataset_path(name), dataset_fingerprint(name), USE_COLUMNAR_CACHE)
+
+def record_index(df, key):
+    """
+    Build a {key value: row} lookup over a DataFrame; the first row wins for duplicate keys.
+
+    Rows are read-only mappings of column -> value.
+    """
+    rows = df.drop_duplicates(key, keep='first')
+    return MappingProxyType({row[key]: MappingProxyType(row) for row in rows.to_dict('records')})
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _dataset_record_index(name, fingerprint, key):
+    return record_index(load_dataset(name), key)
+
+def dataset_record_index(name, key):
+    """
+    Return a {key value: row} lookup over a registered dataset (see record_index).
+
+    Built once per dataset version and shared across sessions, so a lookup is a dict access
+    instead of a scan of the key column.
+    """
+    return _dataset_record_index(name, dataset_fingerprint(name), key)
+
+@timed('data.load_cultural_data')
 def load_cultural_data(connection=None):
     """
     Load cultural data from Snowflake if connection is provided, else from local CSV for hackathon/demo.
     """
     try:
         if connection is not None:
-            # Example query (uncomment for production)
-            # query = "SELECT * FROM cultural_heritage_data ORDER BY region, art_form"
-            # return pd.read_sql(query, connection)
+            # Example query (uncomment for production). Go through the shared query cache
+            # (TTL, size bound) rather than pd.read_sql, which re-runs the query on every rerun:
+            # from modules import fetch_snowflake_data
+            # return fetch_snowflake_data("SELECT * FROM cultural_heritage_data ORDER BY region, art_form")
             pass  # For hackathon, skip Snowflake
-        # Load from local CSV
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/cultural_data.csv')
-        return pd.read_csv(csv_path)
+        # Load from local CSV (cached per file version)
+        return load_dataset('cultural_data')
     except Exception as e:
         st.error(f"Error loading cultural data: {str(e)}")
         return None
 
+@timed('data.load_tourism_data')
 def load_tourism_data(connection=None):
     """
     Load tourism data from Snowflake if connection is provided, else from local CSV for hackathon/demo.
     """
     try:
         if connection is not None:
-            # Example query (uncomment for production)
-            # query = "SELECT * FROM tourism_data ORDER BY region, site_name"
-            # return pd.read_sql(query, connection)
+            # Example query (uncomment for production). Go through the shared query cache
+            # (TTL, size bound) rather than pd.read_sql, which re-runs the query on every rerun:
+            # from modules import fetch_snowflake_data
+            # return fetch_snowflake_data("SELECT * FROM tourism_data ORDER BY region, site_name")
             pass  # For hackathon, skip Snowflake
-        # Load from local CSV
-        csv_path = os.path.join(os.path.dirname(__file__), '../data/tourism_data.csv')
-        return pd.read_csv(csv_path)
+        # Load from local CSV (cached per file version)
+        return load_dataset('tourism_stats')
     except Exception as e:
         st.error(f"Error loading tourism data: {str(e)}")
         return None
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Vividha dataset utilities.")
+    parser.add_argument('--build-cache', action='store_true', help="Build Arrow caches for the registered datasets")
+    parser.add_argument('datasets', nargs='*', help="Dataset names (default: all registered datasets)")
+    args = parser.parse_args()
+    if args.build_cache:
+        for path in build_columnar_cache(args.datasets or None):
+            print(f"Wrote {path}")
+    else:
+        parser.print_help()
@@ -0,0 +1,117 @@
+"""
+Process-wide cache of built Plotly figures.
+
+Figures are memoized by (figure name, dataset fingerprint, filter parameters, theme) in a
+bounded LRU shared by all sessions, so an unchanged chart is not rebuilt (or re-validated)
+on a rerun. st.plotly_chart still serializes the figure on every render; it accepts no
+pre-serialized spec. Cached figures are shared: never mutate one after it is returned.
+"""
+import threading
+from collections import OrderedDict
+import streamlit as st
+from utils.instrumentation import register_collector, timer
+
+DEFAULT_MAX_ENTRIES = 256
+
+# Theme name -> Plotly layout template applied after building
+THEME_TEMPLATES = {
+    'default': None,
+    'high_contrast': 'plotly_dark',
+}
+
+def _freeze(value):
+    # Make filter parameters hashable: lists/tuples/sets -> tuples, dicts -> sorted item tuples
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+class FigureCache:
+    """
+    Thread-safe LRU of built Plotly figures.
+
+    Parameters:
+        max_entries (int): Figures kept before the least recently used one is evicted
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> figure
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, builder):
+        """Return the figure cached under key, calling builder() to create it on a miss."""
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return figure
+            self.misses += 1
+        # Build outside the lock so one slow figure doesn't block every session
+        figure = builder()
+        with self._lock:
+            figure = self._entries.setdefault(key, figure)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+@st.cache_resource(show_spinner=False)
+def get_figure_cache():
+    """Return the figure cache shared by every session in this process."""
+    cache = FigureCache()
+    register_collector('figure_cache', cache.stats)
+    return cache
+
+def current_theme():
+    """Return the chart theme selected in Settings for this session."""
+    return 'high_contrast' if st.session_state.get('high_contrast') else 'default'
+
+def figure_key(name, data_version=None, params=None, theme=None):
+    """Build the cache key of a figure; see cached_figure."""
+    return (name, _freeze(data_version), _freeze(params), theme or current_theme())
+
+def cached_figure(name, builder, data_version=None, params=None, theme=None):
+    """
+    Return a memoized Plotly figure.
+
+    Parameters:
+        name (str): Unique figure name, e.g. 'dashboards.sustainability_heatmap'
+        builder (callable): Builds the figure; called only on a cache miss
+        data_version: Fingerprint of the data the figure is built from
+            (e.g. utils.dataloader.dataset_fingerprint), or None for static data
+        params (dict): Filter state the figure depends on
+        theme (str): Theme name (default: the session's current theme)
+
+    Returns:
+        plotly.graph_objects.Figure: Shared figure; do not modify it
+    """
+    key = figure_key(name, data_version, params, theme)
+    template = THEME_TEMPLATES.get(key[-1])
+
+    def build():
+        with timer(f"figure.{name}"):
+            figure = builder()
+        if template is not None:
+            figure.update_layout(template=template)
+        return figure
+
+    return get_figure_cache().get_or_build(key, build)
@@ -0,0 +1,144 @@
+"""
+Precomputed filter index for the page filters.
+
+Built once per dataset version, it stores categorical codes plus one packed row bitmap per
+distinct value for the equality/IN columns (region, category, ...), and a sorted array for
+each numeric range column (popularity). A combined filter is resolved by OR-ing the bitmaps
+of the selected values per column, AND-ing across columns and decoding the result, so its
+cost grows with the number of selected values, not with a scan of every column.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.dataloader import dataset_fingerprint, load_dataset
+
+class FilterIndex:
+    """
+    Bitmap index over the rows of a DataFrame.
+
+    Parameters:
+        df (pandas.DataFrame): Rows to index; positions refer to df's row order
+        categorical_columns (list[str]): Columns filtered by equality / membership
+        range_columns (list[str]): Numeric columns filtered by an inclusive (low, high) range
+    """
+
+    def __init__(self, df, categorical_columns=(), range_columns=()):
+        self.n_rows = len(df)
+        self._n_bytes = (self.n_rows + 7) // 8
+        self.categories = {}  # column -> pandas.Index of distinct values; position = code
+        self.codes = {}       # column -> int32 code per row (-1 for missing)
+        self.bitmaps = {}     # column -> uint8 array (n_values, n_bytes) of packed row bits
+        self._sorted = {}     # column -> (sorted values, row position of each sorted value)
+        self._values = {}     # column -> range column values in row order
+
+        for column in categorical_columns:
+            if column not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[column], sort=True)
+            codes = codes.astype(np.int32)
+            bitmaps = np.zeros((len(uniques), self._n_bytes), dtype=np.uint8)
+            # Group row positions by code once, then pack each group into a bitmap
+            order = np.argsort(codes, kind='stable')
+            boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            bits = np.zeros(self._n_bytes * 8, dtype=bool)
+            for code in range(len(uniques)):
+                rows = order[boundaries[code]:boundaries[code + 1]]
+                bits[rows] = True
+                bitmaps[code] = np.packbits(bits)
+                bits[rows] = False
+            self.categories[column] = pd.Index(uniques)
+            self.codes[column] = codes
+            self.bitmaps[column] = bitmaps
+
+        for column in range_columns:
+            if column not in df.columns:
+                continue
+            values = df[column].to_numpy()
+            order = np.argsort(values, kind='stable')  # NaN sorts last and never matches a range
+            self._sorted[column] = (values[order], order)
+            self._values[column] = values
+
+    def __contains__(self, column):
+        return column in self.categories or column in self._sorted
+
+    def values(self, column):
+        """Return the sorted distinct values of an indexed categorical column."""
+        return [v.item() if hasattr(v, 'item') else v for v in self.categories[column]]
+
+    def _value_bitmap(self, column, wanted):
+        codes = self.categories[column].get_indexer(list(wanted))
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return np.zeros(self._n_bytes, dtype=np.uint8)
+        return np.bitwise_or.reduce(self.bitmaps[column][codes], axis=0)
+
+    def _range_bitmap(self, column, low, high):
+        sorted_values, order = self._sorted[column]
+        start = np.searchsorted(sorted_values, low, side='left')
+        stop = np.searchsorted(sorted_values, high, side='right')
+        bits = np.zeros(self._n_bytes * 8, dtype=bool)
+        bits[order[start:stop]] = True
+        return np.packbits(bits)
+
+    def mask(self, filters):
+        """
+        Resolve a filter spec to a packed row bitmap, or None if nothing was filtered.
+
+        Parameters:
+            filters (dict): column -> value (equality), list/set (IN) or (low, high) tuple
+                (range). None, empty lists and columns that aren't indexed are ignored.
+        """
+        result = None
+        for column, value in filters.items():
+            if value is None or column not in self:
+                continue
+            if isinstance(value, tuple):
+                bitmap = self._range_bitmap(column, *value)
+            else:
+                wanted = value if isinstance(value, (list, set, frozenset)) else [value]
+                if not wanted:
+                    continue
+                bitmap = self._value_bitmap(column, wanted)
+            result = bitmap if result is None else np.bitwise_and(result, bitmap)
+        return result
+
+    def select(self, filters):
+        """
+        Return the ascending positions of the rows matching every filter.
+
+        Categorical filters are intersected as bitmaps first; range filters are then checked
+        only on the surviving rows, or answered from the sorted array if nothing else filters.
+        """
+        ranges = [(c, v) for c, v in filters.items() if isinstance(v, tuple) and c in self._sorted]
+        bitmap = self.mask({c: v for c, v in filters.items() if not isinstance(v, tuple)})
+        if bitmap is not None:
+            positions = np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+        elif ranges:
+            column, (low, high) = ranges.pop(0)
+            sorted_values, order = self._sorted[column]
+            start = np.searchsorted(sorted_values, low, side='left')
+            stop = np.searchsorted(sorted_values, high, side='right')
+            hits = np.zeros(self.n_rows, dtype=bool)
+            hits[order[start:stop]] = True
+            positions = np.flatnonzero(hits)
+        else:
+            return np.arange(self.n_rows)
+        for column, (low, high) in ranges:
+            values = self._values[column][positions]
+            positions = positions[(values >= low) & (values <= high)]
+        return positions
+
+    def count(self, filters):
+        """Return the number of rows matching every filter."""
+        return len(self.select(filters))
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _dataset_index(name, fingerprint, categorical_columns, range_columns):
+    return FilterIndex(load_dataset(name), categorical_columns, range_columns)
+
+def get_filter_index(name, categorical_columns, range_columns=()):
+    """
+    Return the FilterIndex of a registered dataset, built once per dataset version and
+    shared across sessions.
+    """
+    return _dataset_index(name, dataset_fingerprint(name), tuple(categorical_columns), tuple(range_columns))
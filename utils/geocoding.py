@@ -0,0 +1,84 @@
+"""
+Geocoding for the Cultural Heritage Map.
+
+Region names are resolved to coordinates with one vectorized lookup against a cached
+coordinate table, and each point gets a small jitter derived from a hash of its art form,
+so points don't pile up on the region centre yet stay put between reruns. Coordinates for
+a local dataset are computed once per dataset version.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.dataloader import dataset_fingerprint, load_dataset
+
+REGION_COORDS = {
+    'Bihar': (25.6, 85.1), 'Maharashtra': (19.7, 75.7), 'Odisha': (20.9, 85.1),
+    'Madhya Pradesh': (23.5, 78.5), 'Andhra Pradesh': (15.9, 79.7), 'Kerala': (10.8, 76.3),
+    'Tamil Nadu': (11.1, 78.7), 'Rajasthan': (27.0, 74.2), 'Telangana': (17.9, 79.6),
+    'West Bengal': (22.9, 87.8), 'Karnataka': (15.3, 75.7), 'Manipur': (24.8, 93.9),
+    'Assam': (26.2, 92.9), 'Himachal Pradesh': (31.1, 77.2), 'Gujarat': (22.3, 71.7)
+}
+# Centre of India, used for regions without coordinates
+DEFAULT_COORDS = (20.6, 78.9)
+JITTER_DEGREES = 0.5
+JITTER_SEED = 42
+
+@st.cache_resource(show_spinner=False)
+def coordinate_table():
+    """Return the region coordinate table as a DataFrame indexed by region."""
+    return pd.DataFrame.from_dict(REGION_COORDS, orient='index', columns=['Latitude', 'Longitude'])
+
+def _hash_jitter(keys, seed, spread):
+    # One 64-bit hash per key: the low and high 32 bits give two independent uniforms in [0, 1)
+    hash_key = f"vividha{seed:09d}"[-16:]
+    hashes = pd.util.hash_pandas_object(pd.Series(keys, dtype=object), index=False, hash_key=hash_key).to_numpy()
+    low = (hashes & np.uint64(0xFFFFFFFF)).astype(np.float64) / 2.0 ** 32
+    high = (hashes >> np.uint64(32)).astype(np.float64) / 2.0 ** 32
+    return (low * 2 - 1) * spread, (high * 2 - 1) * spread
+
+def geocode(regions, keys, seed=JITTER_SEED, spread=JITTER_DEGREES):
+    """
+    Resolve regions to jittered coordinates.
+
+    Parameters:
+        regions (array-like): Region name per point
+        keys (array-like): Jitter key per point (e.g. art form); equal keys get equal offsets
+        seed (int): Changes every offset at once
+        spread (float): Maximum offset in degrees
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Latitudes and longitudes
+    """
+    table = coordinate_table()
+    positions = table.index.get_indexer(pd.Index(regions))
+    known = positions >= 0
+    latitude = np.where(known, table['Latitude'].to_numpy()[positions], DEFAULT_COORDS[0])
+    longitude = np.where(known, table['Longitude'].to_numpy()[positions], DEFAULT_COORDS[1])
+    lat_jitter, lon_jitter = _hash_jitter(keys, seed, spread)
+    return latitude + lat_jitter, longitude + lon_jitter
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _dataset_coordinates(name, fingerprint, region_column, key_column):
+    df = load_dataset(name)
+    return geocode(df[region_column].to_numpy(), df[key_column].to_numpy())
+
+def dataset_coordinates(name, region_column='region', key_column='art_form'):
+    """Return (latitude, longitude) arrays for every row of a registered dataset, cached per version."""
+    return _dataset_coordinates(name, dataset_fingerprint(name), region_column, key_column)
+
+def add_coordinates(df, dataset=None, region_column='region', key_column='art_form'):
+    """
+    Add Latitude and Longitude columns to df in place.
+
+    If `dataset` names the registered dataset df's rows were taken from (so its index
+    holds their positions), the coordinates come from that dataset's per-version cache;
+    otherwise they are computed for df's rows directly. Both give the same result.
+    """
+    if dataset is not None:
+        latitude, longitude = dataset_coordinates(dataset, region_column, key_column)
+        positions = df.index.to_numpy()
+        df['Latitude'] = latitude[positions]
+        df['Longitude'] = longitude[positions]
+    else:
+        df['Latitude'], df['Longitude'] = geocode(df[region_column].to_numpy(), df[key_column].to_numpy())
+    return df
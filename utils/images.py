@@ -0,0 +1,149 @@
+"""
+Local image pipeline for art form pictures.
+
+Full-size originals are provided offline in a source directory (data/images/ by default,
+or VIVIDHA_IMAGE_SOURCE), named `source_name(url)` plus an image extension (`--build`
+lists the name expected for every URL still missing one). Thumbnails are generated once per width bucket, stored content-addressed
+(by a hash of the original's bytes) in data/.cache/images/, and handed to st.image as
+local files, so the browser downloads a small, correctly sized image instead of hotlinking
+the full-size original. Images without a local original fall back to their URL.
+
+Pre-generate every bucket for the originals in the source directory with:
+
+    python -m utils.images --build
+"""
+import argparse
+import hashlib
+import os
+import streamlit as st
+from utils.dataloader import CACHE_DIR, DATA_DIR, load_dataset
+
+IMAGE_SOURCE_DIR = os.getenv('VIVIDHA_IMAGE_SOURCE', os.path.join(DATA_DIR, 'images'))
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, 'images')
+# Thumbnail widths in pixels; a request is served from the smallest bucket at least as wide
+SIZE_BUCKETS = (150, 300, 600, 1200)
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+
+def size_bucket(width):
+    """Return the bucket width used for a requested display width."""
+    for bucket in SIZE_BUCKETS:
+        if width <= bucket:
+            return bucket
+    return SIZE_BUCKETS[-1]
+
+def source_name(url):
+    """Return the hash-based base name an original for url may be stored under."""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+def _inside(path, directory):
+    path, directory = os.path.realpath(path), os.path.realpath(directory)
+    return os.path.commonpath([path, directory]) == directory
+
+def find_source(url, directory=IMAGE_SOURCE_DIR):
+    """
+    Return the local original for an image URL (or a path inside the source directory),
+    or None if there is none.
+
+    URLs match only by their hash name: many share their last path segment (Google image
+    URLs all end in /images). Other local paths are ignored, since the value comes from data.
+    """
+    if not url:
+        return None
+    if os.path.isfile(url):
+        return url if _inside(url, directory) else None
+    for ext in SOURCE_EXTENSIONS:
+        path = os.path.join(directory, source_name(url) + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _output_format():
+    from PIL import features
+    return ('WEBP', '.webp') if features.check('webp') else ('JPEG', '.jpg')
+
+def build_thumbnail(source, bucket, directory=THUMBNAIL_DIR):
+    """
+    Generate (once) the thumbnail of an original for a width bucket.
+
+    Returns:
+        str: Path of the thumbnail, named <content hash>_<bucket>.<ext>
+    """
+    from PIL import Image, ImageOps
+
+    with open(source, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:24]
+    image_format, ext = _output_format()
+    path = os.path.join(directory, f"{digest}_{bucket}{ext}")
+    if os.path.exists(path):
+        return path
+
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.width > bucket:
+            image = image.resize((bucket, max(1, round(image.height * bucket / image.width))), Image.LANCZOS)
+        if image_format == 'JPEG':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            transparent = 'A' in image.getbands() or 'transparency' in image.info
+            image = image.convert('RGBA' if transparent else 'RGB')
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename, so concurrent sessions never read a half-written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        quality = WEBP_QUALITY if image_format == 'WEBP' else JPEG_QUALITY
+        image.save(tmp_path, image_format, quality=quality, optimize=True)
+    os.replace(tmp_path, path)
+    return path
+
+@st.cache_resource(show_spinner=False, max_entries=1024)
+def _thumbnail(source, fingerprint, bucket):
+    return build_thumbnail(source, bucket)
+
+def image_for(url, width):
+    """
+    Return what to pass to st.image for an image displayed about `width` pixels wide.
+
+    Parameters:
+        url (str): Image URL (or local path) as stored in the data
+        width (int): Display width in pixels
+
+    Returns:
+        str: Path of a local thumbnail, or url itself when there is no local original
+            (or it cannot be decoded)
+    """
+    source = find_source(url)
+    if source is None:
+        return url
+    stat = os.stat(source)
+    try:
+        return _thumbnail(source, (stat.st_mtime_ns, stat.st_size), size_bucket(width))
+    except Exception:
+        return url
+
+def build_all(directory=IMAGE_SOURCE_DIR):
+    """Generate every size bucket for every original in the source directory; return how many were processed."""
+    if not os.path.isdir(directory):
+        return 0
+    sources = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                     if name.lower().endswith(SOURCE_EXTENSIONS))
+    for source in sources:
+        for bucket in SIZE_BUCKETS:
+            build_thumbnail(source, bucket)
+    return len(sources)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate thumbnails for art form images.")
+    parser.add_argument('--build', action='store_true', help="Build every size bucket for the originals in the source directory")
+    args = parser.parse_args(argv)
+    if args.build:
+        count = build_all()
+        missing = [url for url in load_dataset('art_forms')['image_url'].dropna().unique() if find_source(url) is None]
+        print(f"{count} original(s) from {IMAGE_SOURCE_DIR} built into {THUMBNAIL_DIR}")
+        for url in missing:
+            print(f"  no local original (served from its URL; save it as {source_name(url)}.jpg): {url}")
+    else:
+        parser.print_help()
+
+if __name__ == '__main__':
+    main()
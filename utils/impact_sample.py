@@ -0,0 +1,58 @@
+"""
+Synthetic Tourism & Preservation data for the Cultural Impact page.
+
+The whole regions x categories matrix is drawn in one vectorized pass from a local
+numpy Generator, so building it never touches (or depends on) the global NumPy random
+state shared with other sessions. Results are cached by seed and shape and shared across
+sessions; the shape can be scaled to thousands of regions x categories for load testing.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.filter_index import FilterIndex
+
+IMPACT_REGIONS = ["North India", "South India", "East India", "West India", "Central India", "Northeast India"]
+IMPACT_CATEGORIES = ["Traditional Art", "Performing Arts", "Handicrafts", "Architecture", "Festivals", "Culinary Traditions"]
+
+def synthetic_labels(base, size, prefix):
+    """Return `size` labels: `base` first, then numbered ones like 'Region 7' if more are needed."""
+    labels = list(base[:size])
+    labels.extend(f"{prefix} {i}" for i in range(len(labels) + 1, size + 1))
+    return labels
+
+def generate_impact_matrix(regions, categories, seed=42):
+    """
+    Generate one row per (region, category) pair.
+
+    Tourism Level is drawn from [30, 95); the other scores are derived from it with the
+    same formulas the page has always used, computed for the whole matrix at once.
+
+    Returns:
+        pandas.DataFrame: Region, Category, Tourism Level, Preservation Score,
+            Community Benefit and Authenticity Impact columns
+    """
+    rng = np.random.default_rng(seed)
+    size = len(regions) * len(categories)
+    tourism_level = rng.integers(30, 95, size=size)
+    noise = rng.random((3, size))
+    return pd.DataFrame({
+        "Region": np.repeat(np.asarray(regions, dtype=object), len(categories)),
+        "Category": np.tile(np.asarray(categories, dtype=object), len(regions)),
+        "Tourism Level": tourism_level,
+        "Preservation Score": np.minimum(100, (tourism_level * (0.8 + noise[0] * 0.4)).astype(np.int64)),
+        "Community Benefit": np.minimum(100, (tourism_level * (0.7 + noise[1] * 0.5)).astype(np.int64)),
+        "Authenticity Impact": np.maximum(30, 100 - (tourism_level * (0.3 + noise[2] * 0.4)).astype(np.int64)),
+    })
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def impact_sample(seed=42, n_regions=len(IMPACT_REGIONS), n_categories=len(IMPACT_CATEGORIES)):
+    """
+    Return the cached (DataFrame, FilterIndex) sample for a seed and shape.
+
+    The first n_regions / n_categories labels are the page's own regions and categories;
+    larger shapes are padded with numbered synthetic labels.
+    """
+    regions = synthetic_labels(IMPACT_REGIONS, n_regions, "Region")
+    categories = synthetic_labels(IMPACT_CATEGORIES, n_categories, "Category")
+    df = generate_impact_matrix(regions, categories, seed)
+    return df, FilterIndex(df, ["Region", "Category"])
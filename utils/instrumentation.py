@@ -0,0 +1,283 @@
+"""
+Hot-path timing for the Vividha pages.
+
+Data loads, filter queries and figure construction are wrapped in named spans with the
+`timer(name)` context manager or the `@timed(name)` decorator. Each finished span is
+recorded, without taking a lock, into a shard owned by the recording thread; readers
+merge the shards. Spans are aggregated per page (process-wide, across all sessions) and
+per session, and the spans of the session's last rerun are kept for the timing overlay.
+
+Span names are dotted by kind: io.* (file and Snowflake reads), data.* (dataset loaders,
+including cache hits), filter.* (filter and paging queries), figure.* (figure builds),
+render.* (sending a figure to the browser), warmup.* (utils.warmup steps) and rerun (the
+whole page script).
+
+Components with their own counters (e.g. the query cache) register a collector, whose
+values are exported alongside the spans. The sidebar panel (render_debug_panel) is shown
+when VIVIDHA_DEBUG_PANEL=1 or the page is opened with ?debug=1; it offers the metrics as
+JSON and in the Prometheus text format.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+import streamlit as st
+
+# Histogram bucket upper bounds in seconds (Prometheus 'le' labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Spans kept for the overlay of a session's last rerun
+MAX_RERUN_SPANS = 500
+DEBUG_PANEL_ENV = 'VIVIDHA_DEBUG_PANEL'
+NO_PAGE = 'none'
+SESSION_STATE_KEY = '_instrumentation'
+
+# A statistic is a list: [count, total seconds, max seconds, one count per bucket]
+_COUNT, _TOTAL, _MAX, _FIRST_BUCKET = 0, 1, 2, 3
+
+def _new_stat():
+    return [0, 0.0, 0.0] + [0] * len(BUCKETS)
+
+def _add(stat, seconds):
+    stat[_COUNT] += 1
+    stat[_TOTAL] += seconds
+    if seconds > stat[_MAX]:
+        stat[_MAX] = seconds
+    for i, bound in enumerate(BUCKETS):
+        if seconds <= bound:
+            stat[_FIRST_BUCKET + i] += 1
+            break
+
+def _merge(into, stat):
+    into[_COUNT] += stat[_COUNT]
+    into[_TOTAL] += stat[_TOTAL]
+    into[_MAX] = max(into[_MAX], stat[_MAX])
+    for i in range(_FIRST_BUCKET, len(stat)):
+        into[i] += stat[i]
+
+class MetricsRegistry:
+    """
+    Process-wide span statistics keyed by (page, span name).
+
+    Every thread records into its own shard, so the hot path never takes a lock; shards
+    of finished threads (Streamlit runs each rerun in a script thread) are folded into a
+    retired total when the registry is read. Readers serialize among themselves only.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = {}  # id(shard) -> (owning thread, shard); single-key updates are atomic
+        self._retired = {}
+        self._read_lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = {}
+            self._shards[id(shard)] = (threading.current_thread(), shard)
+        return shard
+
+    def record(self, page, name, seconds):
+        shard = self._shard()
+        stat = shard.get((page, name))
+        if stat is None:
+            stat = shard[(page, name)] = _new_stat()
+        _add(stat, seconds)
+
+    def snapshot(self):
+        """Return {(page, name): stat} merged over every thread."""
+        with self._read_lock:
+            merged = {key: list(stat) for key, stat in self._retired.items()}
+            for shard_id, (thread, shard) in list(self._shards.items()):
+                # A copy of a dict is taken atomically; a stat may be mid-update (off by one span)
+                items = list(shard.copy().items())
+                if not thread.is_alive():
+                    for key, stat in items:
+                        _merge(self._retired.setdefault(key, _new_stat()), stat)
+                    del self._shards[shard_id]
+                for key, stat in items:
+                    _merge(merged.setdefault(key, _new_stat()), stat)
+            return merged
+
+    def reset(self):
+        with self._read_lock:
+            self._retired.clear()
+            for _, shard in list(self._shards.values()):
+                shard.clear()
+
+# A module-level instance rather than st.cache_resource: record() runs on every span and
+# must stay a few attribute lookups
+_REGISTRY = MetricsRegistry()
+
+def get_metrics_registry():
+    """Return the metrics registry shared by every session in this process."""
+    return _REGISTRY
+
+# Collector name -> callable returning {metric: number}
+_COLLECTORS = {}
+
+def register_collector(name, collect):
+    """Export the counters returned by collect() as <name>_<metric> (replaces a collector of the same name)."""
+    _COLLECTORS[name] = collect
+
+def collector_metrics():
+    """Return {collector name: {metric: value}} for every registered collector."""
+    return {name: collect() for name, collect in list(_COLLECTORS.items())}
+
+_context = threading.local()
+
+def _current():
+    # (page, session state dict or None, rerun start) of the rerun running in this thread
+    return getattr(_context, 'page', NO_PAGE), getattr(_context, 'session', None), getattr(_context, 'started', None)
+
+def record(name, seconds, started=None):
+    """Record one finished span of `seconds` for the current page and session."""
+    page, session, rerun_started = _current()
+    _REGISTRY.record(page, name, seconds)
+    if session is not None:
+        stat = session['stats'].get((page, name))
+        if stat is None:
+            stat = session['stats'][(page, name)] = _new_stat()
+        _add(stat, seconds)
+        spans = session['spans']
+        if len(spans) < MAX_RERUN_SPANS and started is not None and rerun_started is not None:
+            spans.append((started - rerun_started, getattr(_context, 'depth', 0), name, seconds))
+
+@contextmanager
+def timer(name):
+    """Time the enclosed block as span `name` (nested spans are recorded too)."""
+    depth = getattr(_context, 'depth', 0)
+    _context.depth = depth + 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        _context.depth = depth
+        record(name, seconds, started)
+
+def timed(name=None):
+    """Decorator: time every call of the function as span `name` (default: module.function)."""
+    def decorate(func):
+        span = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(span):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+@contextmanager
+def page_scope(page):
+    """
+    Attribute the spans of a rerun to `page` and the current session, timing the whole
+    rerun as span 'rerun'. Wrap the page's run() with it in the app script.
+    """
+    session = st.session_state.setdefault(SESSION_STATE_KEY, {'stats': {}, 'spans': [], 'page': page})
+    session['spans'] = []
+    session['page'] = page
+    previous = _current()
+    _context.page, _context.session, _context.started = page, session, time.perf_counter()
+    try:
+        with timer('rerun'):
+            yield
+    finally:
+        _context.page, _context.session, _context.started = previous
+
+def _summary(stat):
+    count = stat[_COUNT]
+    return {
+        'count': count,
+        'total_ms': round(stat[_TOTAL] * 1000, 3),
+        'mean_ms': round(stat[_TOTAL] * 1000 / count, 3) if count else 0.0,
+        'max_ms': round(stat[_MAX] * 1000, 3),
+    }
+
+def page_metrics():
+    """
+    Return the process-wide span statistics per page.
+
+    Returns:
+        dict: page -> span name -> {count, total_ms, mean_ms, max_ms}
+    """
+    pages = {}
+    for (page, name), stat in sorted(get_metrics_registry().snapshot().items()):
+        pages.setdefault(page, {})[name] = _summary(stat)
+    return pages
+
+def session_metrics():
+    """Return this session's span statistics per page (same shape as page_metrics)."""
+    pages = {}
+    session = st.session_state.get(SESSION_STATE_KEY)
+    for (page, name), stat in sorted((session or {}).get('stats', {}).items()):
+        pages.setdefault(page, {})[name] = _summary(stat)
+    return pages
+
+def last_rerun():
+    """Return this session's spans of its last rerun as (offset s, depth, name, seconds), in start order."""
+    session = st.session_state.get(SESSION_STATE_KEY)
+    return sorted((session or {}).get('spans', []))
+
+def export_json():
+    """Return the process-wide metrics as a JSON document."""
+    return json.dumps({'generated_at': time.time(), 'pages': page_metrics(), 'collectors': collector_metrics()}, indent=1)
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def export_prometheus(prefix='vividha'):
+    """Return the process-wide metrics in the Prometheus text exposition format (one histogram)."""
+    metric = f"{prefix}_span_duration_seconds"
+    lines = [f"# HELP {metric} Duration of instrumented spans (data loads, filters, figures, reruns).",
+             f"# TYPE {metric} histogram"]
+    for (page, name), stat in sorted(get_metrics_registry().snapshot().items()):
+        labels = f'page="{_label(page)}",span="{_label(name)}"'
+        cumulative = 0
+        for i, bound in enumerate(BUCKETS):
+            cumulative += stat[_FIRST_BUCKET + i]
+            lines.append(f'{metric}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {stat[_COUNT]}')
+        lines.append(f'{metric}_sum{{{labels}}} {stat[_TOTAL]:.6f}')
+        lines.append(f'{metric}_count{{{labels}}} {stat[_COUNT]}')
+    for name, values in sorted(collector_metrics().items()):
+        for key, value in sorted(values.items()):
+            lines.append(f"# TYPE {prefix}_{name}_{key} gauge")
+            lines.append(f"{prefix}_{name}_{key} {value}")
+    return '\n'.join(lines) + '\n'
+
+def debug_panel_enabled():
+    """Return whether the timing panel is on (VIVIDHA_DEBUG_PANEL=1 or ?debug=1)."""
+    return os.getenv(DEBUG_PANEL_ENV) == '1' or st.query_params.get('debug') == '1'
+
+def render_debug_panel():
+    """Sidebar panel: this session's last rerun as a timing overlay, per-page totals and exports."""
+    session = st.session_state.get(SESSION_STATE_KEY)
+    if session is None:
+        return
+    page = session['page']
+    with st.sidebar.expander("⏱ Performance", expanded=True):
+        spans = last_rerun()
+        rerun = next((seconds for _, depth, name, seconds in spans if name == 'rerun' and depth == 0), None)
+        if rerun is not None:
+            st.caption(f"Last rerun of {page}: {rerun * 1000:,.0f} ms")
+        st.dataframe(
+            [{'span': '  ' * (depth - 1) + name, 'start ms': round(offset * 1000, 1), 'ms': round(seconds * 1000, 2)}
+             for offset, depth, name, seconds in spans if name != 'rerun'],
+            hide_index=True, use_container_width=True,
+        )
+        scope = st.radio("Totals for", ["This page, all sessions", "This page, this session"],
+                         key='debug_panel_scope', horizontal=True)
+        metrics = page_metrics() if scope.endswith("all sessions") else session_metrics()
+        st.dataframe(
+            [{'span': name, **summary} for name, summary in metrics.get(page, {}).items()],
+            hide_index=True, use_container_width=True,
+        )
+        for name, values in collector_metrics().items():
+            st.caption(f"{name}: " + ", ".join(f"{key} {value:,}" for key, value in values.items()))
+        json_col, prometheus_col = st.columns(2)
+        with json_col:
+            st.download_button("JSON", export_json(), file_name='vividha_metrics.json', mime='application/json')
+        with prometheus_col:
+            st.download_button("Prometheus", export_prometheus(), file_name='vividha_metrics.prom', mime='text/plain')
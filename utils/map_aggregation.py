@@ -0,0 +1,71 @@
+"""
+Server-side aggregation of map points.
+
+Above a row threshold, points are binned into a lat/lon grid whose cell size follows the
+map zoom level, and one marker per cell is sent to the browser with the number of sites
+it stands for. The grid is coarsened until the number of cells fits the threshold, so the
+map payload stays bounded however large the catalogue grows.
+"""
+import numpy as np
+import pandas as pd
+
+# Up to this many points are drawn individually
+MAX_RAW_POINTS = 2000
+# Grid cells per 360 degrees of longitude at zoom 0; doubles with every zoom level
+CELLS_AT_ZOOM_0 = 8
+
+def cell_size(zoom):
+    """Return the grid cell size in degrees for a map zoom level."""
+    return 360.0 / (CELLS_AT_ZOOM_0 * 2 ** zoom)
+
+def _dominant(cells, values):
+    # Most frequent value per cell (ties broken by first seen), without a Python loop per cell
+    counts = pd.DataFrame({'cell': cells, 'value': values}).value_counts(sort=False).reset_index(name='n')
+    counts = counts.sort_values(['cell', 'n'], ascending=[True, False], kind='stable')
+    return counts.drop_duplicates('cell').set_index('cell')['value']
+
+def aggregate_points(df, zoom, max_points=MAX_RAW_POINTS, lat='Latitude', lon='Longitude',
+                     size_column='tourism_visibility', color_column='preservation_status', label_column='region'):
+    """
+    Bin map points into grid cells when there are more than max_points of them.
+
+    Parameters:
+        df (pandas.DataFrame): Points with lat/lon columns
+        zoom (int): Map zoom level the grid is sized for
+        max_points (int): Row threshold, and the maximum number of cells returned
+
+    Returns:
+        tuple[pandas.DataFrame, bool]: The points (df itself when below the threshold) and
+            whether they were aggregated. Aggregated rows have lat/lon (cell centroid),
+            'count', the mean of size_column, and the most common color_column and label_column.
+    """
+    if len(df) <= max_points:
+        return df, False
+
+    latitudes = df[lat].to_numpy()
+    longitudes = df[lon].to_numpy()
+    size = cell_size(zoom)
+    while True:
+        rows = np.floor(latitudes / size).astype(np.int64)
+        cols = np.floor(longitudes / size).astype(np.int64)
+        # One int64 key per cell (cols fit in 32 bits at any useful zoom), hashed in one pass
+        inverse, cells = pd.factorize((rows << 32) + (cols & 0xFFFFFFFF))
+        if len(cells) <= max_points:
+            break
+        size *= 2
+
+    counts = np.bincount(inverse)
+    aggregated = pd.DataFrame({
+        lat: np.bincount(inverse, weights=latitudes) / counts,
+        lon: np.bincount(inverse, weights=longitudes) / counts,
+        'count': counts,
+    })
+    if size_column in df.columns:
+        values = pd.to_numeric(df[size_column], errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        totals = np.bincount(inverse[valid], weights=values[valid], minlength=len(counts))
+        aggregated[size_column] = totals / np.maximum(np.bincount(inverse[valid], minlength=len(counts)), 1)
+    for column in (color_column, label_column):
+        if column in df.columns:
+            aggregated[column] = _dominant(inverse, df[column].to_numpy()).reindex(range(len(counts))).to_numpy()
+    return aggregated, True
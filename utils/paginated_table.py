@@ -0,0 +1,138 @@
+"""
+Paginated table component.
+
+Search, sort and paging run against the data source, and only the visible page is sent to
+the browser, so a table renders in roughly constant time however many rows it has.
+A source is any object with a `columns` list and a
+`page(offset, limit, sort=None, ascending=True, search=None)` method returning
+`(page_df, total_matching_rows)`; DataFrame and artifact registry sources are provided.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.dataloader import dataset_fingerprint, load_dataset
+from utils.instrumentation import timer
+
+DEFAULT_PAGE_SIZE = 25
+
+class DataFrameSource:
+    """
+    Table source over an in-memory DataFrame.
+
+    Parameters:
+        df (pandas.DataFrame): Rows to page through; never modified
+        search_columns (list[str]): Columns searched for the search text (default: text columns)
+
+    Sort orders are computed once per column and reused for every page.
+    """
+
+    def __init__(self, df, search_columns=None):
+        self.df = df
+        self.columns = list(df.columns)
+        self.search_columns = search_columns or [c for c in df.columns
+                                                 if pd.api.types.is_object_dtype(df[c]) or pd.api.types.is_string_dtype(df[c])]
+        self._orders = {}
+
+    def _order(self, column):
+        # Row positions in ascending order of column (missing values last), computed once per column
+        order = self._orders.get(column)
+        if order is None:
+            order = self._orders[column] = self.df[column].argsort(kind='stable').to_numpy()
+        return order
+
+    def _matches(self, search):
+        mask = np.zeros(len(self.df), dtype=bool)
+        for column in self.search_columns:
+            mask |= self.df[column].astype(str).str.contains(search, case=False, regex=False, na=False).to_numpy()
+        return mask
+
+    def page(self, offset, limit, sort=None, ascending=True, search=None):
+        positions = np.arange(len(self.df)) if sort is None else self._order(sort)
+        if sort is not None and not ascending:
+            positions = positions[::-1]
+        if search:
+            positions = positions[self._matches(search)[positions]]
+        return self.df.iloc[positions[offset:offset + limit]], len(positions)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _dataset_source(name, fingerprint):
+    return DataFrameSource(load_dataset(name))
+
+def dataset_source(name):
+    """Return a DataFrameSource over a registered dataset, shared across sessions per dataset version."""
+    return _dataset_source(name, dataset_fingerprint(name))
+
+class RegistrySource:
+    """
+    Table source over the artifact registry; paging, sorting and search run as SQLite queries.
+
+    Parameters:
+        registry (utils.artifact_registry.ArtifactRegistry): Registry to read
+        location (str): Only submissions for this location
+    """
+
+    columns = ['id', 'name', 'location', 'description', 'submitted_on']
+
+    def __init__(self, registry, location=None):
+        self.registry = registry
+        self.location = location
+
+    def page(self, offset, limit, sort=None, ascending=True, search=None):
+        if sort is None:
+            # Default order: newest submission first
+            sort, ascending = 'id', False
+        rows = self.registry.page(limit, offset, location=self.location, order_by=sort,
+                                  ascending=ascending, search=search)
+        return rows, self.registry.count(self.location, search=search)
+
+def paginated_table(source, key, page_size=DEFAULT_PAGE_SIZE, sortable=True, searchable=True):
+    """
+    Render a searchable, sortable table one page at a time.
+
+    Parameters:
+        source: Table source (see module docstring)
+        key (str): Unique widget key prefix for this table
+        page_size (int): Rows per page
+        sortable (bool): Show the sort controls
+        searchable (bool): Show the search box
+
+    Returns:
+        pandas.DataFrame: The rows on the visible page
+    """
+    search, sort, ascending = None, None, True
+    if searchable or sortable:
+        search_col, sort_col, order_col = st.columns([3, 2, 1])
+        if searchable:
+            with search_col:
+                search = st.text_input("Search", key=f"{key}_search", placeholder="Type to filter rows").strip() or None
+        if sortable:
+            with sort_col:
+                sort = st.selectbox("Sort by", ["(default)"] + list(source.columns), key=f"{key}_sort")
+                sort = None if sort == "(default)" else sort
+            with order_col:
+                ascending = not st.checkbox("Descending", key=f"{key}_descending")
+
+    # Back to the first page whenever the search or sort changes
+    page_key = f"{key}_page"
+    view = (search, sort, ascending)
+    if st.session_state.get(f"{key}_view") != view:
+        st.session_state[f"{key}_view"] = view
+        st.session_state[page_key] = 1
+    page = st.session_state.get(page_key, 1)
+
+    with timer('filter.paginated_table'):
+        rows, total = source.page((page - 1) * page_size, page_size, sort=sort, ascending=ascending, search=search)
+    n_pages = max(1, -(-total // page_size))
+    if page > n_pages:
+        # The table shrank (e.g. a new dataset version); show its last page
+        page = st.session_state[page_key] = n_pages
+        rows, total = source.page((page - 1) * page_size, page_size, sort=sort, ascending=ascending, search=search)
+
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    info_col, page_col = st.columns([3, 1])
+    with page_col:
+        st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+    with info_col:
+        first = (page - 1) * page_size + 1 if total else 0
+        st.caption(f"Rows {first:,}-{min(page * page_size, total):,} of {total:,} (page {page} of {n_pages})")
+    return rows
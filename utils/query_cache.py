@@ -0,0 +1,215 @@
+"""
+Process-wide cache of Snowflake query results.
+
+Results are DataFrames keyed by the query (or table read) and its parameters, shared by
+all sessions. Each entry lives for its table's TTL; after that it is still served, while
+one background thread re-runs the query (stale-while-revalidate), until it is older than
+TTL + max stale, when the next read reloads it synchronously. Concurrent misses on one key
+run the query once. The cache keeps the total in-memory size of its frames under a byte
+budget by evicting the least recently used ones, and counts hits, stale hits, misses,
+refreshes and evictions (exported with the instrumentation metrics).
+
+Cached frames are shared: never modify one, copy it first.
+"""
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+import streamlit as st
+from utils.instrumentation import register_collector
+
+# Seconds a table's query results stay fresh; tables not listed use DEFAULT_TTL
+TABLE_TTLS = {
+    'cultural_data': 3600,
+    'art_forms': 3600,
+    'cultural_experiences': 1800,
+    'heritage_sites': 900,
+    'tourism_stats': 900,
+}
+DEFAULT_TTL = 600
+# How long past its TTL an entry may still be served while it is refreshed, as a multiple of the TTL
+MAX_STALE_FACTOR = 1.0
+DEFAULT_BYTE_BUDGET = int(float(os.getenv('VIVIDHA_QUERY_CACHE_MB', '256')) * 2**20)
+
+_FROM_TABLE = re.compile(r'\bFROM\s+([A-Za-z_][A-Za-z0-9_$.]*)', re.IGNORECASE)
+
+def query_table(query):
+    """Return the (unqualified, lower-case) name of the first table a SQL query reads, or None."""
+    match = _FROM_TABLE.search(query)
+    return match.group(1).rsplit('.', 1)[-1].lower() if match else None
+
+def table_ttl(table):
+    return TABLE_TTLS.get((table or '').lower(), DEFAULT_TTL)
+
+def frame_bytes(df):
+    """Return the in-memory size of a DataFrame, including its Python string objects."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+def _freeze(value):
+    # Hashable form of query parameters and filter specs
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+def cache_key(*parts):
+    """Build a cache key from a query description (SQL, table, columns, params, filters...)."""
+    return _freeze(parts)
+
+class _Entry:
+    __slots__ = ('value', 'nbytes', 'loaded_at', 'ttl', 'refreshing')
+
+    def __init__(self, value, ttl):
+        self.value = value
+        self.nbytes = frame_bytes(value)
+        self.loaded_at = time.monotonic()
+        self.ttl = ttl
+        self.refreshing = False
+
+class _Pending:
+    # A load in progress that other readers of the same key wait for
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+class QueryCache:
+    """
+    Thread-safe, byte-bounded LRU of query results with per-table TTLs.
+
+    Parameters:
+        byte_budget (int): Total size of the cached frames before LRU eviction
+        max_stale_factor (float): Stale entries are served (and refreshed in the
+            background) for up to this many TTLs past their expiry
+    """
+
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET, max_stale_factor=MAX_STALE_FACTOR):
+        self.byte_budget = byte_budget
+        self.max_stale_factor = max_stale_factor
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> _Entry
+        self._pending = {}  # key -> _Pending
+        self.bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, loader, table=None, ttl=None, refresh=None):
+        """
+        Return the cached result for key, loading it with loader() on a miss.
+
+        Parameters:
+            key: Hashable query description (see cache_key)
+            loader (callable): Runs the query and returns a DataFrame; exceptions propagate
+                and nothing is cached
+            table (str): Table the query reads, which selects its TTL
+            ttl (float): Seconds the result stays fresh (default: the table's TTL)
+            refresh (callable): Re-runs the query in a background thread when a stale
+                entry is served (default: loader)
+
+        Returns:
+            pandas.DataFrame: Shared result; do not modify it
+        """
+        ttl = table_ttl(table) if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry.loaded_at
+                if age <= entry.ttl * (1 + self.max_stale_factor):
+                    self._entries.move_to_end(key)
+                    if age <= entry.ttl:
+                        self.hits += 1
+                        return entry.value
+                    self.stale_hits += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(target=self._refresh, args=(key, refresh or loader, ttl),
+                                         name='vividha-query-refresh', daemon=True).start()
+                    return entry.value
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = _Pending()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+        try:
+            pending.value = loader()
+            self._store(key, pending.value, ttl)
+            return pending.value
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.done.set()
+
+    def _refresh(self, key, loader, ttl):
+        try:
+            value = loader()
+        except Exception:
+            # Keep serving the stale result; the next read past max stale retries synchronously
+            with self._lock:
+                self.refresh_failures += 1
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+        with self._lock:
+            self.refreshes += 1
+        self._store(key, value, ttl)
+
+    def _store(self, key, value, ttl):
+        if value is None:
+            return
+        entry = _Entry(value, ttl)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.nbytes
+            if entry.nbytes > self.byte_budget:
+                return  # larger than the whole budget: served once, never cached
+            self._entries[key] = entry
+            self.bytes += entry.nbytes
+            while self.bytes > self.byte_budget:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def invalidate(self, table=None):
+        """Drop every entry (or those whose key names `table`) so the next read reloads it."""
+        with self._lock:
+            for key in [k for k in self._entries if table is None or table in k]:
+                self.bytes -= self._entries.pop(key).nbytes
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries), 'bytes': self.bytes, 'byte_budget': self.byte_budget,
+                'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses,
+                'coalesced': self.coalesced, 'refreshes': self.refreshes,
+                'refresh_failures': self.refresh_failures, 'evictions': self.evictions,
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_query_cache():
+    """Return the query cache shared by every session in this process."""
+    cache = QueryCache()
+    register_collector('query_cache', cache.stats)
+    return cache
@@ -0,0 +1,206 @@
+"""
+Content-based "related art forms" recommender.
+
+Each art form is described by a TF-IDF vector of its description, one-hot region and
+preservation status, and its cultural value and tourism visibility scores. The top-k
+most cosine-similar art forms are precomputed into a compact (n, k) int32 neighbour
+array persisted in data/.cache/, so serving recommendations is a single row read.
+
+When art_forms.csv or cultural_data.csv changes, only the neighbour lists that can be
+affected are recomputed: changed or new art forms get a full search, lists that
+referenced a changed or removed art form are rebuilt, and every other list is re-scored
+and merged with the changed art forms. Re-scored lists can miss a pair whose similarity
+rose only because TF-IDF weights drifted, so rebuild everything exactly with:
+
+    python -m utils.recommender --rebuild
+"""
+import argparse
+import os
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils.dataloader import CACHE_DIR, dataset_fingerprint, load_dataset
+
+RECOMMENDATIONS_PATH = os.path.join(CACHE_DIR, 'recommendations.npz')
+TOP_K = 10
+# Above this share of changed rows a full rebuild is cheaper than an incremental update
+REBUILD_FRACTION = 0.25
+BLOCK_ROWS = 1024
+
+# Feature group weights (before the final L2 normalization)
+TEXT_WEIGHT = 1.0
+REGION_WEIGHT = 0.5
+STATUS_WEIGHT = 0.3
+SCORE_WEIGHT = 0.3
+SCORE_COLUMNS = ['cultural_value', 'tourism_visibility']
+
+def art_form_table():
+    """Return one row per art form: art_forms.csv joined with its cultural_data attributes."""
+    assets = load_dataset('art_forms').drop_duplicates('art_form')
+    data = load_dataset('cultural_data').drop_duplicates('art_form')
+    table = assets[['art_form', 'region', 'description']].merge(
+        data[['art_form', 'preservation_status'] + SCORE_COLUMNS], on='art_form', how='left')
+    return table.reset_index(drop=True)
+
+def feature_matrix(table):
+    """Return the L2-normalized sparse feature matrix of an art form table (one row per art form)."""
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.preprocessing import normalize
+
+    text = TfidfVectorizer(stop_words='english', sublinear_tf=True).fit_transform(
+        table['description'].fillna('').astype(str))
+    region = sparse.csr_matrix(pd.get_dummies(table['region'].fillna(''), dtype=float).to_numpy())
+    status = sparse.csr_matrix(pd.get_dummies(table['preservation_status'].fillna(''), dtype=float).to_numpy())
+    # Scores are 0-100 indices; a fixed scale keeps existing rows' vectors stable when rows are added
+    scores = sparse.csr_matrix(table[SCORE_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0).to_numpy() / 100.0)
+    features = sparse.hstack([text * TEXT_WEIGHT, region * REGION_WEIGHT, status * STATUS_WEIGHT, scores * SCORE_WEIGHT])
+    return normalize(features.tocsr())
+
+def row_hashes(table):
+    """Return one 64-bit content hash per art form row."""
+    return pd.util.hash_pandas_object(table, index=False).to_numpy()
+
+def _top_k(scores, k):
+    # Column positions of the k largest scores per row, best first
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(part, order, axis=1)
+
+def _search(features, rows, k):
+    # Exact top-k over every art form for the given rows, in blocks to bound memory
+    neighbours = np.empty((len(rows), k), dtype=np.int32)
+    scores = np.empty((len(rows), k), dtype=np.float32)
+    for start in range(0, len(rows), BLOCK_ROWS):
+        block = rows[start:start + BLOCK_ROWS]
+        similarity = (features[block] @ features.T).toarray()
+        similarity[np.arange(len(block)), block] = -np.inf  # never recommend the art form itself
+        top = _top_k(similarity, k)
+        neighbours[start:start + len(block)] = top
+        scores[start:start + len(block)] = np.take_along_axis(similarity, top, axis=1)
+    return neighbours, scores
+
+def build(table, previous=None, k=TOP_K):
+    """
+    Compute the neighbour table for an art form table, reusing `previous` where possible.
+
+    Parameters:
+        table (pandas.DataFrame): Output of art_form_table()
+        previous (dict): A state returned by build() / load_state(), or None
+        k (int): Neighbours kept per art form
+
+    Returns:
+        dict: keys (art forms), hashes, neighbours (int32 positions into keys), scores (float32)
+    """
+    keys = np.asarray(table['art_form'].astype(str).tolist(), dtype=str)  # fixed-width, saved without pickle
+    hashes = row_hashes(table)
+    n = len(keys)
+    k = max(0, min(k, n - 1))
+    if (previous is not None and previous['neighbours'].shape == (n, k)
+            and np.array_equal(previous['keys'], keys) and np.array_equal(previous['hashes'], hashes)):
+        # Nothing changed: skip featurization (and the scikit-learn import) entirely
+        return previous
+    state = {'keys': keys, 'hashes': hashes,
+             'neighbours': np.empty((n, k), dtype=np.int32), 'scores': np.empty((n, k), dtype=np.float32)}
+    if k == 0:
+        return state
+    features = feature_matrix(table)
+
+    if previous is not None and previous['neighbours'].shape[1] == k:
+        old_position = {key: i for i, key in enumerate(previous['keys'])}
+        old_rows = np.array([old_position.get(key, -1) for key in keys])
+        known = old_rows >= 0
+        changed = ~known
+        changed[known] = previous['hashes'][old_rows[known]] != hashes[known]
+        removed = len(previous['keys']) - known.sum()
+        if changed.sum() + removed <= REBUILD_FRACTION * n:
+            _update(state, features, previous, old_rows, changed, k)
+            return state
+
+    state['neighbours'], state['scores'] = _search(features, np.arange(n), k)
+    return state
+
+def _update(state, features, previous, old_rows, changed, k):
+    # Old neighbour positions translated to new positions (-1: art form removed)
+    new_position = np.full(len(previous['keys']), -1)
+    new_position[old_rows[old_rows >= 0]] = np.flatnonzero(old_rows >= 0)
+    kept = np.flatnonzero(~changed)
+    old_lists = new_position[previous['neighbours'][old_rows[kept]]]
+    # Lists that point at a removed or changed art form are searched again in full
+    stale = (old_lists < 0).any(axis=1) | changed[np.maximum(old_lists, 0)].any(axis=1)
+    full = np.concatenate([np.flatnonzero(changed), kept[stale]])
+    if len(full):
+        state['neighbours'][full], state['scores'][full] = _search(features, full, k)
+
+    merge = kept[~stale]
+    if len(merge):
+        candidates = old_lists[~stale]
+        # Exact scores of the kept neighbours under the current feature vectors...
+        rows = features[merge]
+        scores = np.column_stack([np.asarray(rows.multiply(features[candidates[:, j]]).sum(axis=1)).ravel()
+                                  for j in range(k)])
+        # ...merged with the scores against every changed art form
+        changed_rows = np.flatnonzero(changed)
+        if len(changed_rows):
+            candidates = np.hstack([candidates, np.broadcast_to(changed_rows, (len(merge), len(changed_rows)))])
+            scores = np.hstack([scores, (rows @ features[changed_rows].T).toarray()])
+        top = _top_k(scores, k)
+        state['neighbours'][merge] = np.take_along_axis(candidates, top, axis=1)
+        state['scores'][merge] = np.take_along_axis(scores, top, axis=1)
+
+def save_state(state, path=RECOMMENDATIONS_PATH):
+    """Persist a neighbour table (written to a temp file, then renamed)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp.npz'
+    np.savez(tmp_path, **state)
+    os.replace(tmp_path, path)
+
+def load_state(path=RECOMMENDATIONS_PATH):
+    """Return the persisted neighbour table, or None if there is none (or it is unreadable)."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return {name: data[name] for name in ('keys', 'hashes', 'neighbours', 'scores')}
+    except (OSError, KeyError, ValueError):
+        return None
+
+def refresh(rebuild=False, path=RECOMMENDATIONS_PATH):
+    """Bring the persisted neighbour table up to date with the datasets and return it."""
+    previous = None if rebuild else load_state(path)
+    state = build(art_form_table(), previous)
+    if state is not previous:
+        save_state(state, path)
+    return state
+
+class Recommender:
+    """Serves related art forms from a neighbour table."""
+
+    def __init__(self, state):
+        self.keys = state['keys']
+        self.neighbours = state['neighbours']
+        self.scores = state['scores']
+        self._position = {key: i for i, key in enumerate(self.keys)}
+
+    def related(self, art_form, k=3):
+        """Return up to k art forms most similar to art_form (an empty list if it is unknown)."""
+        position = self._position.get(art_form)
+        if position is None:
+            return []
+        return self.keys[self.neighbours[position, :k]].tolist()
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _recommender(fingerprints):
+    return Recommender(refresh())
+
+def get_recommender():
+    """Return the recommender for the current dataset versions, shared across sessions."""
+    return _recommender((dataset_fingerprint('art_forms'), dataset_fingerprint('cultural_data')))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute related art forms.")
+    parser.add_argument('--rebuild', action='store_true', help="Recompute every neighbour list")
+    args = parser.parse_args(argv)
+    state = refresh(rebuild=args.rebuild)
+    print(f"{len(state['keys'])} art forms, top {state['neighbours'].shape[1]} neighbours -> {RECOMMENDATIONS_PATH}")
+
+if __name__ == '__main__':
+    main()
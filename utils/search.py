@@ -0,0 +1,296 @@
+"""
+Full-text search over art forms, cultural experiences, heritage sites and artifact submissions.
+
+Documents are tokenized with a transliteration-friendly normalization (accents stripped,
+common romanization variants folded, e.g. Orissa/Odisha, 'sh'/'s', 'aa'/'a'), so queries
+match however an Indian name is spelled. An inverted index of field-weighted term
+frequencies answers ranked queries; the last query word is also matched as a prefix for
+typeahead. The index is persisted to data/.cache/ per dataset version and picks up new
+artifact registry submissions incrementally by tailing the registry.
+"""
+import gzip
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+import streamlit as st
+from utils.artifact_registry import get_artifact_registry
+from utils.dataloader import CACHE_DIR, dataset_fingerprint, load_dataset
+
+SEARCH_INDEX_PATH = os.path.join(CACHE_DIR, 'search_index.json.gz')
+INDEX_FORMAT = 1
+# Relative weight of a term occurring in each field
+FIELD_WEIGHTS = {'title': 3.0, 'region': 2.0, 'text': 1.0}
+# Score factor for a prefix (typeahead) match of the last query word
+PREFIX_FACTOR = 0.7
+MAX_PREFIX_TERMS = 50
+# Score factor for documents whose whole title is the query (e.g. 'Madhubani' over 'Madhubani Painting Workshop')
+EXACT_TITLE_FACTOR = 1.5
+# Registry submissions indexed between two saves of the index file
+SAVE_EVERY = 50
+
+# Indexed datasets: name -> (kind, title column, region columns, text columns)
+SEARCH_SOURCES = {
+    'art_forms': ('Art form', 'art_form', ['region'], ['description']),
+    'cultural_experiences': ('Experience', 'experience', ['location', 'type'], ['description', 'season']),
+    'heritage_sites': ('Heritage site', 'site', ['region'], ['status', 'notes']),
+}
+ARTIFACT_KIND = 'Artifact'
+
+# Former or alternative names -> the name they are indexed under
+PLACE_ALIASES = {
+    'orissa': 'odisha', 'bombay': 'mumbai', 'calcutta': 'kolkata', 'madras': 'chennai',
+    'bangalore': 'bengaluru', 'mysore': 'mysuru', 'cochin': 'kochi', 'trivandrum': 'thiruvananthapuram',
+    'pondicherry': 'puducherry', 'benares': 'varanasi', 'banaras': 'varanasi', 'kashi': 'varanasi',
+    'gurgaon': 'gurugram', 'allahabad': 'prayagraj', 'baroda': 'vadodara', 'poona': 'pune',
+    'simla': 'shimla', 'panjim': 'panaji', 'mangalore': 'mangaluru', 'calicut': 'kozhikode',
+    'uttaranchal': 'uttarakhand', 'gauhati': 'guwahati', 'tanjore': 'thanjavur',
+}
+# Romanization variants folded to one spelling (applied in order)
+_FOLDS = [
+    (re.compile(r'([bcdgjkpt])h'), r'\1'),  # aspirates: bh->b, dh->d, kh->k, th->t ...
+    (re.compile(r'sh'), 's'),
+    (re.compile(r'ph'), 'f'),
+    (re.compile(r'w'), 'v'),
+    (re.compile(r'z'), 'j'),
+    (re.compile(r'ee|ii'), 'i'),
+    (re.compile(r'oo|uu'), 'u'),
+    (re.compile(r'(.)\1+'), r'\1'),  # doubled letters: aa->a, tt->t
+]
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+def fold(token):
+    """Return the canonical spelling of one lowercase ASCII token."""
+    token = PLACE_ALIASES.get(token, token)
+    for pattern, replacement in _FOLDS:
+        token = pattern.sub(replacement, token)
+    return token
+
+def tokenize(text):
+    """Split text into normalized search terms."""
+    if not text:
+        return []
+    ascii_text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode('ascii').lower()
+    return [fold(token) for token in _TOKEN.findall(ascii_text)]
+
+class SearchIndex:
+    """
+    Inverted index of weighted term frequencies.
+
+    Documents are dicts with 'kind', 'title', 'region', 'text' and 'source' keys;
+    a document's id is its position in `docs`. All methods are thread-safe.
+    """
+
+    def __init__(self, docs=None, postings=None, registry_last_id=0, fingerprints=None):
+        self.docs = docs or []
+        self.postings = postings or {}
+        self.registry_last_id = registry_last_id
+        self.fingerprints = fingerprints
+        self._terms = None  # sorted vocabulary for prefix lookups, rebuilt when stale
+        self._title_keys = [' '.join(tokenize(doc['title'])) for doc in self.docs]
+        self._unsaved = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, kind, title, region='', text='', source=None):
+        """Index one document and return its id."""
+        with self._lock:
+            doc_id = len(self.docs)
+            self.docs.append({'kind': kind, 'title': title, 'region': region, 'text': text, 'source': source})
+            self._title_keys.append(' '.join(tokenize(title)))
+            weights = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize(self.docs[-1][field]):
+                    weights[term] = weights.get(term, 0.0) + weight
+            for term, weight in weights.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    self.postings[term] = {doc_id: weight}
+                    self._terms = None
+                else:
+                    postings[doc_id] = weight
+            return doc_id
+
+    def _vocabulary(self):
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return self._terms
+
+    def _prefix_terms(self, prefix):
+        terms = self._vocabulary()
+        start = bisect_left(terms, prefix)
+        matches = []
+        for term in terms[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _term_scores(self, term, factor=1.0):
+        postings = self.postings.get(term, {})
+        idf = math.log(1 + len(self.docs) / (1 + len(postings)))
+        return {doc_id: factor * idf * (1 + math.log(weight)) for doc_id, weight in postings.items()}
+
+    def search(self, query, limit=20, kinds=None, prefix=True):
+        """
+        Return the best matching documents for a query.
+
+        Every query word must match (the last one also as a prefix when `prefix` is set).
+        `kinds` limits the results to those document kinds (an empty list matches nothing).
+
+        Returns:
+            list[dict]: Documents with an added 'score', best first
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        with self._lock:
+            scores = None
+            for i, term in enumerate(terms):
+                term_scores = self._term_scores(term)
+                if prefix and i == len(terms) - 1:
+                    for other in self._prefix_terms(term):
+                        if other != term:
+                            for doc_id, score in self._term_scores(other, PREFIX_FACTOR).items():
+                                term_scores[doc_id] = max(term_scores.get(doc_id, 0.0), score)
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {doc_id: score + term_scores[doc_id] for doc_id, score in scores.items() if doc_id in term_scores}
+                if not scores:
+                    return []
+            if kinds is not None:
+                scores = {doc_id: score for doc_id, score in scores.items() if self.docs[doc_id]['kind'] in kinds}
+            query_key = ' '.join(terms)
+            for doc_id in scores:
+                if self._title_keys[doc_id] == query_key:
+                    scores[doc_id] *= EXACT_TITLE_FACTOR
+            best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+            return [dict(self.docs[doc_id], score=round(score, 3)) for doc_id, score in best]
+
+    def suggest(self, prefix, limit=8):
+        """Return up to `limit` document titles whose words start with the last word of prefix."""
+        seen = []
+        for doc in self.search(prefix, limit=limit * 3):
+            if doc['title'] not in seen:
+                seen.append(doc['title'])
+        return seen[:limit]
+
+    def sync_registry(self, registry, batch=500):
+        """Index artifact submissions newer than the last one indexed; return how many were added."""
+        added = 0
+        with self._lock:
+            while True:
+                rows = registry.tail(self.registry_last_id, limit=batch)
+                for row in rows.itertuples(index=False):
+                    self.add(ARTIFACT_KIND, row.name, row.location, row.description, source=f"registry:{row.id}")
+                    self.registry_last_id = row.id
+                added += len(rows)
+                if len(rows) < batch:
+                    break
+            self._unsaved += added
+        return added
+
+    def checkpoint(self, min_unsaved=0):
+        """
+        Return to_dict() and mark its documents saved, atomically; None if fewer than
+        min_unsaved documents were added since the last checkpoint.
+        """
+        with self._lock:
+            if self._unsaved < min_unsaved:
+                return None
+            data = self.to_dict()
+            self._unsaved = 0
+            return data
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'format': INDEX_FORMAT,
+                'fingerprints': self.fingerprints,
+                'registry_last_id': self.registry_last_id,
+                'docs': self.docs,
+                'postings': {term: list(postings.items()) for term, postings in self.postings.items()},
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        postings = {term: {doc_id: weight for doc_id, weight in items} for term, items in data['postings'].items()}
+        return cls(data['docs'], postings, data['registry_last_id'], data['fingerprints'])
+
+def source_fingerprints():
+    """Return the versions of the indexed datasets; a change means the index is rebuilt."""
+    return [[name, *dataset_fingerprint(name)] for name in SEARCH_SOURCES]
+
+def build_index():
+    """Build an index over every dataset in SEARCH_SOURCES (registry submissions are added by sync_registry)."""
+    index = SearchIndex(fingerprints=source_fingerprints())
+    for name, (kind, title_column, region_columns, text_columns) in SEARCH_SOURCES.items():
+        df = load_dataset(name)
+        columns = [title_column] + region_columns + text_columns
+        for row in df[columns].fillna('').astype(str).itertuples(index=False):
+            values = dict(zip(columns, row))
+            index.add(kind, values[title_column],
+                      ' '.join(values[c] for c in region_columns),
+                      ' '.join(values[c] for c in text_columns),
+                      source=name)
+    return index
+
+def save_index(index, path=SEARCH_INDEX_PATH, min_unsaved=0):
+    """Write the index atomically (gzip-compressed JSON), unless fewer than min_unsaved documents are new."""
+    data = index.checkpoint(min_unsaved)
+    if data is None:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def load_index(path=SEARCH_INDEX_PATH):
+    """Return the persisted index if it matches the current datasets, else None."""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('format') != INDEX_FORMAT or data.get('fingerprints') != source_fingerprints():
+        return None
+    return SearchIndex.from_dict(data)
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _search_index(fingerprints):
+    registry = get_artifact_registry()
+    index = load_index()
+    # A registry behind the index was recreated: its ids restarted and indexed submissions are gone
+    if index is None or index.registry_last_id > registry.latest_id():
+        index = build_index()
+        index.sync_registry(registry)
+        save_index(index)
+    return index
+
+def get_search_index():
+    """
+    Return the search index for the current dataset versions, shared across sessions,
+    with any new artifact submissions indexed.
+    """
+    registry = get_artifact_registry()
+    fingerprints = json.dumps(source_fingerprints())
+    index = _search_index(fingerprints)
+    if index.registry_last_id > registry.latest_id():
+        _search_index.clear()
+        index = _search_index(fingerprints)
+    index.sync_registry(registry)
+    save_index(index, min_unsaved=SAVE_EVERY)
+    return index
+
+if __name__ == '__main__':
+    index = build_index()
+    index.sync_registry(get_artifact_registry())
+    save_index(index)
+    print(f"Indexed {len(index)} documents, {len(index.postings)} terms -> {SEARCH_INDEX_PATH}")
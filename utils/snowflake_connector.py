@@ -1,10 +1,14 @@
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
 import streamlit as st
-import snowflake.connector
 
-def init_snowflake_connection(account, user, password, warehouse, database, schema):
+def init_snowflake_connection(account, user, password, warehouse, database, schema, probe=True):
     """
     Initialize a connection to Snowflake
-    
+
     Parameters:
         account (str): Snowflake account identifier
         user (str): Snowflake username
@@ -12,11 +16,15 @@ def init_snowflake_connection(account, user, password, warehouse, database, sche
         warehouse (str): Snowflake warehouse name
         database (str): Snowflake database name
         schema (str): Snowflake schema name
-        
+        probe (bool): Run a SELECT current_version() round-trip to test the connection
+
     Returns:
         snowflake.connector.connection.SnowflakeConnection: Snowflake connection object
     """
     try:
+        # Imported here so pages that never touch Snowflake don't pay for the connector at startup
+        import snowflake.connector
+
         # Create a connection object
         conn = snowflake.connector.connect(
             account=account,
@@ -26,14 +34,279 @@ def init_snowflake_connection(account, user, password, warehouse, database, sche
             database=database,
             schema=schema
         )
-        
+
         # Test the connection
-        cursor = conn.cursor()
-        cursor.execute("SELECT current_version()")
-        version = cursor.fetchone()[0]
-        st.session_state.snowflake_version = version
-        cursor.close()
-        
+        if probe:
+            cursor = conn.cursor()
+            cursor.execute("SELECT current_version()")
+            version = cursor.fetchone()[0]
+            st.session_state.snowflake_version = version
+            cursor.close()
+
         return conn
     except Exception as e:
         raise Exception(f"Failed to connect to Snowflake: {str(e)}")
+
+def snowflake_config_from_env():
+    """
+    Read the Snowflake connection settings from environment variables.
+
+    Returns:
+        dict: Keyword arguments for init_snowflake_connection / get_connection_pool
+    """
+    return dict(
+        account=os.getenv('SNOWFLAKE_ACCOUNT'),
+        user=os.getenv('SNOWFLAKE_USER'),
+        password=os.getenv('SNOWFLAKE_PASSWORD'),
+        warehouse=os.getenv('SNOWFLAKE_WAREHOUSE', 'vividha_wh'),
+        database=os.getenv('SNOWFLAKE_DATABASE', 'vividha_db'),
+        schema=os.getenv('SNOWFLAKE_SCHEMA', 'vividha_schema'),
+    )
+
+class SnowflakeConnectionPool:
+    """
+    Bounded, thread-safe pool of long-lived Snowflake connections.
+
+    Connections are opened on demand up to max_size and handed back with release().
+    A connection that has sat idle for longer than idle_timeout seconds is closed,
+    and one idle for longer than health_check_after seconds is pinged with SELECT 1
+    before being reused. Only newly opened connections run the version probe.
+    """
+
+    def __init__(self, connect_kwargs, max_size=4, idle_timeout=600, health_check_after=60, acquire_timeout=30):
+        self._connect_kwargs = connect_kwargs
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self.acquire_timeout = acquire_timeout
+        self._cond = threading.Condition()
+        self._idle = []  # (connection, last released at), most recently used last
+        self._size = 0   # idle + checked-out connections
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def idle_count(self):
+        return len(self._idle)
+
+    def _retire_idle(self, now):
+        # Caller holds the lock. Oldest connections sit at the front of the list.
+        retired = []
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            retired.append(self._idle.pop(0)[0])
+            self._size -= 1
+        return retired
+
+    def _is_healthy(self, conn, idle_for):
+        try:
+            if conn.is_closed():
+                return False
+            if idle_for > self.health_check_after:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def acquire(self):
+        """
+        Check a connection out of the pool, opening a new one if none is idle.
+
+        Raises:
+            TimeoutError: If max_size connections stay checked out for acquire_timeout seconds
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            conn = None
+            idle_for = 0.0
+            retired = []
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    retired.extend(self._retire_idle(now))
+                    if self._idle:
+                        conn, released_at = self._idle.pop()
+                        idle_for = now - released_at
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise TimeoutError("Timed out waiting for a pooled Snowflake connection")
+                    self._cond.wait(remaining)
+            for old in retired:
+                self._close_quietly(old)
+
+            if conn is None:
+                # New slot reserved above; open (and probe) the connection outside the lock
+                try:
+                    return init_snowflake_connection(**self._connect_kwargs)
+                except Exception:
+                    self._discard_slot()
+                    raise
+            if self._is_healthy(conn, idle_for):
+                return conn
+            # Stale connection: drop it and try again with the next idle one or a fresh one
+            self._close_quietly(conn)
+            self._discard_slot()
+
+    def release(self, conn):
+        """Return a connection to the pool; closed connections are dropped."""
+        try:
+            closed = conn.is_closed()
+        except Exception:
+            closed = True
+        if closed:
+            self._discard_slot()
+            return
+        with self._cond:
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that borrows a connection and always hands it back."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Close every idle connection; checked-out connections are left to their borrowers."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def _discard_slot(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+@st.cache_resource(show_spinner=False)
+def get_connection_pool(account, user, password, warehouse, database, schema):
+    """
+    Return the process-wide connection pool for these settings, shared by all sessions.
+    """
+    return SnowflakeConnectionPool(dict(
+        account=account,
+        user=user,
+        password=password,
+        warehouse=warehouse,
+        database=database,
+        schema=schema,
+    ))
+
+@contextmanager
+def pooled_connection(account, user, password, warehouse, database, schema):
+    """
+    Borrow a Snowflake connection from the shared pool for the duration of a with-block.
+    """
+    pool = get_connection_pool(account, user, password, warehouse, database, schema)
+    with pool.connection() as conn:
+        yield conn
+
+# Table/column names are interpolated into SQL, so only plain (optionally qualified) identifiers are allowed
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*(\.[A-Za-z_][A-Za-z0-9_$]*){0,2}$')
+
+def check_identifier(name):
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+def build_select(table, columns=None, filters=None, order_by=None):
+    """
+    Build a parameterized SELECT with column projection and filter pushdown.
+
+    Parameters:
+        table (str): Table name, optionally qualified as schema.table or db.schema.table
+        columns (list[str]): Columns to fetch (default: all)
+        filters (dict): column -> value. A (low, high) tuple becomes BETWEEN, a list or set
+            becomes IN, None or an empty list is skipped, anything else is an equality test
+        order_by (list[str]): Columns to sort by
+
+    Returns:
+        tuple[str, dict]: SQL text using pyformat placeholders, and its parameters
+    """
+    projection = ', '.join(check_identifier(c) for c in columns) if columns else '*'
+    sql = f"SELECT {projection} FROM {check_identifier(table)}"
+    clauses, params = [], {}
+    for i, (column, value) in enumerate((filters or {}).items()):
+        check_identifier(column)
+        if value is None:
+            continue
+        if isinstance(value, tuple):
+            low, high = value
+            params[f'p{i}_lo'], params[f'p{i}_hi'] = low, high
+            clauses.append(f"{column} BETWEEN %(p{i}_lo)s AND %(p{i}_hi)s")
+        elif isinstance(value, (list, set, frozenset)):
+            if not value:
+                continue
+            names = []
+            for j, item in enumerate(sorted(value, key=str)):
+                params[f'p{i}_{j}'] = item
+                names.append(f'%(p{i}_{j})s')
+            clauses.append(f"{column} IN ({', '.join(names)})")
+        else:
+            params[f'p{i}'] = value
+            clauses.append(f"{column} = %(p{i})s")
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    if order_by:
+        sql += " ORDER BY " + ", ".join(check_identifier(c) for c in order_by)
+    return sql, params
+
+def iter_query_batches(conn, query, params=None, arrow=False):
+    """
+    Execute a query and yield its result as it arrives, one result batch at a time.
+
+    Uses the connector's Arrow result batches, so only one batch is materialized at once.
+
+    Parameters:
+        conn: An open Snowflake connection
+        query (str): SQL text
+        params (dict): Query parameters
+        arrow (bool): Yield pyarrow Tables instead of pandas DataFrames
+
+    Yields:
+        pandas.DataFrame | pyarrow.Table: The next batch of rows
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(query, params)
+        batches = cursor.fetch_arrow_batches() if arrow else cursor.fetch_pandas_batches()
+        for batch in batches:
+            yield batch
+    finally:
+        cursor.close()
+
+def stream_table(table, columns=None, filters=None, order_by=None, arrow=False):
+    """
+    Stream a table from Snowflake in batches using a pooled connection.
+
+    Only the requested columns and the rows matching `filters` leave Snowflake (see
+    build_select). The connection goes back to the pool once the generator is
+    exhausted or closed.
+
+    Yields:
+        pandas.DataFrame | pyarrow.Table: The next batch of rows
+    """
+    query, params = build_select(table, columns, filters, order_by)
+    with pooled_connection(**snowflake_config_from_env()) as conn:
+        yield from iter_query_batches(conn, query, params, arrow=arrow)
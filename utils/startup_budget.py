@@ -0,0 +1,134 @@
+"""
+Startup-time budget for the Vividha app.
+
+Measures the cold import time of the app shell and of each page module, and the time
+to first paint (first complete script run) of a page. Every measurement runs in a
+fresh interpreter so nothing is already imported. Run from the repository root:
+
+    python -m utils.startup_budget                  # table; exit code 1 if over budget
+    python -m utils.startup_budget --json           # machine-readable, for tracking
+    python -m utils.startup_budget --page "Discover Art"
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Budgets in seconds. Page modules may pull in Plotly/NumPy; the app shell must not.
+BUDGETS = {
+    'import:app_shell': 1.5,
+    'first_paint:Home': 5.0,
+}
+DEFAULT_PAGE_IMPORT_BUDGET = 3.0
+DEFAULT_FIRST_PAINT_BUDGET = 8.0
+
+# Modules no page may import at startup; they stay deferred until actually used.
+DEFERRED_MODULES = ['snowflake.connector']
+
+_IMPORT_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+_FIRST_PAINT_SNIPPET = """
+import json, logging, time
+t0 = time.perf_counter()
+logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+if {page!r} != 'Home':
+    at.sidebar.radio[0].set_value({page!r}).run()
+print(json.dumps({{'seconds': time.perf_counter() - t0, 'exceptions': [e.value for e in at.exception]}}))
+"""
+
+def _run_snippet(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    # Streamlit may log to stdout in bare mode; the measurement is the last line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def page_modules():
+    """Read the PAGES mapping from app.py without executing the Streamlit script."""
+    with open(os.path.join(REPO_ROOT, 'app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'PAGES' for t in node.targets):
+            return ast.literal_eval(node.value)
+    return {}
+
+def app_shell_imports():
+    """Return app.py's top-level import statements (what the shell loads before routing)."""
+    with open(os.path.join(REPO_ROOT, 'app.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return '\n'.join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def measure_import(imports):
+    """Cold-import the given statements in a fresh interpreter."""
+    return _run_snippet(_IMPORT_SNIPPET.format(imports=imports, deferred=DEFERRED_MODULES))
+
+def measure_first_paint(page='Home'):
+    """Run app.py once, selecting `page` unless it is Home, in a fresh interpreter."""
+    return _run_snippet(_FIRST_PAINT_SNIPPET.format(app=os.path.join(REPO_ROOT, 'app.py'), page=page))
+
+def run_budget(pages=('Home',)):
+    """
+    Take every startup measurement and compare it with its budget.
+
+    Returns:
+        list[dict]: One row per measurement with name, seconds, budget, ok and notes
+    """
+    rows = []
+
+    def record(name, measurement, default_budget, notes=''):
+        budget = BUDGETS.get(name, default_budget)
+        loaded = measurement.get('loaded', [])
+        exceptions = measurement.get('exceptions', [])
+        if loaded:
+            notes = f"eagerly imported {', '.join(loaded)}"
+        elif exceptions:
+            notes = f"raised {exceptions[0]}"
+        rows.append({
+            'name': name,
+            'seconds': round(measurement['seconds'], 3),
+            'budget': budget,
+            'ok': measurement['seconds'] <= budget and not loaded and not exceptions,
+            'notes': notes,
+        })
+
+    # What app.py imports before routing to a page
+    record('import:app_shell', measure_import(app_shell_imports()), BUDGETS['import:app_shell'])
+    for module in page_modules().values():
+        if module is not None:
+            record(f'import:{module}', measure_import(f'import {module}'), DEFAULT_PAGE_IMPORT_BUDGET)
+    for page in pages:
+        record(f'first_paint:{page}', measure_first_paint(page), DEFAULT_FIRST_PAINT_BUDGET)
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Vividha startup time against its budget.")
+    parser.add_argument('--page', action='append', dest='pages',
+                        help="Page to measure time to first paint for (repeatable, default: Home)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    rows = run_budget(tuple(args.pages or ['Home']))
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        for row in rows:
+            status = 'ok  ' if row['ok'] else 'OVER'
+            print(f"{status} {row['name']:<40} {row['seconds']:>7.3f}s / {row['budget']:.1f}s  {row['notes']}")
+    return 0 if all(row['ok'] for row in rows) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""
+Synthetic, schema-faithful versions of the datasets in data/ at any size.
+
+Every registered dataset gets the same columns and value types as its shipped CSV, with
+realistic cardinalities: regions are the 36 Indian states and union territories (skewed
+towards the larger ones), statuses and categories come from small fixed vocabularies
+with plausible frequencies, and names are unique per row where the shipped data has a
+key (art forms, experiences, heritage sites). art_forms.csv and cultural_data.csv
+describe the same art forms, so they still join. Rows are generated and written in
+chunks, so memory use does not grow with the row count. Output is deterministic for a
+given seed and chunk size. Run from the repository root:
+
+    python -m utils.synthetic_data --rows 1000000 --out /tmp/vividha-1m
+    python -m utils.synthetic_data --rows 10000000 --out /tmp/vividha-10m --datasets art_forms cultural_data
+
+Point the app (or the benchmarks) at the result with VIVIDHA_DATA_DIR=/tmp/vividha-1m.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 100_000
+DEFAULT_SEED = 7
+
+# States and union territories, roughly by tourism weight; sampled with a Zipf-like skew
+STATES = [
+    'Uttar Pradesh', 'Tamil Nadu', 'Maharashtra', 'Rajasthan', 'Karnataka', 'Andhra Pradesh',
+    'West Bengal', 'Gujarat', 'Kerala', 'Madhya Pradesh', 'Bihar', 'Odisha', 'Telangana',
+    'Punjab', 'Delhi', 'Himachal Pradesh', 'Uttarakhand', 'Assam', 'Jammu and Kashmir', 'Goa',
+    'Chhattisgarh', 'Jharkhand', 'Haryana', 'Manipur', 'Nagaland', 'Meghalaya', 'Sikkim',
+    'Tripura', 'Arunachal Pradesh', 'Mizoram', 'Ladakh', 'Puducherry', 'Chandigarh',
+    'Andaman and Nicobar Islands', 'Lakshadweep', 'Dadra and Nagar Haveli and Daman and Diu',
+]
+STATE_WEIGHTS = 1.0 / np.arange(1, len(STATES) + 1) ** 0.8
+STATE_WEIGHTS /= STATE_WEIGHTS.sum()
+ZONES = ['north', 'south', 'east', 'west', 'central']
+
+PRESERVATION_STATUSES = (['Well Preserved', 'Needs Attention', 'Endangered'], [0.4, 0.35, 0.25])
+# Mean tourism visibility per preservation status: endangered forms are the least visited
+VISIBILITY_MEANS = [65, 48, 32]
+SITE_STATUSES = (['Stable', 'Under Observation', 'At Risk'], [0.45, 0.35, 0.2])
+# P(threat level Low, Medium, High) per site status
+THREAT_LEVELS = ['Low', 'Medium', 'High']
+THREAT_GIVEN_STATUS = np.array([[0.75, 0.2, 0.05], [0.25, 0.55, 0.2], [0.05, 0.3, 0.65]])
+SEASONS = (['All', 'Winter', 'Autumn', 'Spring', 'Monsoon', 'Summer'], [0.4, 0.25, 0.13, 0.1, 0.07, 0.05])
+POPULARITY = (['Low', 'Medium', 'High'], [0.6, 0.3, 0.1])
+SOURCES = (['data.gov.in', 'Ministry of Tourism', 'State Tourism Board'], [0.7, 0.2, 0.1])
+YEARS = np.arange(2000, 2025)
+
+# Vocabulary for names and text
+SYLLABLES = ['ka', 'ma', 'ra', 'sa', 'ta', 'na', 'pa', 'la', 'va', 'da', 'ga', 'ja',
+             'ba', 'ha', 'ya', 'ki', 'ri', 'mi', 'ni', 'dhu', 'sha', 'bha', 'cha', 'tha']
+PLACE_SUFFIXES = ['pur', 'abad', 'garh', 'nagar', 'kot', 'wadi', 'palli', 'ganj', 'ur', 'pet']
+CRAFTS = ['Painting', 'Embroidery', 'Pottery', 'Weaving', 'Dance', 'Puppetry', 'Mask Making',
+          'Toys', 'Metalwork', 'Woodcarving', 'Scroll Art', 'Block Printing', 'Terracotta',
+          'Stone Carving', 'Lacquerware', 'Bell Metal Craft', 'Bamboo Craft', 'Folk Theatre',
+          'Music', 'Textiles', 'Jewellery', 'Carpet Weaving', 'Leather Puppetry', 'Shell Craft',
+          'Glass Art', 'Cane Craft', 'Murals', 'Tie-Dye', 'Applique', 'Filigree']
+MOTIFS = ['deities and epics', 'flora and fauna', 'geometric patterns', 'village life',
+          'festivals and rituals', 'folk legends', 'temple architecture', 'tribal myths']
+MATERIALS = ['natural dyes', 'handspun cotton', 'local clay', 'brass and bell metal',
+             'bamboo and cane', 'silk', 'wood and lacquer', 'mineral pigments']
+EVENTS = ['Festival', 'Workshop', 'Fair', 'Trail', 'Heritage Stay', 'Art Tour', 'Mahotsav', 'Utsav']
+SITES = ['Fort', 'Temple', 'Stepwell', 'Palace', 'Caves', 'Haveli', 'Monastery', 'Ghats',
+         'Mansions', 'Craft Village', 'Workshops', 'Tomb']
+SITE_NOTES = {
+    'Stable': ['Preservation efforts ongoing.', 'Regular maintenance by the state archaeology department.',
+               'Community-run conservation programme in place.'],
+    'Under Observation': ['Erosion risk, needs regular monitoring.', 'Visitor numbers rising faster than facilities.',
+                          'Restoration work paused for funding review.'],
+    'At Risk': ['Declining artisan numbers, needs support.', 'Structural damage after heavy monsoon.',
+                'Encroachment and unregulated construction nearby.'],
+}
+SITE_REASONS = {
+    'Underdeveloped': ['Remote location, limited access', 'Low awareness, niche interest',
+                       'Limited promotion, rural area', 'Seasonal access only'],
+    'Developed': ['Popular festival destination', 'Well connected by rail and air',
+                  'Established heritage circuit'],
+}
+IMPACTS = {
+    'positive': ['Economic Support for Artisans', 'Preservation Funding', 'Cultural Pride',
+                 'Documentation & Research', 'Revival of Traditions', 'Skill Transmission'],
+    'negative': ['Commercialization', 'Loss of Authenticity', 'Physical Degradation',
+                 'Cultural Appropriation', 'Overtourism', 'Displacement of Residents'],
+}
+PRACTICES = ['Use Local Guides', 'Visit Off-Peak', 'Support Local Artisans', 'Respect Photography Rules',
+             'Learn Cultural Context', 'Choose Eco-Friendly Transport', 'Reduce Plastic Waste',
+             'Stay in Homestays', 'Follow Dress Codes', 'Buy Certified Crafts']
+INDICATORS = ['Community Involvement', 'Cultural Preservation', 'Authentic Experiences',
+              'Environmental Impact', 'Economic Distribution']
+BENEFITS = ['Direct Artisan Income', 'Community Infrastructure', 'Cultural Preservation Funding',
+            'Education & Training', 'Local Businesses', 'Healthcare']
+
+def _choice(rng, vocabulary, n):
+    values, p = vocabulary
+    return np.asarray(values, dtype=object)[rng.choice(len(values), size=n, p=p)]
+
+def _states(rng, n):
+    return np.asarray(STATES, dtype=object)[rng.choice(len(STATES), size=n, p=STATE_WEIGHTS)]
+
+def _words(numbers, width, suffixes=None):
+    """Pronounceable capitalized words, one per number; distinct numbers give distinct words."""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    syllables = np.asarray(SYLLABLES, dtype=object)
+    words = np.full(len(numbers), '', dtype=object)
+    for _ in range(width):
+        words = syllables[numbers % len(SYLLABLES)] + words
+        numbers = numbers // len(SYLLABLES)
+    if suffixes is not None:
+        words = words + np.asarray(suffixes, dtype=object)
+    return pd.Series(words).str.capitalize().to_numpy(dtype=object)
+
+def _width(count, minimum=2):
+    """Syllables per word needed for `count` distinct words."""
+    width = minimum
+    while len(SYLLABLES) ** width < count:
+        width += 1
+    return width
+
+def _unique_names(start, stop, total, nouns):
+    """'<word> <noun>' names for rows start..stop-1, unique across all `total` rows."""
+    index = np.arange(start, stop)
+    noun = np.asarray(nouns, dtype=object)[index % len(nouns)]
+    return _words(index // len(nouns), _width(math.ceil(total / len(nouns)))) + ' ' + noun
+
+def _scores(rng, n, mean, sd, low=0, high=100):
+    return np.clip(np.rint(rng.normal(mean, sd, n)), low, high).astype(int)
+
+def _art_form_rows(start, stop, total, seed):
+    # Shared by art_forms and cultural_data so both describe the same art forms
+    rng = np.random.default_rng([seed, 0, start])
+    names = _unique_names(start, stop, total, CRAFTS)
+    return names, _states(rng, stop - start)
+
+# Chunk generators: (start, stop, total rows, seed) -> DataFrame of rows start..stop-1
+
+def _art_forms(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 1, start])
+    n = stop - start
+    names, regions = _art_form_rows(start, stop, total, seed)
+    craft = np.asarray(CRAFTS, dtype=object)[np.arange(start, stop) % len(CRAFTS)]
+    motif = np.asarray(MOTIFS, dtype=object)[rng.integers(0, len(MOTIFS), n)]
+    material = np.asarray(MATERIALS, dtype=object)[rng.integers(0, len(MATERIALS), n)]
+    slug = pd.Series(names).str.lower().str.replace(' ', '-', regex=False).to_numpy(dtype=object)
+    return pd.DataFrame({
+        'art_form': names,
+        'image_url': 'https://images.example.org/art-forms/' + slug + '.jpg',
+        'region': regions,
+        'description': (names + ' is a traditional ' + pd.Series(craft).str.lower().to_numpy(dtype=object)
+                        + ' tradition from ' + regions + ', known for its depictions of ' + motif
+                        + ' made with ' + material + '.'),
+    })
+
+def _cultural_data(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 2, start])
+    n = stop - start
+    names, regions = _art_form_rows(start, stop, total, seed)
+    status = rng.choice(3, size=n, p=PRESERVATION_STATUSES[1])
+    visibility = np.clip(np.rint(rng.normal(np.asarray(VISIBILITY_MEANS)[status], 12)), 5, 98).astype(int)
+    return pd.DataFrame({
+        'id': np.arange(start + 1, stop + 1),
+        'art_form': names,
+        'region': regions,
+        'cultural_value': _scores(rng, n, 82, 7, 55, 99),
+        'tourism_visibility': visibility,
+        'preservation_status': np.asarray(PRESERVATION_STATUSES[0], dtype=object)[status],
+    })
+
+def _locations(total, seed):
+    # Towns hosting experiences: about total**0.6 of them, each in a fixed state
+    count = int(np.clip(total ** 0.6, 10, 50_000))
+    rng = np.random.default_rng([seed, 3])
+    names = _words(np.arange(count), _width(count), np.asarray(PLACE_SUFFIXES, dtype=object)[np.arange(count) % len(PLACE_SUFFIXES)])
+    return names, _states(rng, count)
+
+def _cultural_experiences(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 4, start])
+    n = stop - start
+    towns, town_states = _locations(total, seed)
+    # Popular towns host many experiences: skew the draw towards the first ones
+    town = np.minimum((len(towns) * rng.random(n) ** 2).astype(int), len(towns) - 1)
+    names = _unique_names(start, stop, total, EVENTS)
+    motif = np.asarray(MOTIFS, dtype=object)[rng.integers(0, len(MOTIFS), n)]
+    return pd.DataFrame({
+        'experience': names,
+        'location': towns[town],
+        'type': town_states[town],
+        'season': _choice(rng, SEASONS, n),
+        'description': 'A celebration of local heritage in ' + towns[town] + ' with ' + motif + ', music and crafts.',
+        'popularity': _choice(rng, POPULARITY, n),
+        'source': _choice(rng, SOURCES, n),
+    })
+
+def _heritage_sites(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 5, start])
+    n = stop - start
+    status = rng.choice(3, size=n, p=SITE_STATUSES[1])
+    threat = (rng.random(n)[:, None] > THREAT_GIVEN_STATUS.cumsum(axis=1)[status]).sum(axis=1)
+    status_names = np.asarray(SITE_STATUSES[0], dtype=object)[status]
+    note = rng.integers(0, 3, n)
+    notes = np.array([SITE_NOTES[s][i] for s, i in zip(status_names, note)], dtype=object)
+    return pd.DataFrame({
+        'site': _unique_names(start, stop, total, SITES),
+        'region': _states(rng, n),
+        'status': status_names,
+        'threat_level': np.asarray(THREAT_LEVELS, dtype=object)[np.minimum(threat, 2)],
+        'notes': notes,
+    })
+
+def _tourism_stats(start, stop, total, seed):
+    # One row per (year, site), year-major like the shipped file; zone totals repeat per year
+    n_sites = max(1, math.ceil(total / len(YEARS)))
+    index = np.arange(start, stop)
+    year_position = np.minimum(index // n_sites, len(YEARS) - 1)
+    site = index % n_sites
+    site_rng = np.random.default_rng([seed, 6])
+    year_rng = np.random.default_rng([seed, 7])
+    growth = np.cumprod(1 + year_rng.normal(0.06, 0.04, len(YEARS)))
+    zone_base = np.array([1_200_000, 900_000, 700_000, 800_000, 600_000]) / growth[YEARS.searchsorted(2021)]
+    # Site attributes are a function of the site number, so every chunk agrees on them
+    site_base = np.random.default_rng([seed, 8]).lognormal(10, 1.2, n_sites)[site]
+    visitors = np.rint(site_base * growth[year_position] * np.random.default_rng([seed, 9, start]).normal(1, 0.05, len(index))).astype(int)
+    developed = site_base >= 100_000
+    reason_rng = np.random.default_rng([seed, 10, start])
+    reasons = np.where(developed,
+                       np.asarray(SITE_REASONS['Developed'], dtype=object)[reason_rng.integers(0, 3, len(index))],
+                       np.asarray(SITE_REASONS['Underdeveloped'], dtype=object)[reason_rng.integers(0, 4, len(index))])
+    df = pd.DataFrame({'year': YEARS[year_position]})
+    for z, zone in enumerate(ZONES):
+        df[zone] = np.rint(zone_base[z] * growth[year_position]).astype(int)
+    df['site'] = _words(site, _width(n_sites, 3), np.asarray(PLACE_SUFFIXES, dtype=object)[site % len(PLACE_SUFFIXES)])
+    df['region'] = np.asarray(STATES, dtype=object)[site_rng.choice(len(STATES), size=n_sites, p=STATE_WEIGHTS)][site]
+    df['visitors'] = visitors
+    df['status'] = np.where(developed, 'Developed', 'Underdeveloped')
+    df['reason'] = reasons
+    return df
+
+def _qualified(rng, names, n):
+    # Metric categories qualified by state, e.g. 'Cultural Pride (Kerala)', so categories repeat realistically
+    return np.asarray(names, dtype=object)[rng.integers(0, len(names), n)] + ' (' + _states(rng, n) + ')'
+
+def _tourism_impact_metrics(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 11, start])
+    n = stop - start
+    impact_type = np.where(rng.random(n) < 0.5, 'positive', 'negative')
+    category = np.where(impact_type == 'positive', _qualified(rng, IMPACTS['positive'], n), _qualified(rng, IMPACTS['negative'], n))
+    return pd.DataFrame({'impact_type': impact_type, 'category': category, 'score': _scores(rng, n, 70, 10, 30, 95)})
+
+def _tourism_practices_metrics(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 12, start])
+    n = stop - start
+    return pd.DataFrame({'practice': _qualified(rng, PRACTICES, n), 'score': _scores(rng, n, 75, 10, 40, 98)})
+
+def _tourism_sustainability_indicators(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 13, start])
+    n = stop - start
+    # Districts within states; the heatmap is indexed by region, so names are unique
+    region = _states(rng, n) + ' - ' + _words(np.arange(start, stop), _width(total, 3))
+    df = pd.DataFrame({'region': region})
+    for indicator in INDICATORS:
+        df[indicator] = _scores(rng, n, 70, 10, 30, 98)
+    return df
+
+def _tourism_community_economics(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 14, start])
+    n = stop - start
+    year = YEARS[np.arange(start, stop) % len(YEARS)]
+    trend = 1 + 0.05 * (year - YEARS[0])
+    return pd.DataFrame({
+        'year': year,
+        'community_revenue': np.rint(25 * trend * rng.lognormal(0, 0.2, n)).astype(int),
+        'corporate_revenue': np.rint(60 * trend * rng.lognormal(0, 0.2, n)).astype(int),
+        'artisan_income': np.round(2.5 * trend * rng.lognormal(0, 0.15, n), 1),
+    })
+
+def _tourism_community_benefits(start, stop, total, seed):
+    rng = np.random.default_rng([seed, 15, start])
+    n = stop - start
+    return pd.DataFrame({'benefit': _qualified(rng, BENEFITS, n),
+                         'percent': np.clip(np.rint(rng.gamma(2.5, 6, n)), 1, 60).astype(int)})
+
+# Dataset name (see utils.dataloader.DATASETS) -> chunk generator
+GENERATORS = {
+    'cultural_data': _cultural_data,
+    'art_forms': _art_forms,
+    'cultural_experiences': _cultural_experiences,
+    'heritage_sites': _heritage_sites,
+    'tourism_stats': _tourism_stats,
+    'tourism_impact_metrics': _tourism_impact_metrics,
+    'tourism_practices_metrics': _tourism_practices_metrics,
+    'tourism_sustainability_indicators': _tourism_sustainability_indicators,
+    'tourism_community_economics': _tourism_community_economics,
+    'tourism_community_benefits': _tourism_community_benefits,
+}
+
+def generate_chunks(name, rows, seed=DEFAULT_SEED, chunk_rows=CHUNK_ROWS):
+    """Yield a synthetic dataset as DataFrames of at most chunk_rows rows."""
+    generator = GENERATORS[name]
+    for start in range(0, rows, chunk_rows):
+        yield generator(start, min(start + chunk_rows, rows), rows, seed)
+
+def write_dataset(name, rows, directory, seed=DEFAULT_SEED, chunk_rows=CHUNK_ROWS):
+    """
+    Stream a synthetic dataset to <directory>/<its file name> (written to a temp file, then renamed).
+
+    Returns:
+        str: Path of the CSV written
+    """
+    from utils.dataloader import DATASETS
+
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, DATASETS[name])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        for i, chunk in enumerate(generate_chunks(name, rows, seed, chunk_rows)):
+            chunk.to_csv(f, header=i == 0, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+def generate(directory, rows, names=None, seed=DEFAULT_SEED, chunk_rows=CHUNK_ROWS):
+    """
+    Write synthetic versions of the given datasets (default: all) into directory.
+
+    Parameters:
+        directory (str): Output directory, usable as VIVIDHA_DATA_DIR
+        rows (int | dict): Rows per dataset, or {dataset name: rows}
+        names (list[str]): Datasets to generate (default: every dataset in rows if it is a dict, else all)
+        seed (int): Random seed
+        chunk_rows (int): Rows generated and written at a time
+
+    Returns:
+        dict: dataset name -> path written
+    """
+    if isinstance(rows, dict):
+        names = names or list(rows)
+    names = names or list(GENERATORS)
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise KeyError(f"No synthetic generator for: {', '.join(unknown)}")
+    return {name: write_dataset(name, rows[name] if isinstance(rows, dict) else rows, directory, seed, chunk_rows)
+            for name in names}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic Vividha datasets at scale.")
+    parser.add_argument('--rows', type=int, required=True, help="Rows per dataset (e.g. 1000 to 10000000)")
+    parser.add_argument('--out', required=True, help="Output directory (use as VIVIDHA_DATA_DIR)")
+    parser.add_argument('--datasets', nargs='+', choices=sorted(GENERATORS), help="Datasets to generate (default: all)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="Rows held in memory at a time")
+    args = parser.parse_args(argv)
+    if args.rows < 1 or args.chunk_rows < 1:
+        parser.error("--rows and --chunk-rows must be positive")
+
+    for name in args.datasets or GENERATORS:
+        t0 = time.perf_counter()
+        path = write_dataset(name, args.rows, args.out, args.seed, args.chunk_rows)
+        print(f"{name:<36} {args.rows:>12,} rows {os.path.getsize(path) / 2**20:>9.1f} MiB "
+              f"{time.perf_counter() - t0:>7.1f}s -> {path}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
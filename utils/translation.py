@@ -0,0 +1,241 @@
+"""
+Translation layer for the multilingual UI.
+
+Translations are keyed by (hash of the English source text, language code). They are
+produced offline in batches by a pluggable backend, stored in one JSON file per language
+under data/.cache/translations/, and served from memory: rendering a page only does
+dictionary lookups and never calls a translation backend. Strings the cache lacks fall
+back to the committed catalogue data/i18n/<code>.json; text without a translation is
+shown in English.
+
+Build or refresh the cache (UI strings and dataset descriptions) with:
+
+    python -m utils.translation [--languages hi ta ...] [--backend catalog|googletrans]
+
+The default `catalog` backend reads the hand-maintained catalogues in data/i18n/<code>.json
+and needs no network; `googletrans` is optional.
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+import streamlit as st
+from utils.dataloader import CACHE_DIR, DATA_DIR, load_dataset
+
+TRANSLATION_CACHE_DIR = os.path.join(CACHE_DIR, 'translations')
+CATALOG_DIR = os.path.join(DATA_DIR, 'i18n')
+DEFAULT_BACKEND = os.getenv('VIVIDHA_TRANSLATION_BACKEND', 'catalog')
+BATCH_SIZE = 50
+# Seconds between checks of a language's files for changes (t() runs many times per rerun)
+RELOAD_CHECK_SECONDS = 2.0
+
+# Languages offered in Settings -> ISO 639-1 code
+LANGUAGES = {
+    'English': 'en', 'Hindi': 'hi', 'Bengali': 'bn', 'Tamil': 'ta', 'Telugu': 'te', 'Marathi': 'mr',
+    'Gujarati': 'gu', 'Kannada': 'kn', 'Malayalam': 'ml', 'Punjabi': 'pa', 'Odia': 'or',
+    'Assamese': 'as', 'Urdu': 'ur',
+}
+SOURCE_LANGUAGE = 'en'
+
+# UI strings passed through t(); translated by the batch job
+UI_STRINGS = [
+    "Settings & Accessibility", "Language Selection", "Current language",
+    "Accessibility Options", "Offline Mode", "Current Settings Summary",
+    "About the Art Form", "Cultural Significance", "Key Information", "Related Cultural Experiences",
+    "Cultural Preservation Hub", "Artifact Documentation", "Artifact Registry (All Submissions)",
+    "Community Contributions & Feedback", "Heritage Site Monitoring",
+]
+# Dataset text columns translated by the batch job
+TRANSLATABLE_COLUMNS = {
+    'art_forms': ['description'],
+    'cultural_experiences': ['description'],
+    'heritage_sites': ['notes'],
+}
+
+def source_key(text):
+    """Return the cache key of an English source string."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+def language_code(language):
+    """Return the code of a language name from Settings (codes are returned unchanged)."""
+    return LANGUAGES.get(language, language)
+
+# --- Backends: translate(texts, code) -> list of translations (None where unavailable) ---
+class CatalogBackend:
+    """Offline backend: exact-match lookups in data/i18n/<code>.json ({source: translation})."""
+
+    def __init__(self, directory=CATALOG_DIR):
+        self.directory = directory
+
+    def translate(self, texts, code):
+        path = os.path.join(self.directory, f"{code}.json")
+        catalog = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                catalog = json.load(f)
+        return [catalog.get(text) for text in texts]
+
+class GoogletransBackend:
+    """Online backend using googletrans (optional dependency)."""
+
+    def __init__(self):
+        from googletrans import Translator  # only needed when this backend is selected
+        self._translator = Translator()
+
+    def translate(self, texts, code):
+        results = self._translator.translate(list(texts), src=SOURCE_LANGUAGE, dest=code)
+        return [r.text for r in results]
+
+BACKENDS = {
+    'catalog': CatalogBackend,
+    'googletrans': GoogletransBackend,
+}
+
+def get_backend(name=DEFAULT_BACKEND):
+    """Instantiate a translation backend by name."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown translation backend: {name}")
+    return BACKENDS[name]()
+
+def _fingerprint(path):
+    # (mtime_ns, size) of a file, or None if it doesn't exist
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+class TranslationCache:
+    """
+    In-memory translation tables backed by one JSON file per language.
+
+    Strings missing from the cache file (all of them on a fresh checkout, before the batch
+    job has run) fall back to the committed catalogue data/i18n/<code>.json. A language's
+    table is reloaded when either file's fingerprint changes, so a batch run in another
+    process takes effect without restarting the server; the files are checked at most
+    every RELOAD_CHECK_SECONDS, and a batch run through this cache reloads it at once.
+
+    Parameters:
+        directory (str): Where the <code>.json cache files live
+        catalog_directory (str): Where the committed <code>.json catalogues live
+    """
+
+    def __init__(self, directory=TRANSLATION_CACHE_DIR, catalog_directory=CATALOG_DIR):
+        self.directory = directory
+        self.catalog_directory = catalog_directory
+        self._tables = {}  # code -> (file fingerprints, table)
+        self._checked = {}  # code -> time.monotonic() of the last fingerprint check
+        self._lock = threading.Lock()
+
+    def _path(self, code):
+        return os.path.join(self.directory, f"{code}.json")
+
+    def _catalog_path(self, code):
+        return os.path.join(self.catalog_directory, f"{code}.json")
+
+    def table(self, code):
+        """Return the {source key: translation} table of a language, (re)loading it when its files change."""
+        entry = self._tables.get(code)
+        now = time.monotonic()
+        if entry is not None and now - self._checked.get(code, 0.0) < RELOAD_CHECK_SECONDS:
+            return entry[1]
+        fingerprints = (_fingerprint(self._path(code)), _fingerprint(self._catalog_path(code)))
+        self._checked[code] = now
+        if entry is None or entry[0] != fingerprints:
+            with self._lock:
+                entry = self._tables.get(code)
+                if entry is None or entry[0] != fingerprints:
+                    # Cached translations win over the catalogue they may have been built from
+                    table = {source_key(text): translation
+                             for text, translation in _read_json(self._catalog_path(code)).items() if translation}
+                    table.update(_read_json(self._path(code)))
+                    entry = self._tables[code] = (fingerprints, table)
+        return entry[1]
+
+    def lookup(self, text, code):
+        """Return the translation of text (cache, then catalogue), or None."""
+        return self.table(code).get(source_key(text))
+
+    def translate_batch(self, texts, code, backend, batch_size=BATCH_SIZE):
+        """
+        Translate the texts not yet cached for a language and persist the results.
+
+        Returns:
+            int: Number of new translations stored
+        """
+        with self._lock:
+            cached = _read_json(self._path(code))
+        pending = list(dict.fromkeys(text for text in texts if text and source_key(text) not in cached))
+        added = {}
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            for text, translation in zip(batch, backend.translate(batch, code)):
+                if translation:
+                    added[source_key(text)] = translation
+        if added:
+            with self._lock:
+                self._write(code, dict(_read_json(self._path(code)), **added))
+                self._checked.pop(code, None)  # reload on the next lookup
+        return len(added)
+
+    def cached_count(self, code):
+        """Return how many translations of a language are in its cache file."""
+        return len(_read_json(self._path(code)))
+
+    def _write(self, code, table):
+        # Atomic replace so readers never see a partial file
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._path(code) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(table, f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, self._path(code))
+
+@st.cache_resource(show_spinner=False)
+def get_translation_cache():
+    """Return the translation cache shared by every session in this process."""
+    return TranslationCache()
+
+def current_language():
+    """Return the language code selected in Settings for this session."""
+    return language_code(st.session_state.get('language', 'English'))
+
+def t(text, language=None):
+    """Return text in the session's language (or `language`), falling back to English."""
+    code = language_code(language) if language else current_language()
+    if code == SOURCE_LANGUAGE or not text:
+        return text
+    return get_translation_cache().lookup(text, code) or text
+
+def source_texts():
+    """Return every string the batch job translates: UI strings and dataset text columns."""
+    texts = list(UI_STRINGS)
+    for name, columns in TRANSLATABLE_COLUMNS.items():
+        df = load_dataset(name)
+        for column in columns:
+            texts.extend(df[column].dropna().astype(str).unique())
+    return texts
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-translate UI strings and dataset descriptions into the translation cache.")
+    parser.add_argument('--languages', nargs='*', help="Language codes (default: every supported language)")
+    parser.add_argument('--backend', default=DEFAULT_BACKEND, choices=sorted(BACKENDS))
+    args = parser.parse_args(argv)
+
+    backend = get_backend(args.backend)
+    cache = TranslationCache()
+    texts = source_texts()
+    codes = args.languages or [code for code in LANGUAGES.values() if code != SOURCE_LANGUAGE]
+    for code in codes:
+        added = cache.translate_batch(texts, code, backend)
+        print(f"{code}: {added} new, {cache.cached_count(code)} cached")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""
+Background warm-up of the process-wide caches.
+
+When the server process starts, a daemon thread loads every registered dataset, builds
+the indexes the pages query (filter bitmaps, record lookups, coordinates, paging orders,
+related art forms, the search index), builds the figures Responsible Tourism and
+Cultural Impact show on their first run (Home has none) and, when Snowflake is
+configured, opens a pooled connection. Everything lands in the same st.cache_resource
+entries the pages use, so the first visitor after a deploy gets cache hits.
+
+Streamlit gives app code no server-start hook, so deployments launch the server through
+this module, which starts the warm-up in the server process before any session connects:
+
+    python -m utils.warmup run app.py [streamlit options]   # warm-up + Streamlit in one process
+    python -m utils.warmup check                            # readiness probe: exit 0 once warm
+    python -m utils.warmup                                  # warm up once in the foreground (exit 1 on failure)
+
+Readiness is reported by `readiness()`, exported with the instrumentation metrics
+(collector 'warmup') and served over HTTP on VIVIDHA_READINESS_PORT (default 8502 under
+`run`; set it to 0 to turn the endpoint off) for the orchestrator's readiness probe: GET
+/ready answers 503 until every required step has finished, then 200 (both with the
+per-step report as JSON); GET /metrics serves the Prometheus export. Streamlit's own
+/_stcore/health only says the server is up.
+
+A plain `streamlit run app.py` (development, Streamlit Cloud) does not warm up: the app
+script never imports this module, so pages load their data and figures on first use.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import streamlit as st
+from utils.instrumentation import export_prometheus, register_collector, timer
+
+WARMUP_ENV = 'VIVIDHA_WARMUP'
+READINESS_PORT_ENV = 'VIVIDHA_READINESS_PORT'
+DEFAULT_READINESS_PORT = 8502
+# Figures are warmed in the theme sessions start with (see utils.figure_cache.current_theme)
+WARMUP_THEME = 'default'
+
+PENDING, RUNNING, DONE, FAILED, SKIPPED = 'pending', 'running', 'done', 'failed', 'skipped'
+
+# --- Steps. Heavy modules are imported here, in the warm-up thread, not by the app shell ---
+def warm_datasets():
+    from utils.dataloader import DATASETS, load_dataset
+
+    for name in DATASETS:
+        load_dataset(name)
+
+def warm_indexes():
+    from utils.cultural_query import CATEGORICAL_FILTER_COLUMNS, filter_values
+    from utils.dataloader import dataset_record_index
+    from utils.geocoding import dataset_coordinates
+    from utils.paginated_table import dataset_source
+
+    for column in CATEGORICAL_FILTER_COLUMNS:
+        filter_values('cultural_data', column)
+    dataset_record_index('art_forms', 'art_form')
+    dataset_record_index('cultural_data', 'art_form')
+    dataset_coordinates('cultural_data')
+    dataset_source('heritage_sites')
+
+def warm_recommender():
+    from utils.recommender import get_recommender
+
+    get_recommender()
+
+def warm_search_index():
+    from utils.search import get_search_index
+
+    get_search_index()
+
+def warm_figures():
+    from modules import cultural_impact, dashboards
+
+    dashboards.default_figures(WARMUP_THEME)
+    cultural_impact.default_figures(WARMUP_THEME)
+
+def warm_snowflake():
+    """Open one pooled connection; skipped unless SNOWFLAKE_ACCOUNT is set."""
+    if not os.getenv('SNOWFLAKE_ACCOUNT'):
+        return SKIPPED
+    from utils.snowflake_connector import pooled_connection, snowflake_config_from_env
+
+    with pooled_connection(**snowflake_config_from_env()):
+        pass
+
+# (name, function, required): readiness waits for every required step to succeed; an
+# optional step that fails is reported but does not hold readiness back. A step may
+# return SKIPPED when it does not apply.
+STEPS = [
+    ('datasets', warm_datasets, True),
+    ('indexes', warm_indexes, True),
+    ('figures', warm_figures, True),
+    ('recommender', warm_recommender, True),
+    ('search_index', warm_search_index, True),
+    ('snowflake', warm_snowflake, False),
+]
+
+class WarmupState:
+    """
+    Progress of one warm-up run, safe to read from any thread.
+
+    Parameters:
+        steps (list): (name, function, required) tuples, run in order
+    """
+
+    def __init__(self, steps=STEPS):
+        self.steps = list(steps)
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._status = {name: {'status': PENDING, 'required': required, 'seconds': None, 'error': None}
+                        for name, _, required in self.steps}
+        self.started_at = None
+        self.finished_at = None
+
+    def run(self):
+        """Run every step in order (a failed step is recorded and the next one still runs)."""
+        self.started_at = time.time()
+        try:
+            for name, function, _ in self.steps:
+                self._update(name, status=RUNNING)
+                started = time.perf_counter()
+                try:
+                    with timer(f"warmup.{name}"):
+                        outcome = function()
+                    self._update(name, status=outcome or DONE)
+                except Exception as e:
+                    traceback.print_exc()
+                    self._update(name, status=FAILED, error=f"{type(e).__name__}: {e}")
+                finally:
+                    self._update(name, seconds=round(time.perf_counter() - started, 3))
+        finally:
+            self.finished_at = time.time()
+            self._finished.set()
+
+    def _update(self, name, **values):
+        with self._lock:
+            self._status[name].update(values)
+
+    @property
+    def finished(self):
+        return self._finished.is_set()
+
+    @property
+    def ready(self):
+        """True once every step has finished and every required one succeeded."""
+        with self._lock:
+            return self.finished and all(step['status'] in (DONE, SKIPPED)
+                                         for step in self._status.values() if step['required'])
+
+    def wait(self, timeout=None):
+        """Block until the run finishes (or timeout seconds pass); return whether it is ready."""
+        self._finished.wait(timeout)
+        return self.ready
+
+    def report(self):
+        """Return the readiness report: ready, finished, elapsed seconds and every step's status."""
+        end = self.finished_at or time.time()
+        with self._lock:
+            steps = {name: dict(step) for name, step in self._status.items()}
+        return {
+            'ready': self.ready,
+            'finished': self.finished,
+            'seconds': round(end - self.started_at, 3) if self.started_at else None,
+            'steps': steps,
+        }
+
+    def metrics(self):
+        """Counters for the instrumentation exports."""
+        with self._lock:
+            statuses = [step['status'] for step in self._status.values()]
+        return {
+            'ready': int(self.ready),
+            'steps_done': sum(status in (DONE, SKIPPED) for status in statuses),
+            'steps_failed': statuses.count(FAILED),
+            'steps_total': len(statuses),
+        }
+
+# --- Readiness endpoint ---
+class _ReadinessHandler(BaseHTTPRequestHandler):
+    state = None
+
+    def do_GET(self):
+        if self.path.split('?')[0] == '/ready':
+            report = self.state.report()
+            self._send(200 if report['ready'] else 503, json.dumps(report), 'application/json')
+        elif self.path.split('?')[0] == '/metrics':
+            self._send(200, export_prometheus(), 'text/plain; version=0.0.4')
+        else:
+            self._send(404, 'not found\n', 'text/plain')
+
+    def _send(self, code, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # probes hit this every few seconds
+
+def serve_readiness(state, port, host='0.0.0.0'):
+    """Serve /ready and /metrics for `state` from a daemon thread; return the server."""
+    handler = type('ReadinessHandler', (_ReadinessHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='vividha-readiness', daemon=True).start()
+    return server
+
+# --- Process-wide warm-up ---
+def warmup_enabled():
+    return os.getenv(WARMUP_ENV, '1') != '0'
+
+@st.cache_resource(show_spinner=False)
+def start_warmup():
+    """
+    Start the warm-up thread (and the readiness endpoint if VIVIDHA_READINESS_PORT is set
+    and not 0) once per process; later calls return the same state. With VIVIDHA_WARMUP=0 nothing is
+    warmed and the process reports ready straight away.
+
+    Returns:
+        WarmupState: Progress of the warm-up
+    """
+    state = WarmupState(STEPS if warmup_enabled() else [])
+    register_collector('warmup', state.metrics)
+    port = int(os.getenv(READINESS_PORT_ENV) or 0)
+    if port:
+        serve_readiness(state, port)
+    threading.Thread(target=state.run, name='vividha-warmup', daemon=True).start()
+    return state
+
+def readiness():
+    """Return the readiness report of this process's warm-up (see WarmupState.report)."""
+    return start_warmup().report()
+
+def check_ready(port=None, timeout=5):
+    """Return whether the readiness endpoint on localhost answers 200 (False while warming or unreachable)."""
+    port = port or int(os.getenv(READINESS_PORT_ENV) or DEFAULT_READINESS_PORT)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False  # HTTPError (503) is an OSError too
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm the Vividha caches, or start Streamlit with a background warm-up.")
+    parser.add_argument('command', nargs='?', choices=['run', 'check'],
+                        help="'run': start Streamlit with the warm-up and readiness endpoint (remaining "
+                             "arguments are passed to `streamlit run`); 'check': exit 0 once the server is warm")
+    parser.add_argument('--json', action='store_true', help="Print the readiness report as JSON")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    if args.command == 'check':
+        return 0 if check_ready() else 1
+    if args.command == 'run':
+        os.environ.setdefault(READINESS_PORT_ENV, str(DEFAULT_READINESS_PORT))
+        start_warmup()
+        from streamlit.web import cli
+
+        sys.argv = ['streamlit', 'run', *streamlit_args]
+        return cli.main()
+
+    state = WarmupState()
+    state.run()
+    report = state.report()
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, step in report['steps'].items():
+            print(f"{step['status']:<8} {name:<14} {step['seconds']:>7.3f}s  {step['error'] or ''}")
+        print(f"{'ready' if report['ready'] else 'NOT READY'} after {report['seconds']:.3f}s")
+    return 0 if report['ready'] else 1
+
+if __name__ == '__main__':
+    # Run the functions from utils.warmup, not __main__, so readiness() finds the warm-up
+    # this launcher started in the shared resource cache
+    from utils import warmup
+
+    sys.exit(warmup.main())